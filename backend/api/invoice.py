@@ -516,8 +516,7 @@ def delete_payment(invoice_id, payment_id):
         db.session.commit()
 
         # Serialize the updated invoice
-        invoice_schema = InvoiceSchema()
-        return jsonify(invoice_schema.dump(invoice)), 200
+        return jsonify(schema.dump(invoice)), 200
 
     except Exception as e:
         db.session.rollback()
@@ -1,5 +1,6 @@
 from backend.services.driver_service import DriverService
 from backend.services.photo_backup_service import PhotoBackupService
+from backend.services.user_settings_service import get_photo_config
 from flask import Blueprint, request, jsonify, url_for, current_app, send_from_directory
 from flask_security.decorators import roles_accepted, auth_required
 from flask_security.utils import current_user
@@ -10,7 +11,6 @@ import logging, time
 import hashlib
 from backend.extensions import db
 from backend.models.job import Job, JobStatus
-from backend.models.settings import UserSettings
 from backend.models.job_photo import JobPhoto
 from backend.models.photo_config import PhotoConfig
 from backend.models.driver_remark import DriverRemark
@@ -420,15 +420,8 @@ def upload_job_photo():
         return jsonify({'error': 'Job not found'}), 404
 
 
-    # Fetch photo config from UserSettings.preferences['photo_config']
-    # Directly collect photo_config from first UserSettings row
-    user_settings = UserSettings.query.filter_by(user_id=current_user.id).first()
-    config = None
-    if user_settings and user_settings.preferences:
-        photo_configs = user_settings.preferences.get('photo_config', [])
-        if not isinstance(photo_configs, list):
-            photo_configs = [photo_configs] if photo_configs else []
-        config = next((c for c in photo_configs if c.get('stage') == stage), None)
+    # Photo config from UserSettings.preferences['photo_config'] (cached per user)
+    config = get_photo_config(current_user.id, stage)
     if not config:
         config = {'stage': stage, 'max_photos': 3, 'max_size_mb': 2.0, 'allowed_formats': 'jpg,png'}
 
@@ -466,9 +459,13 @@ def upload_job_photo():
     except Exception as e:
         return jsonify({'error': f'Image processing failed: {str(e)}'}), 500
 
-    # ---- Check duplicate using hash ----
-    file_hash = hashlib.md5(img_io.getbuffer()).hexdigest()
-    duplicate = JobPhoto.query.filter_by(job_id=job_id, driver_id=driver_id, stage=stage, file_hash=file_hash).first()
+    # ---- Hash for duplicate detection ----
+    # Cheap indexed check before any file I/O; uq_job_photo_upload on insert
+    # only guards against concurrent uploads of the same photo
+    file_hash = hashlib.md5(img_io.getbuffer()).digest()
+    duplicate = db.session.query(JobPhoto.id).filter_by(
+        job_id=job_id, driver_id=driver_id, stage=stage, file_hash=file_hash
+    ).first()
     if duplicate:
         return jsonify({'error': 'Duplicate photo detected'}), 400
 
@@ -487,7 +484,7 @@ def upload_job_photo():
         return jsonify({'error': 'File with same name already exists'}), 400
 
     temp_file_path = None
-    job_photo = None
+    photo_id = None
 
     try:
         # Step 1: Save to temporary folder
@@ -503,7 +500,9 @@ def upload_job_photo():
             raise Exception("PHOTO_STORAGE_ROOT configuration not set")
 
         backup_service = PhotoBackupService(photo_storage_root)
-        success, backup_path, error_msg = backup_service.backup_photo(file_path, filename)
+        success, backup_path, error_msg, backup_created = backup_service.backup_photo(
+            file_path, filename, source_hash=file_hash.hex()
+        )
 
         if not success:
             logging.error(f"Photo backup failed: {error_msg}")
@@ -515,7 +514,7 @@ def upload_job_photo():
         # This ensures database consistency: either photo record exists with valid file_path,
         # or no record exists at all (no partial/inconsistent state)
         try:
-            job_photo = JobPhoto(
+            photo_id = JobPhoto.insert_unless_duplicate(
                 job_id=job_id,
                 driver_id=driver_id,
                 stage=stage,
@@ -524,9 +523,17 @@ def upload_job_photo():
                 file_hash=file_hash,    # store hash in DB
                 filename=filename       # store filename for indexed lookups
             )
-            db.session.add(job_photo)
+            if photo_id is None:
+                # A concurrent upload of the same image won the race. Remove
+                # the backup copy if this request wrote it and no photo row
+                # (for this or any other job) points at it
+                db.session.rollback()
+                backup_service.cleanup_temporary_file(temp_file_path)
+                if backup_created and not db.session.query(JobPhoto.id).filter_by(file_path=backup_path).first():
+                    backup_service.remove_backup(backup_path)
+                return jsonify({'error': 'Duplicate photo detected'}), 400
             db.session.commit()
-            logging.info(f"Photo record created in database: photo_id={job_photo.id}")
+            logging.info(f"Photo record created in database: photo_id={photo_id}")
 
         except Exception as db_error:
             # Rollback database changes if commit failed
@@ -549,7 +556,7 @@ def upload_job_photo():
         file_url = url_for('uploaded_file', filename=filename, _external=True)
         return jsonify({
             'message': 'Photo uploaded successfully',
-            'photo_id': job_photo.id,
+            'photo_id': photo_id,
             'file_path': backup_path,  # Return the backup path
             'file_url': file_url
         }), 201
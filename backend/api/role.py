@@ -1,6 +1,6 @@
 from flask import Blueprint, request, jsonify
 from backend.services.role_service import RoleService, ServiceError
-from backend.schemas.role_schema import RoleSchema
+from backend.schemas.role_schema import RoleSchema, RoleDetailSchema
 import logging
 from flask_security import roles_required, roles_accepted
 from backend.extensions import db
@@ -8,6 +8,7 @@ from backend.extensions import db
 role_bp = Blueprint('role', __name__)
 schema = RoleSchema()
 schema_many = RoleSchema(many=True)
+detail_schema = RoleDetailSchema()
 
 @role_bp.route('/roles', methods=['GET'])
 @roles_accepted('admin', 'manager', 'accountant')
@@ -28,7 +29,7 @@ def get_role(role_id):
         role = RoleService.get_by_id(role_id)
         if not role:
             return jsonify({'error': 'Role not found'}), 404
-        return jsonify(schema.dump(role)), 200
+        return jsonify(detail_schema.dump(role)), 200
     except ServiceError as se:
         return jsonify({'error': se.message}), 400
     except Exception as e:
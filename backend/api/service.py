@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from backend.services.service_service import ServiceService, ServiceError
 from backend.schemas.service_schema import ServiceSchema
+from backend.schemas.services_vehicle_type_price_schema import ServicesVehicleTypePriceSchema
 import logging
 import json
 import re
@@ -12,6 +13,7 @@ from sqlalchemy.exc import IntegrityError
 service_bp = Blueprint('service', __name__)
 schema = ServiceSchema(session=db.session)
 schema_many = ServiceSchema(many=True, session=db.session)
+pricing_schema = ServicesVehicleTypePriceSchema(session=db.session)
 
 def handle_service_error(se):
     """Centralized ServiceError handling with appropriate HTTP status codes."""
@@ -214,9 +216,6 @@ def create_service_with_pricing():
         
         if pricing_data:
             from backend.services.services_vehicle_type_price_service import ServicesVehicleTypePriceService
-            from backend.schemas.services_vehicle_type_price_schema import ServicesVehicleTypePriceSchema
-            
-            pricing_schema = ServicesVehicleTypePriceSchema(session=db.session)
             
             for pricing_item in pricing_data:
                 pricing_item_data = {
@@ -305,9 +304,6 @@ def create_service_with_all_pricing():
         created_pricing = []
         
         from backend.services.services_vehicle_type_price_service import ServicesVehicleTypePriceService
-        from backend.schemas.services_vehicle_type_price_schema import ServicesVehicleTypePriceSchema
-        
-        pricing_schema = ServicesVehicleTypePriceSchema(session=db.session)
         
         for vehicle_type in vehicle_types:
             # Get price for this vehicle type, default to 0.0 if not provided
@@ -489,11 +485,8 @@ def update_service_with_all_pricing(service_id):
             pricing_data = data.get('pricing', {})
             
             from backend.services.services_vehicle_type_price_service import ServicesVehicleTypePriceService
-            from backend.schemas.services_vehicle_type_price_schema import ServicesVehicleTypePriceSchema
             from backend.services.vehicle_type_service import VehicleTypeService
             
-            pricing_schema = ServicesVehicleTypePriceSchema(session=db.session)
-            
             # Get existing pricing for this service
             existing_pricing = ServicesVehicleTypePriceService.get_by_service_id(service_id)
             existing_pricing_dict = {p.vehicle_type_id: p for p in existing_pricing}
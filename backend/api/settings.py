@@ -26,6 +26,7 @@ from backend.services.user_settings_service import (
 from backend.extensions import db
 
 settings_bp = Blueprint('settings', __name__)
+user_settings_schema = UserSettingsSchema()
 
 # Get the absolute path to the backend/static/uploads directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -121,8 +122,7 @@ def get_current_user_settings():
     settings = get_user_settings(current_user.id)
     if not settings:
         return jsonify({'settings': None}), 200
-    schema = UserSettingsSchema()
-    return jsonify({'settings': schema.dump(settings)}), 200
+    return jsonify({'settings': user_settings_schema.dump(settings)}), 200
 
 # --- USER SETTINGS: CREATE/UPDATE ---
 @settings_bp.route('/settings/user', methods=['POST', 'PUT'])
@@ -164,8 +164,7 @@ def set_current_user_settings():
         except Exception as e:
             db.session.rollback()
             raise e
-    schema = UserSettingsSchema()
-    return jsonify({'settings': schema.dump(settings)}), 200
+    return jsonify({'settings': user_settings_schema.dump(settings)}), 200
 
 # --- USER SETTINGS: DELETE ---
 @settings_bp.route('/settings/user', methods=['DELETE'])
@@ -5,6 +5,7 @@ from backend.services.driver_auth_service import DriverAuthService, DriverAuthEr
 from backend.schemas.user_schema import UserSchema
 from backend.schemas.customer_schema import CustomerSchema
 from backend.schemas.driver_schema import DriverSchema
+from backend.utils.json_stream import stream_json_array
 from backend.utils.validation import validate_password_strength, validate_admin_password_change_data
 import logging
 from flask_security.decorators import roles_required, auth_required, roles_accepted
@@ -14,7 +15,6 @@ from flask_limiter.util import get_remote_address
 
 user_bp = Blueprint('user', __name__)
 schema = UserSchema()
-schema_many = UserSchema(many=True)
 customer_schema = CustomerSchema(many=True)
 driver_schema = DriverSchema(many=True)
 
@@ -88,7 +88,7 @@ def update_my_profile():
 def list_users():
     try:
         users = UserService.get_all()
-        return jsonify(schema_many.dump(users)), 200
+        return stream_json_array(users, schema)
     except ServiceError as se:
         return jsonify({'error': se.message}), 400
     except Exception as e:
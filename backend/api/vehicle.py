@@ -5,17 +5,17 @@ import logging
 from flask_security.decorators import roles_required, roles_accepted, auth_required
 from flask_security import current_user
 from backend.extensions import db
+from backend.utils.json_stream import stream_json_array
 
 vehicle_bp = Blueprint('vehicle', __name__)
 schema = VehicleSchema(session=db.session)
-schema_many = VehicleSchema(many=True, session=db.session)
 
 @vehicle_bp.route('/vehicles', methods=['GET'])
 @roles_accepted('admin', 'manager', 'accountant')
 def list_vehicles():
     try:
         vehicles = VehicleService.get_all()
-        return jsonify(schema_many.dump(vehicles)), 200
+        return stream_json_array(vehicles, schema)
     except ServiceError as se:
         return jsonify({'error': se.message}), 400
     except Exception as e:
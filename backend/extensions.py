@@ -1,6 +1,9 @@
 import logging
+from flask import g, has_app_context, request
 from flask_sqlalchemy import SQLAlchemy
 from flask_mail import Mail
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -51,5 +54,36 @@ class MonitoredSQLAlchemy(SQLAlchemy):
             logger.error(f"Database health check failed: {e}")
             return False
 
+    def init_query_counter(self, app) -> None:
+        """
+        Count SQL statements per request and flag requests that exceed
+        QUERY_COUNT_WARN_THRESHOLD (default 10), which usually means an N+1
+        pattern crept in. In debug mode the count is also returned in the
+        X-Query-Count response header.
+        """
+        threshold = app.config.get('QUERY_COUNT_WARN_THRESHOLD', 10)
+
+        if not event.contains(Engine, "before_cursor_execute", _count_query):
+            event.listen(Engine, "before_cursor_execute", _count_query)
+
+        @app.after_request
+        def report_query_count(response):
+            count = g.get('query_count', 0)
+            if count > threshold:
+                logger.warning(
+                    "HIGH_QUERY_COUNT: %s %s (%s) issued %d queries",
+                    request.method, request.path, request.endpoint, count
+                )
+            if app.debug:
+                response.headers['X-Query-Count'] = str(count)
+            return response
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """Engine listener: increment the per-request query counter."""
+    if has_app_context():
+        g.query_count = g.get('query_count', 0) + 1
+
+
 db = MonitoredSQLAlchemy()
 mail = Mail()
\ No newline at end of file
@@ -9,14 +9,32 @@ Usage:
 
 import os
 import sys
+import codecs
 import csv
-from datetime import datetime
+import io
+import logging
+import queue
+import threading
+from itertools import islice
+from operator import itemgetter
+from datetime import datetime, timezone
 
 # Add the parent directory to the Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.insert(0, project_root)
 
+# pyarrow's multithreaded C reader is optional; without it the file is
+# streamed through the stdlib csv module
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_compute = pa_csv = None
+
+from sqlalchemy import text
+
 try:
     from backend.server import app, db
     from backend.models.postal_code import PostalCode
@@ -26,6 +44,226 @@ except ImportError as e:
     sys.exit(1)
 
 
+logger = logging.getLogger(__name__)
+
+# Rows per round-trip; 10k-row batches are where bulk inserts stop gaining
+BATCH_SIZE = 10000
+
+# Read buffer for the CSV; far fewer read() calls than the 8 KiB default
+READ_BUFFER_SIZE = 1 << 20
+
+# Singapore postal codes are 6 ASCII digits
+_POSTAL_CODE_LEN = 6
+
+# Column layout: postal,latitude,longitude,searchval,blk_no,road_name,building,address,postal
+_POSTAL_CODE_AND_ADDRESS = itemgetter(0, 7)
+
+# End-of-input marker passed from the reader thread
+_END = object()
+
+
+def detect_encoding(csv_file_path, chunk_size=READ_BUFFER_SIZE):
+    """
+    Pick the encoding to read the CSV with, in a single pass over the raw bytes.
+
+    A UTF-8 BOM selects utf-8-sig. Otherwise the file is checked as UTF-8
+    chunk by chunk; if any byte sequence is invalid, latin-1 is used, which
+    decodes every byte and matches what the old per-encoding retry loop
+    ended up choosing. Sampling only the head is not enough: the bundled
+    mapper is plain ASCII for its first 2.7 MB.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(csv_file_path, 'rb') as file:
+        head = file.read(len(codecs.BOM_UTF8))
+        if head == codecs.BOM_UTF8:
+            return 'utf-8-sig'
+        try:
+            decoder.decode(head)
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                decoder.decode(chunk)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return 'latin-1'
+    return 'utf-8'
+
+
+def read_postal_code_rows(csv_file_path, encoding, stats):
+    """
+    Yield the unique, valid (postal_code, address) pairs in file order.
+
+    CSV structure: postal,latitude,longitude,searchval,blk_no,road_name,building,address,postal.
+    Incomplete rows, empty addresses, postal codes that are not 6 ASCII
+    digits and repeated postal codes are skipped (first occurrence wins).
+    Once exhausted, stats['rows'] holds the number of CSV rows read.
+    """
+    if pa_csv is not None:
+        yield from _read_rows_arrow(csv_file_path, encoding, stats)
+    else:
+        yield from _valid_rows(_read_rows_csv(csv_file_path, encoding, stats))
+
+
+def _batches(rows):
+    """Group rows into lists of up to BATCH_SIZE."""
+    while batch := list(islice(rows, BATCH_SIZE)):
+        yield batch
+
+
+def _prefetch(iterable, depth=4):
+    """
+    Iterate `iterable` on a reader thread, staying up to `depth` items ahead.
+
+    Lets CSV parsing overlap with the database inserts running on the
+    calling thread, which keeps the app context and session. Errors raised
+    by the reader are re-raised here; if the consumer stops early, the
+    reader is drained and joined.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                items.put((item, None))
+            items.put((_END, None))
+        except Exception as e:
+            items.put((_END, e))
+
+    reader = threading.Thread(target=produce, name='postal-code-reader', daemon=True)
+    reader.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        stop.set()
+        while reader.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader.join()
+
+
+def _read_rows_arrow(csv_file_path, encoding, stats):
+    """Read, validate and dedup the two needed columns in pyarrow's C kernels."""
+    invalid_rows = 0
+
+    def skip_invalid_row(row):
+        nonlocal invalid_rows
+        invalid_rows += 1
+        return 'skip'
+
+    table = pa_csv.read_csv(
+        csv_file_path,
+        read_options=pa_csv.ReadOptions(
+            encoding=encoding, autogenerate_column_names=True, block_size=8 << 20),
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=skip_invalid_row),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=['f0', 'f7'],
+            column_types={'f0': pa.string(), 'f7': pa.string()}),
+    )
+    stats['rows'] = table.num_rows + invalid_rows
+
+    postal_codes = pa_compute.utf8_trim_whitespace(table.column('f0'))
+    addresses = pa_compute.utf8_trim_whitespace(table.column('f7'))
+    valid = pa_compute.and_(
+        pa_compute.match_substring_regex(postal_codes, r'^[0-9]{6}$'),
+        pa_compute.not_equal(addresses, ''),
+    )
+    # Lowest row index per postal code, back in file order
+    first_rows = pa.table({
+        'postal_code': postal_codes.filter(valid),
+        'row': pa_compute.indices_nonzero(valid),
+    }).group_by('postal_code').aggregate([('row', 'min')])['row_min']
+    first_rows = first_rows.take(pa_compute.sort_indices(first_rows))
+
+    return zip(postal_codes.take(first_rows).to_pylist(), addresses.take(first_rows).to_pylist())
+
+
+def _read_rows_csv(csv_file_path, encoding, stats):
+    """Stream the raw (postal_code, address) fields of complete rows via csv.reader."""
+    with open(csv_file_path, 'r', encoding=encoding, newline='', buffering=READ_BUFFER_SIZE) as file:
+        csv_reader = csv.reader(file)
+        pick = _POSTAL_CODE_AND_ADDRESS
+        for row in csv_reader:
+            if len(row) >= 9:
+                yield pick(row)
+        stats['rows'] = csv_reader.line_num
+
+
+def _valid_rows(pairs):
+    """Strip, validate and dedup raw (postal_code, address) pairs."""
+    seen_postal_codes = set()
+    add_seen = seen_postal_codes.add
+    for postal_code, address in pairs:
+        # Fields rarely carry surrounding whitespace; only strip when they do
+        if postal_code[:1].isspace() or postal_code[-1:].isspace():
+            postal_code = postal_code.strip()
+        if address[:1].isspace() or address[-1:].isspace():
+            address = address.strip()
+        if not (len(postal_code) == _POSTAL_CODE_LEN and postal_code.isascii()
+                and postal_code.isdigit()):
+            continue
+        if not address or postal_code in seen_postal_codes:
+            continue
+        add_seen(postal_code)
+        yield postal_code, address
+
+
+def _clear_postal_codes():
+    """
+    Empty the postal_codes table inside the import transaction.
+
+    A plain DELETE rather than TRUNCATE: on PostgreSQL, TRUNCATE would hold
+    an ACCESS EXCLUSIVE lock until the import commits, blocking every
+    postal-code lookup, and on MySQL it commits implicitly. With DELETE,
+    readers keep seeing the old rows until the new ones are committed.
+    """
+    db.session.execute(text(f"DELETE FROM {PostalCode.__tablename__}"))
+
+
+def _insert_postal_codes(batch):
+    """
+    Insert a batch of (postal_code, address) tuples without building ORM objects.
+
+    PostgreSQL gets a single COPY per batch; other databases get one Core
+    executemany. Both run on the session's connection, so they share its
+    transaction.
+    """
+    now = datetime.now(timezone.utc)
+    bind = db.session.get_bind()
+    if bind.dialect.name == 'postgresql':
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for postal_code, address in batch:
+            writer.writerow((postal_code, address, now.isoformat(), now.isoformat()))
+        buf.seek(0)
+        cursor = db.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {PostalCode.__tablename__} (postal_code, address, created_at, updated_at) "
+                "FROM STDIN WITH CSV",
+                buf,
+            )
+        finally:
+            cursor.close()
+    else:
+        db.session.execute(
+            PostalCode.__table__.insert(),
+            [
+                {'postal_code': postal_code, 'address': address,
+                 'created_at': now, 'updated_at': now}
+                for postal_code, address in batch
+            ],
+        )
+
+
 def import_postal_codes(csv_file_path=None, clear_existing=True):
     """
     Import postal codes from CSV file into database
@@ -49,132 +287,45 @@ def import_postal_codes(csv_file_path=None, clear_existing=True):
     print(f"Importing postal codes from: {csv_file_path}")
     
     with app.app_context():
-        # Clear existing postal codes if requested
+        # The clear and every batch share one transaction, committed at the
+        # end; any failure leaves the previous postal codes untouched, and
+        # lookups keep reading them while the import runs
         if clear_existing:
             try:
-                existing_count = PostalCode.query.count()
-                db.session.query(PostalCode).delete()
-                db.session.commit()
-                print(f"Cleared {existing_count} existing postal codes")
+                _clear_postal_codes()
+                print("Existing postal codes will be replaced")
             except Exception as e:
                 print(f"Warning: Could not clear existing postal codes: {e}")
                 db.session.rollback()
         
         postal_codes_added = 0
-        batch_size = 1000  # Process in batches for better performance
-        postal_codes_batch = []
-        skipped_rows = 0
         
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            encoding = detect_encoding(csv_file_path)
+            print(f"Reading file with {encoding} encoding...")
             
-            for encoding in encodings:
-                try:
-                    print(f"Attempting to read file with {encoding} encoding...")
-                    
-                    # Reset variables for each encoding attempt if previous failed
-                    postal_codes_added = 0
-                    postal_codes_batch = []
-                    skipped_rows = 0
-                    
-                    with open(csv_file_path, 'r', encoding=encoding) as file:
-                        csv_reader = csv.reader(file)
-                        
-                        print(f"Successfully opened file with {encoding} encoding")
-                        print("Processing CSV rows...")
-                        
-                        seen_postal_codes = set()  # Track duplicates within the file
-                        row_count = 0
-                        
-                        for row_num, row in enumerate(csv_reader, 1):
-                            row_count += 1
-                            try:
-                                # Skip rows that don't have enough columns
-                                if len(row) < 9:
-                                    skipped_rows += 1
-                                    continue
-                                
-                                # Extract postal code and address from CSV
-                                # CSV structure: postal,latitude,longitude,searchval,blk_no,road_name,building,address,postal
-                                postal_code = row[0].strip()  # First column
-                                address = row[7].strip()      # Address column (8th column, index 7)
-                                
-                                # Skip if postal code or address is empty
-                                if not postal_code or not address:
-                                    skipped_rows += 1
-                                    continue
-                                
-                                # Validate postal code (Singapore postal codes are 6 digits)
-                                if not postal_code.isdigit() or len(postal_code) != 6:
-                                    skipped_rows += 1
-                                    continue
-                                
-                                # Skip duplicates within the file (keep first occurrence)
-                                if postal_code in seen_postal_codes:
-                                    skipped_rows += 1
-                                    continue
-                                
-                                seen_postal_codes.add(postal_code)
-                                
-                                # Create PostalCode object
-                                postal_code_obj = PostalCode(
-                                    postal_code=postal_code,
-                                    address=address
-                                )
-                                
-                                postal_codes_batch.append(postal_code_obj)
-                                
-                                # Process batch when it reaches batch_size
-                                if len(postal_codes_batch) >= batch_size:
-                                    db.session.bulk_save_objects(postal_codes_batch)
-                                    db.session.commit()
-                                    postal_codes_added += len(postal_codes_batch)
-                                    print(f"Processed {postal_codes_added} unique postal codes... (Row {row_num})")
-                                    postal_codes_batch = []
-                                    
-                            except Exception as e:
-                                print(f"Error processing row {row_num}: {e}")
-                                skipped_rows += 1
-                                continue
-                        
-                        # Process remaining batch
-                        if postal_codes_batch:
-                            db.session.bulk_save_objects(postal_codes_batch)
-                            db.session.commit()
-                            postal_codes_added += len(postal_codes_batch)
-                        
-                        print(f"\n--- Import Summary ---")
-                        print(f"Total postal codes imported: {postal_codes_added}")
-                        print(f"Rows skipped: {skipped_rows}")
-                        print(f"Total rows processed: {row_count}")
-                        print(f"Unique postal codes found: {len(seen_postal_codes)}")
-                        
-                        # Verify final count
-                        final_count = PostalCode.query.count()
-                        print(f"Total postal codes in database: {final_count}")
-                        
-                        return postal_codes_added
-                        
-                except UnicodeDecodeError as e:
-                    print(f"Failed to read with {encoding} encoding: {e}")
-                    print("Trying next encoding...")
-                    # Clear any partially imported data if the encoding failed
-                    if postal_codes_added > 0:
-                        print(f"Rolling back {postal_codes_added} partially imported records...")
-                        db.session.rollback()
-                    continue
-                except Exception as e:
-                    print(f"Error with {encoding}: {e}")
-                    # Clear any partially imported data if there was an error
-                    if postal_codes_added > 0:
-                        print(f"Rolling back {postal_codes_added} partially imported records...")
-                        db.session.rollback()
-                    continue
+            stats = {'rows': 0}
+            rows = read_postal_code_rows(csv_file_path, encoding, stats)
             
-            # If we get here, no encoding worked
-            print("ERROR: Could not read the file with any encoding")
-            return 0
+            for postal_codes_batch in _prefetch(_batches(rows)):
+                _insert_postal_codes(postal_codes_batch)
+                postal_codes_added += len(postal_codes_batch)
+                logger.info("Processed %d unique postal codes", postal_codes_added)
+            
+            db.session.commit()
+            row_count = stats['rows']
+            
+            print(f"\n--- Import Summary ---")
+            print(f"Total postal codes imported: {postal_codes_added}")
+            print(f"Rows skipped: {row_count - postal_codes_added}")
+            print(f"Total rows processed: {row_count}")
+            print(f"Unique postal codes found: {postal_codes_added}")
+            
+            # Verify final count
+            final_count = PostalCode.query.count()
+            print(f"Total postal codes in database: {final_count}")
+            
+            return postal_codes_added
             
         except Exception as e:
             print(f"ERROR: Failed to import postal codes: {e}")
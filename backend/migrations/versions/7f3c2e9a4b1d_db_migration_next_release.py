@@ -0,0 +1,99 @@
+"""db migration for next release
+
+Revision ID: 7f3c2e9a4b1d
+Revises: 2ab53ed947ca
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3c2e9a4b1d'
+down_revision: Union[str, Sequence[str], None] = '2ab53ed947ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _convert_job_photo_hash(new_type, old_type, convert, postgresql_using) -> None:
+    """Change the job_photo.file_hash column type, converting existing values."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.alter_column('job_photo', 'file_hash', type_=new_type, existing_type=old_type,
+                        existing_nullable=False, postgresql_using=postgresql_using)
+        return
+
+    rows = bind.execute(sa.text("SELECT id, file_hash FROM job_photo")).fetchall()
+    if rows:
+        job_photo = sa.table('job_photo', sa.column('id', sa.Integer()), sa.column('file_hash', new_type))
+        bind.execute(
+            job_photo.update().where(job_photo.c.id == sa.bindparam('photo_id')).values(file_hash=sa.bindparam('hash')),
+            [{'photo_id': photo_id, 'hash': convert(file_hash)} for photo_id, file_hash in rows],
+        )
+    with op.batch_alter_table('job_photo') as batch_op:
+        batch_op.alter_column('file_hash', type_=new_type, existing_type=old_type, existing_nullable=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index on user.driver_id for the unassigned-drivers anti-join
+    op.create_index(
+        'idx_user_driver_id', 'user', ['driver_id'], unique=False,
+        postgresql_where=sa.text('driver_id IS NOT NULL'),
+        sqlite_where=sa.text('driver_id IS NOT NULL'),
+    )
+
+    # Partial indexes for active customer/driver existence checks
+    op.create_index(
+        'idx_customer_active', 'customer', ['id'], unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+        sqlite_where=sa.text('is_deleted = 0'),
+    )
+    op.create_index(
+        'idx_driver_active', 'driver', ['id'], unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+        sqlite_where=sa.text('is_deleted = 0'),
+    )
+
+    # Unique (user_id, role_id) so role links can be bulk inserted with
+    # ON CONFLICT DO NOTHING; drop any existing duplicate links first
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "DELETE FROM roles_users a USING roles_users b "
+            "WHERE a.ctid < b.ctid AND a.user_id = b.user_id AND a.role_id = b.role_id"
+        )
+    else:
+        op.execute(
+            "DELETE FROM roles_users WHERE rowid NOT IN "
+            "(SELECT MIN(rowid) FROM roles_users GROUP BY user_id, role_id)"
+        )
+    op.create_index('uq_roles_users_user_role', 'roles_users', ['user_id', 'role_id'], unique=True)
+
+    # Store job_photo.file_hash as the raw 16-byte MD5 digest rather than hex
+    _convert_job_photo_hash(sa.LargeBinary(length=16), sa.String(length=64), bytes.fromhex, "decode(file_hash, 'hex')")
+
+    # Unique (job_id, driver_id, stage, file_hash) so photo uploads can insert
+    # with ON CONFLICT DO NOTHING; keep the earliest of any existing duplicates
+    op.execute(
+        "DELETE FROM job_photo WHERE id NOT IN "
+        "(SELECT MIN(id) FROM job_photo GROUP BY job_id, driver_id, stage, file_hash)"
+    )
+    op.create_index(
+        'uq_job_photo_upload', 'job_photo', ['job_id', 'driver_id', 'stage', 'file_hash'], unique=True
+    )
+
+    # Composite index for per-stage photo lookups (upload limit check, audit photos)
+    op.create_index('ix_job_photo_job_stage', 'job_photo', ['job_id', 'stage', 'uploaded_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_photo_job_stage', table_name='job_photo')
+    op.drop_index('uq_job_photo_upload', table_name='job_photo')
+    _convert_job_photo_hash(sa.String(length=64), sa.LargeBinary(length=16), bytes.hex, "encode(file_hash, 'hex')")
+    op.drop_index('uq_roles_users_user_role', table_name='roles_users')
+    op.drop_index('idx_driver_active', table_name='driver')
+    op.drop_index('idx_customer_active', table_name='customer')
+    op.drop_index('idx_user_driver_id', table_name='user')
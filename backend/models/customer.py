@@ -1,5 +1,5 @@
 from backend.extensions import db
-from sqlalchemy import false
+from sqlalchemy import false, Index
 
 class Customer(db.Model):
     __tablename__ = 'customer'
@@ -20,6 +20,15 @@ class Customer(db.Model):
     sub_customers = db.relationship('SubCustomer', backref='customer', lazy=True, cascade='all, delete-orphan')
     invoices = db.relationship('Invoice', backref='customer_invoice', lazy=True, cascade='all, delete-orphan')
     
+    __table_args__ = (
+        # Partial index for active-customer existence checks
+        Index(
+            'idx_customer_active', 'id',
+            postgresql_where=db.text('is_deleted = false'),
+            sqlite_where=db.text('is_deleted = 0'),
+        ),
+    )
+
     @classmethod
     def query_active(cls):
         """Query active (non-deleted) records only"""
@@ -1,5 +1,5 @@
 from backend.extensions import db
-from sqlalchemy import false
+from sqlalchemy import false, Index
 from backend.models.driver_remark import DriverRemark
 
 class Driver(db.Model):
@@ -16,6 +16,15 @@ class Driver(db.Model):
 
     remarks = db.relationship("DriverRemark", back_populates="driver", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Partial index for active-driver existence checks
+        Index(
+            'idx_driver_active', 'id',
+            postgresql_where=db.text('is_deleted = false'),
+            sqlite_where=db.text('is_deleted = 0'),
+        ),
+    )
+
     @classmethod
     def query_active(cls):
         """Query active (non-deleted) records only"""
@@ -1,8 +1,18 @@
 from datetime import datetime
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from backend.extensions import db
 
 class JobPhoto(db.Model):
     __tablename__ = "job_photo"
+    __table_args__ = (
+        # One copy of an image per job, driver and stage; lets uploads
+        # insert with ON CONFLICT DO NOTHING instead of checking first
+        db.Index('uq_job_photo_upload', 'job_id', 'driver_id', 'stage', 'file_hash', unique=True),
+        # Photos for a job at a stage, optionally by upload time
+        db.Index('ix_job_photo_job_stage', 'job_id', 'stage', 'uploaded_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, db.ForeignKey("job.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -10,15 +20,34 @@ class JobPhoto(db.Model):
     stage = db.Column(db.String(50), nullable=False)                # pickup, dropoff, incident, verification, etc.
     file_path = db.Column(db.String(255), nullable=False)           # local path (later can switch to S3 URL)
     file_size = db.Column(db.Integer)   
-    file_hash = db.Column(db.String(64), nullable=False, index=True)  # in KB
+    file_hash = db.Column(db.LargeBinary(16), nullable=False, index=True)  # raw MD5 digest of the stored JPEG
     uploaded_at = db.Column(db.DateTime, default=datetime.utcnow)
     # Add filename column for indexed lookups
     filename = db.Column(db.String(255), nullable=True)  # New column for indexed filename lookups
 
 
     # Relationships
-    job = db.relationship("Job", backref=db.backref("photos", lazy="dynamic", cascade="all, delete-orphan"))
-    driver = db.relationship("Driver", backref=db.backref("photos", lazy="dynamic"))
+    # Plain lazy="select" collections so callers can selectinload(Job.photos)
+    job = db.relationship("Job", backref=db.backref("photos", cascade="all, delete-orphan"))
+    driver = db.relationship("Driver", backref=db.backref("photos"))
+
+    @classmethod
+    def insert_unless_duplicate(cls, **values):
+        """
+        Insert a photo row unless the same image is already stored for its
+        job, driver and stage.
+
+        Returns:
+            The new photo id, or None if the row was a duplicate
+        """
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            stmt = postgresql_insert(cls).on_conflict_do_nothing()
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(cls).on_conflict_do_nothing()
+        else:
+            stmt = insert(cls)
+        return db.session.execute(stmt.values(**values).returning(cls.id)).scalar_one_or_none()
 
     def __repr__(self):
         return f"<JobPhoto job={self.job_id} stage={self.stage}>"
\ No newline at end of file
@@ -4,7 +4,8 @@ from flask_security import RoleMixin
 roles_users = db.Table(
     'roles_users',
     db.Column('user_id', db.Integer(), db.ForeignKey('user.id')),
-    db.Column('role_id', db.Integer(), db.ForeignKey('role.id'))
+    db.Column('role_id', db.Integer(), db.ForeignKey('role.id')),
+    db.Index('uq_roles_users_user_role', 'user_id', 'role_id', unique=True)
 )
 
 class Role(db.Model, RoleMixin):
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from backend.extensions import db
 from flask_security import UserMixin
+from sqlalchemy import Index
 from .role import roles_users
 
 class User(db.Model, UserMixin):
@@ -30,6 +31,15 @@ class User(db.Model, UserMixin):
     driver = db.relationship('Driver', backref='user', uselist=False)
     customer = db.relationship('Customer', backref='user', uselist=False)
 
+    __table_args__ = (
+        # Partial index backing the driver anti-join in get_unassigned_drivers
+        Index(
+            'idx_user_driver_id', 'driver_id',
+            postgresql_where=db.text('driver_id IS NOT NULL'),
+            sqlite_where=db.text('driver_id IS NOT NULL'),
+        ),
+    )
+
     def is_account_locked(self):
         """Check if account is currently locked (read-only check)"""
         if self.locked_until:
@@ -4,6 +4,10 @@ class RoleSchema(Schema):
     id = fields.Int(dump_only=True)
     name = fields.Str(required=True)
     description = fields.Str()
+    # Member ids only; full user objects are left to RoleDetailSchema
+    users = fields.Pluck('UserSchema', 'id', many=True, dump_only=True)
+
+class RoleDetailSchema(RoleSchema):
     users = fields.List(fields.Nested(lambda: UserSchema(exclude=("roles",)), dump_only=True))
 
-from backend.schemas.user_schema import UserSchema  # Avoid circular import 
\ No newline at end of file
+from backend.schemas.user_schema import UserSchema  # Avoid circular import
@@ -42,7 +42,7 @@ import logging.handlers
 
 # Import enhanced logging components
 from backend.utils.system_monitor import start_system_monitoring, stop_system_monitoring
-from backend.utils.request_logger import RequestLogger
+from backend.utils import request_logger
 
 # Resource monitoring configuration
 RESOURCE_MONITORING_INTERVAL = 60  # Check every 60 seconds
@@ -181,8 +181,11 @@ except Exception as e:
     # Don't raise for mail - app can work without it
 
 # Configure request logging
-app.before_request(RequestLogger.before_request)
-app.after_request(RequestLogger.after_request)
+app.before_request(request_logger.before_request)
+app.after_request(request_logger.after_request)
+
+# Per-request SQL query counter (flags N+1 regressions)
+db.init_query_counter(app)
 
 # Initialize scheduler for background tasks - only in main process
 try:
@@ -550,9 +553,9 @@ def system_health():
         circuit_breaker_status = {}
         for service, state in circuit_breaker_states.items():
             circuit_breaker_status[service] = {
-                'status': 'OPEN' if state['open'] else ('HALF_OPEN' if state['half_open'] else 'CLOSED'),
-                'failures': state['failures'],
-                'last_failure': datetime.fromtimestamp(state['last_failure_time']).isoformat() if state['last_failure_time'] else None
+                'status': 'OPEN' if state.open else ('HALF_OPEN' if state.half_open else 'CLOSED'),
+                'failures': state.failures,
+                'last_failure': datetime.fromtimestamp(state.last_failure_time).isoformat() if state.last_failure_time else None
             }
         
         return {
@@ -612,10 +615,10 @@ def circuit_breaker_status():
         status_report = {}
         for service, state in circuit_breaker_states.items():
             status_report[service] = {
-                'status': 'OPEN' if state['open'] else ('HALF_OPEN' if state['half_open'] else 'CLOSED'),
-                'failures': state['failures'],
-                'last_failure_time': datetime.fromtimestamp(state['last_failure_time']).isoformat() if state['last_failure_time'] else None,
-                'can_attempt_request': not state['open'] or (time.time() - state['last_failure_time'] > CIRCUIT_BREAKER_TIMEOUT if state['last_failure_time'] else False)
+                'status': 'OPEN' if state.open else ('HALF_OPEN' if state.half_open else 'CLOSED'),
+                'failures': state.failures,
+                'last_failure_time': datetime.fromtimestamp(state.last_failure_time).isoformat() if state.last_failure_time else None,
+                'can_attempt_request': not state.open or (time.time() - state.last_failure_time > CIRCUIT_BREAKER_TIMEOUT if state.last_failure_time else False)
             }
         
         return {
@@ -642,12 +645,7 @@ def reset_circuit_breaker(service_name):
             return {'error': 'Admin access required'}, 403
             
         if service_name in circuit_breaker_states:
-            circuit_breaker_states[service_name].update({
-                'failures': 0,
-                'last_failure_time': None,
-                'open': False,
-                'half_open': False
-            })
+            circuit_breaker_states[service_name].reset()
             logger.info(f"✅ Circuit breaker for {service_name} manually reset by admin {current_user.email}")
             return {'message': f'Circuit breaker for {service_name} reset successfully'}
         else:
@@ -967,7 +965,7 @@ def cleanup_logging():
 resource_monitor_thread = None
 
 # Global circuit breaker states for different services
-circuit_breaker_states = {}  # Will store {service_name: {failures, last_failure_time, open, half_open}}
+circuit_breaker_states = {}  # Will store {service_name: CircuitBreakerState}
 
 # Critical services that should use circuit breaker protection
 critical_services = [
@@ -1075,22 +1073,18 @@ def circuit_breaker_call(service_name, func, *args, **kwargs):
     
     # Get or create service-specific circuit breaker state
     if service_name not in circuit_breaker_states:
-        circuit_breaker_states[service_name] = {
-            'failures': 0,
-            'last_failure_time': None,
-            'open': False,
-            'half_open': False
-        }
+        from backend.utils.circuit_breaker import CircuitBreakerState
+        circuit_breaker_states[service_name] = CircuitBreakerState()
     
     cb_state = circuit_breaker_states[service_name]
     
     # Check if circuit breaker is open
-    if cb_state['open']:
-        if time.time() - cb_state['last_failure_time'] > CIRCUIT_BREAKER_TIMEOUT:
+    if cb_state.open:
+        if time.time() - cb_state.last_failure_time > CIRCUIT_BREAKER_TIMEOUT:
             # Half-open state - try one request
             logger.info(f"Circuit breaker for {service_name} in half-open state, testing...")
-            cb_state['half_open'] = True
-            cb_state['open'] = False
+            cb_state.half_open = True
+            cb_state.open = False
         else:
             logger.warning(f"Circuit breaker for {service_name} is OPEN - service temporarily unavailable")
             raise Exception(f"Circuit breaker is OPEN for {service_name} - service temporarily unavailable")
@@ -1098,22 +1092,22 @@ def circuit_breaker_call(service_name, func, *args, **kwargs):
     try:
         result = func(*args, **kwargs)
         # Reset failure count on success
-        cb_state['failures'] = 0
-        cb_state['half_open'] = False
+        cb_state.failures = 0
+        cb_state.half_open = False
         logger.debug(f"Successful call to {service_name}, circuit breaker reset")
         return result
     except Exception as e:
-        cb_state['failures'] += 1
-        cb_state['last_failure_time'] = time.time()
+        cb_state.failures += 1
+        cb_state.last_failure_time = time.time()
         
-        if cb_state['failures'] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
-            cb_state['open'] = True
-            cb_state['half_open'] = False
-            logger.error(f"💥 Circuit breaker OPENED for {service_name} after {cb_state['failures']} failures: {str(e)}")
+        if cb_state.failures >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+            cb_state.open = True
+            cb_state.half_open = False
+            logger.error(f"💥 Circuit breaker OPENED for {service_name} after {cb_state.failures} failures: {str(e)}")
             # Send alert notification
             logger.critical(f"🚨 SERVICE FAILURE: {service_name} circuit breaker activated due to repeated failures", extra={'alert_type': 'service_failure', 'service': service_name})
-        elif cb_state['failures'] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD // 2:
-            logger.warning(f"⚠️  Circuit breaker WARNING for {service_name}: {cb_state['failures']} failures detected")
+        elif cb_state.failures >= CIRCUIT_BREAKER_FAILURE_THRESHOLD // 2:
+            logger.warning(f"⚠️  Circuit breaker WARNING for {service_name}: {cb_state.failures} failures detected")
         
         raise e
 
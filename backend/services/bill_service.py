@@ -16,7 +16,7 @@ class BillService:
         try:
             return Bill.query.all()
         except Exception as e:
-            logging.error(f"Error fetching bills: {e}", exc_info=True)
+            logging.error("Error fetching bills: %s", e, exc_info=True)
             raise ServiceError("Could not fetch bills. Please try again later.")
 
     @staticmethod
@@ -24,7 +24,7 @@ class BillService:
         try:
             return Bill.query.get(bill_id)
         except Exception as e:
-            logging.error(f"Error fetching bill: {e}", exc_info=True)
+            logging.error("Error fetching bill: %s", e, exc_info=True)
             raise ServiceError("Could not fetch bill. Please try again later.")
 
     @staticmethod
@@ -36,7 +36,7 @@ class BillService:
             return bill
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating bill: {e}", exc_info=True)
+            logging.error("Error creating bill: %s", e, exc_info=True)
             raise ServiceError("Could not create bill. Please try again later.")
 
     @staticmethod
@@ -51,7 +51,7 @@ class BillService:
             return bill
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating bill: {e}", exc_info=True)
+            logging.error("Error updating bill: %s", e, exc_info=True)
             raise ServiceError("Could not update bill. Please try again later.")
 
     @staticmethod
@@ -83,7 +83,7 @@ class BillService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting bill: {e}", exc_info=True)
+            logging.error("Error deleting bill: %s", e, exc_info=True)
             raise ServiceError("Could not delete bill. Please try again later.")
 
     @staticmethod
@@ -112,7 +112,7 @@ class BillService:
             
             return result
         except Exception as e:
-            logging.error(f"Error fetching billable jobs: {e}", exc_info=True)
+            logging.error("Error fetching billable jobs: %s", e, exc_info=True)
             raise ServiceError("Could not fetch billable jobs. Please try again later.")
 
     @staticmethod
@@ -180,7 +180,7 @@ class BillService:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error generating contractor bill: {e}", exc_info=True)
+            logging.error("Error generating contractor bill: %s", e, exc_info=True)
             raise ServiceError(f"Could not generate contractor bill: {str(e)}")
 
     @staticmethod
@@ -210,7 +210,7 @@ class BillService:
             
             return result
         except Exception as e:
-            logging.error(f"Error fetching driver billable jobs: {e}", exc_info=True)
+            logging.error("Error fetching driver billable jobs: %s", e, exc_info=True)
             raise ServiceError("Could not fetch driver billable jobs. Please try again later.")
 
     @staticmethod
@@ -280,5 +280,5 @@ class BillService:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error generating driver bills: {e}", exc_info=True)
+            logging.error("Error generating driver bills: %s", e, exc_info=True)
             raise ServiceError(f"Could not generate driver bills: {str(e)}")
\ No newline at end of file
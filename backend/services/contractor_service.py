@@ -33,7 +33,7 @@ class ContractorService:
         try:
             return Contractor.query_active().all()
         except Exception as e:
-            logging.error(f"Error fetching contractors: {e}", exc_info=True)
+            logging.error("Error fetching contractors: %s", e, exc_info=True)
             raise ServiceError("Could not fetch contractors. Please try again later.")
 
     @staticmethod
@@ -41,7 +41,7 @@ class ContractorService:
         try:
             return Contractor.query_active().filter_by(id=contractor_id).first()
         except Exception as e:
-            logging.error(f"Error fetching contractor: {e}", exc_info=True)
+            logging.error("Error fetching contractor: %s", e, exc_info=True)
             raise ServiceError("Could not fetch contractor. Please try again later.")
 
     @staticmethod
@@ -53,7 +53,7 @@ class ContractorService:
             return contractor
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating contractor: {e}", exc_info=True)
+            logging.error("Error creating contractor: %s", e, exc_info=True)
             raise ServiceError("Could not create contractor. Please try again later.")
 
     @staticmethod
@@ -68,7 +68,7 @@ class ContractorService:
             return contractor
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating contractor: {e}", exc_info=True)
+            logging.error("Error updating contractor: %s", e, exc_info=True)
             raise ServiceError("Could not update contractor. Please try again later.")
 
     @staticmethod
@@ -83,7 +83,7 @@ class ContractorService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting contractor: {e}", exc_info=True)
+            logging.error("Error deleting contractor: %s", e, exc_info=True)
             raise ServiceError("Could not delete contractor. Please try again later.")
 
     @staticmethod
@@ -99,7 +99,7 @@ class ContractorService:
             return contractor
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error toggling contractor soft delete status: {e}", exc_info=True)
+            logging.error("Error toggling contractor soft delete status: %s", e, exc_info=True)
             raise ServiceError("Could not update contractor status. Please try again later.")
 
     @staticmethod
@@ -107,7 +107,7 @@ class ContractorService:
         try:
             return Contractor.query_active().filter_by(status='Active').all()
         except Exception as e:
-            logging.error(f"Error fetching active contractors: {e}", exc_info=True)
+            logging.error("Error fetching active contractors: %s", e, exc_info=True)
             raise ServiceError("Could not fetch active contractors. Please try again later.")
 
     @staticmethod
@@ -115,7 +115,7 @@ class ContractorService:
         try:
             return ContractorServicePricing.query.filter_by(contractor_id=contractor_id).all()
         except Exception as e:
-            logging.error(f"Error fetching contractor pricing: {e}", exc_info=True)
+            logging.error("Error fetching contractor pricing: %s", e, exc_info=True)
             raise ServiceError("Could not fetch contractor pricing. Please try again later.")
 
     @staticmethod
@@ -142,7 +142,7 @@ class ContractorService:
             return pricing
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating contractor pricing: {e}", exc_info=True)
+            logging.error("Error updating contractor pricing: %s", e, exc_info=True)
             raise ServiceError("Could not update contractor pricing. Please try again later.")
 
     @staticmethod
@@ -165,7 +165,7 @@ class ContractorService:
             # Re-raise ServiceError as-is
             raise
         except Exception as e:
-            logging.error(f"Error fetching contractor cost for service: {e}", exc_info=True)
+            logging.error("Error fetching contractor cost for service: %s", e, exc_info=True)
             raise ServiceError("Could not fetch contractor cost for service. Please try again later.")
 
     @staticmethod
@@ -209,7 +209,7 @@ class ContractorService:
             return updated_pricing
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error bulk updating contractor pricing: {e}", exc_info=True)
+            logging.error("Error bulk updating contractor pricing: %s", e, exc_info=True)
             raise ServiceError("Could not bulk update contractor pricing. Please try again later.")
 
     @staticmethod
@@ -247,12 +247,12 @@ class ContractorService:
             # Re-raise ServiceError as-is
             raise
         except Exception as e:
-            logging.error(f"Error calculating contractor commission for job {job.id}: {e}", exc_info=True)
+            logging.error("Error calculating contractor commission for job %s: %s", job.id, e, exc_info=True)
             return 0.0
         
             # Check for timeout at key points
             if time.time() - start_time > timeout_seconds:
-                current_app.logger.warning(f"PDF generation timed out for bill {bill_id}")
+                current_app.logger.warning("PDF generation timed out for bill %s", bill_id)
                 raise TimeoutError(f"PDF generation exceeded {timeout_seconds} seconds")
             
             bill = Bill.query.filter_by(id=bill_id).first()
@@ -336,23 +336,23 @@ class ContractorService:
                 try:
                     contractor_date = datetime.strptime(str(contractor_date), "%Y-%m-%d")
                 except ValueError:
-                    current_app.logger.error(f"Invalid invoice date format: {contractor_date}")
+                    current_app.logger.error("Invalid invoice date format: %s", contractor_date)
                     raise ValueError(f"Invalid invoice date format: {contractor_date}")
             month_str = contractor_date.strftime("%Y-%m")
             if not re.match(r'^\d{4}-\d{2}$', month_str):
-                current_app.logger.error(f"Date produced invalid month string: {month_str}")
+                current_app.logger.error("Date produced invalid month string: %s", month_str)
                 raise ValueError(f"Invalid month format: {month_str}")
             
             storage_root_env = current_app.config.get("INVOICE_STORAGE_ROOT")
             if storage_root_env and Path(storage_root_env).exists():
                 storage_root = Path(storage_root_env).resolve()
-                current_app.logger.info(f"Using configured contractor storage root: {storage_root}")
+                current_app.logger.info("Using configured contractor storage root: %s", storage_root)
             else:
                 # Fallback: derive automatically
                 repos_root = Path(current_app.root_path).resolve().parents[2]
                 storage_root = repos_root / "fleetwise-storage"
                 current_app.logger.warning(
-                    f"CONTRACTOR_STORAGE_ROOT not set or invalid. Falling back to: {storage_root}"
+                    "CONTRACTOR_STORAGE_ROOT not set or invalid. Falling back to: %s", storage_root
                 )
 
             storage_base = storage_root / "contractor_invoices"    
@@ -366,7 +366,7 @@ class ContractorService:
                 
             except OSError as e:
                 current_app.logger.error(
-                f"Cannot create storage directory {storage_month_dir}: {e}"
+                "Cannot create storage directory %s: %s", storage_month_dir, e
                 )
                 raise RuntimeError(f"Failed to create invoice storage: {e}") from e
             # PDF generation with proper validation (separate concern)
@@ -376,13 +376,13 @@ class ContractorService:
             try:
                 # Check for timeout before PDF generation
                 if time.time() - start_time > timeout_seconds:
-                    current_app.logger.warning(f"PDF generation timed out before starting for bill {bill_id}")
+                    current_app.logger.warning("PDF generation timed out before starting for bill %s", bill_id)
                     raise TimeoutError(f"PDF generation exceeded {timeout_seconds} seconds")
                 
                 # Step 1: Write to a temporary file in the same directory (same filesystem)
                 with NamedTemporaryFile(dir=storage_month_dir, suffix=".pdf", delete=False) as tmp_file:
                     temp_pdf = Path(tmp_file.name)
-                    current_app.logger.info(f"Generating PDF for bill {bill_id} at {temp_pdf}")
+                    current_app.logger.info("Generating PDF for bill %s at %s", bill_id, temp_pdf)
                     
                     pdf_start_time = time.time()
                     pdf_result = generator.generate_invoice(
@@ -392,27 +392,27 @@ class ContractorService:
                         format_type=OutputFormat.PDF,
                      )
                     pdf_duration = time.time() - pdf_start_time
-                    current_app.logger.info(f"PDF generation completed in {pdf_duration:.2f}s for bill {bill_id}")
+                    current_app.logger.info("PDF generation completed in %.2fs for bill %s", pdf_duration, bill_id)
                     
 
                 # Step 2: Validate that PDF generation succeeded
                 if not pdf_result.success or not temp_pdf.exists() or temp_pdf.stat().st_size == 0:
                     current_app.logger.error(
-                        f"Contractor Invoice generation failed for invoice {bill_id}: {getattr(pdf_result, 'error', 'unknown error')}"
+                        "Contractor Invoice generation failed for invoice %s: %s", bill_id, getattr(pdf_result, 'error', 'unknown error')
                     )
                     raise RuntimeError(f"Contractor Invoice generation failed or produced empty file: {temp_pdf}")
 
                 # Step 3: Atomically move the file into place
                 os.replace(temp_pdf, pdf_final_path)
                 temp_pdf = None  # Prevent cleanup in finally block
-                current_app.logger.info(f"Contractor Invoice PDF saved atomically: {pdf_final_path}")
+                current_app.logger.info("Contractor Invoice PDF saved atomically: %s", pdf_final_path)
             
             except TimeoutError:
-                current_app.logger.error(f"PDF generation timed out for bill {bill_id}")
+                current_app.logger.error("PDF generation timed out for bill %s", bill_id)
                 raise
             except Exception as e:
                 current_app.logger.error(
-                    f"Error during PDF generation or atomic save for invoice {bill_id}: {e}", 
+                    "Error during PDF generation or atomic save for invoice %s: %s", bill_id, e, 
                     exc_info=True
                 )     
                 raise
@@ -420,9 +420,9 @@ class ContractorService:
                 if temp_pdf and temp_pdf.exists():
                     try:
                         temp_pdf.unlink()
-                        current_app.logger.debug(f"🧹 Cleaned up temp file: {temp_pdf}")
+                        current_app.logger.debug("🧹 Cleaned up temp file: %s", temp_pdf)
                     except Exception as cleanup_err:
-                        current_app.logger.warning(f"Failed to delete temp file {temp_pdf}: {cleanup_err}")  
+                        current_app.logger.warning("Failed to delete temp file %s: %s", temp_pdf, cleanup_err)  
 
             
             if not pdf_final_path.exists():
@@ -431,10 +431,10 @@ class ContractorService:
             # Final timeout check before returning
             total_duration = time.time() - start_time
             if total_duration > timeout_seconds:
-                current_app.logger.warning(f"Overall process timed out for bill {bill_id} after {total_duration:.2f}s")
+                current_app.logger.warning("Overall process timed out for bill %s after %.2fs", bill_id, total_duration)
                 raise TimeoutError(f"Process exceeded {timeout_seconds} seconds")
             
-            current_app.logger.info(f"Contractor invoice PDF generation completed successfully for bill {bill_id} in {total_duration:.2f}s")
+            current_app.logger.info("Contractor invoice PDF generation completed successfully for bill %s in %.2fs", bill_id, total_duration)
             
             return send_file(
                 pdf_final_path,
@@ -443,17 +443,17 @@ class ContractorService:
                 download_name=pdf_final_path.name     # Flask 2.0+ (fallbacks automatically if older)
             )
         except FileNotFoundError as e:
-            logging.error(f"File not found while generating invoice PDF: {e}", exc_info=True)
+            logging.error("File not found while generating invoice PDF: %s", e, exc_info=True)
             raise FileNotFoundError("Invoice template or resource missing.") from e
 
         except PermissionError as e:
-            logging.error(f"Permission denied during invoice PDF generation: {e}", exc_info=True)
+            logging.error("Permission denied during invoice PDF generation: %s", e, exc_info=True)
             raise PermissionError("Insufficient permissions to generate invoice PDF.") from e
 
         except SQLAlchemyError as e:
-            logging.error(f"Database error while fetching invoice data: {e}", exc_info=True)
+            logging.error("Database error while fetching invoice data: %s", e, exc_info=True)
             raise RuntimeError("Could not retrieve invoice data from database.") from e
 
         except OSError as e:  
-            logging.error(f"OS error during invoice PDF generation: {e}", exc_info=True)
+            logging.error("OS error during invoice PDF generation: %s", e, exc_info=True)
             raise RuntimeError("System error occurred while generating invoice PDF.") from e
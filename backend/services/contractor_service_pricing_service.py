@@ -23,7 +23,7 @@ class ContractorServicePricingService:
             tuple: (success_count, error_count) - Number of successful and failed syncs
         """
         try:
-            logging.debug(f"Starting contractor sync for service {service_id}")
+            logging.debug("Starting contractor sync for service %s", service_id)
 
             # Get only active contractors - using the STATUS constant for consistency
             active_contractors = (
@@ -35,15 +35,15 @@ class ContractorServicePricingService:
                 .all()
             )
 
-            logging.info(f"Found {len(active_contractors)} active contractors for service {service_id} sync")
+            logging.info("Found %s active contractors for service %s sync", len(active_contractors), service_id)
 
             if not active_contractors:
-                logging.info(f"No active contractors found for service {service_id} sync")
+                logging.info("No active contractors found for service %s sync", service_id)
                 return 0, 0
 
             # Get all vehicle types
             vehicle_types = db.session.query(VehicleType).filter(VehicleType.is_deleted.is_(False)).all()
-            logging.info(f"Found {len(vehicle_types)} vehicle types for service {service_id} sync")
+            logging.info("Found %s vehicle types for service %s sync", len(vehicle_types), service_id)
 
             success_count = 0
             error_count = 0
@@ -54,7 +54,7 @@ class ContractorServicePricingService:
                     # Double-check status hasn't changed (defensive programming)
                     if contractor.status != Contractor.STATUS_ACTIVE:
                         logging.info(
-                            f"Skipping contractor {contractor.id} - status changed to {contractor.status}"
+                            "Skipping contractor %s - status changed to %s", contractor.id, contractor.status
                         )
                         continue
 
@@ -69,8 +69,7 @@ class ContractorServicePricingService:
 
                         if existing:
                             logging.warning(
-                                f"Pricing already exists for contractor {contractor.id}, "
-                                f"service {service_id}, and vehicle type {vehicle_type.id}, skipping"
+                                "Pricing already exists for contractor %s, service %s, and vehicle type %s, skipping", contractor.id, service_id, vehicle_type.id
                             )
                             continue
 
@@ -83,33 +82,32 @@ class ContractorServicePricingService:
                         db.session.add(pricing)
                     
                     success_count += 1
-                    logging.debug(f"Added pricing for contractor {contractor.id} and service {service_id} for all vehicle types")
+                    logging.debug("Added pricing for contractor %s and service %s for all vehicle types", contractor.id, service_id)
 
                 except IntegrityError as ie:
                     error_count += 1
                     logging.error(
-                        f"Integrity error syncing service {service_id} to contractor {contractor.id}: {str(ie)}"
+                        "Integrity error syncing service %s to contractor %s: %s", service_id, contractor.id, str(ie)
                     )
                     # Continue processing other contractors - we'll rollback all at the end if needed
                 except Exception as e:
                     error_count += 1
                     logging.error(
-                        f"Error syncing service {service_id} to contractor {contractor.id}: {str(e)}"
+                        "Error syncing service %s to contractor %s: %s", service_id, contractor.id, str(e)
                     )
                     # Continue processing other contractors - we'll rollback all at the end if needed
 
             # Single commit for entire batch to ensure atomicity
             db.session.commit()
             logging.info(
-                f"Successfully synced service {service_id} to {success_count} active contractors "
-                f"({error_count} errors)"
+                "Successfully synced service %s to %s active contractors (%s errors)", service_id, success_count, error_count
             )
 
             return success_count, error_count
 
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error in sync_new_service_to_contractors: {str(e)}", exc_info=True)
+            logging.error("Error in sync_new_service_to_contractors: %s", str(e), exc_info=True)
             raise ContractorServicePricingError("Failed to sync service to contractors. Please check the logs.")
 
     @staticmethod
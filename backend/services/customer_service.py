@@ -16,7 +16,7 @@ class CustomerService:
         try:
             return Customer.query_active().all()
         except Exception as e:
-            logging.error(f"Error fetching customers: {e}", exc_info=True)
+            logging.error("Error fetching customers: %s", e, exc_info=True)
             raise ServiceError("Could not fetch customers. Please try again later.")
 
     @staticmethod
@@ -24,7 +24,7 @@ class CustomerService:
         try:
             return Customer.query_active().filter_by(id=customer_id).first()
         except Exception as e:
-            logging.error(f"Error fetching customer: {e}", exc_info=True)
+            logging.error("Error fetching customer: %s", e, exc_info=True)
             raise ServiceError("Could not fetch customer. Please try again later.")
 
     @staticmethod
@@ -36,7 +36,7 @@ class CustomerService:
             return customer
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating customer: {e}", exc_info=True)
+            logging.error("Error creating customer: %s", e, exc_info=True)
             raise ServiceError("Could not create customer. Please try again later.")
 
     @staticmethod
@@ -51,7 +51,7 @@ class CustomerService:
             return customer
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating customer: {e}", exc_info=True)
+            logging.error("Error updating customer: %s", e, exc_info=True)
             raise ServiceError("Could not update customer. Please try again later.")
 
     @staticmethod
@@ -75,7 +75,7 @@ class CustomerService:
                     jobs = Job.query_active().filter_by(customer_id=customer_id).all()
                     for job in jobs:
                         job.is_deleted = True
-                    logging.info(f"Cascade soft deleted {jobs_count} jobs for customer {customer_id}")
+                    logging.info("Cascade soft deleted %s jobs for customer %s", jobs_count, customer_id)
                 
                 # Note: CustomerServicePricing doesn't have is_deleted column, so we leave it as is
                 
@@ -88,7 +88,7 @@ class CustomerService:
             raise  # Re-raise ServiceError as-is
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting customer: {e}", exc_info=True)
+            logging.error("Error deleting customer: %s", e, exc_info=True)
             raise ServiceError("Could not delete customer. Please try again later.")
 
     @staticmethod
@@ -104,5 +104,5 @@ class CustomerService:
             return customer
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error toggling customer soft delete status: {e}", exc_info=True)
+            logging.error("Error toggling customer soft delete status: %s", e, exc_info=True)
             raise ServiceError("Could not update customer status. Please try again later.")
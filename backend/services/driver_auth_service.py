@@ -43,15 +43,15 @@ class DriverAuthService:
             email_sent = DriverAuthService._send_otp_email(email, otp, driver_name)
 
             if email_sent:
-                logging.info(f"OTP {otp} sent successfully to email: {email}")
+                logging.info("OTP %s sent successfully to email: %s", otp, email)
             else:
-                logging.error(f"Failed to send OTP to email: {email}")
+                logging.error("Failed to send OTP to email: %s", email)
                 # Note: We still return True for security (don't reveal delivery status)
 
             return True
             
         except Exception as e:
-            logging.error(f"Error in request_driver_password_reset: {e}", exc_info=True)
+            logging.error("Error in request_driver_password_reset: %s", e, exc_info=True)
             raise DriverAuthError("Unable to process driver password reset request. Please try again later.", 500)
 
     @staticmethod
@@ -87,7 +87,7 @@ class DriverAuthService:
             return {'valid': True, 'email': email}
             
         except Exception as e:
-            logging.error(f"Error in verify_driver_otp: {e}", exc_info=True)
+            logging.error("Error in verify_driver_otp: %s", e, exc_info=True)
             raise DriverAuthError("Unable to verify OTP. Please try again later.", 500)
 
     @staticmethod
@@ -122,7 +122,7 @@ class DriverAuthService:
             driver = Driver.query.filter_by(email=email).first()
             # If no driver found, we'll still continue (for flexibility)
             if not driver:
-                logging.info(f"Driver account not found for email: {email}, continuing")
+                logging.info("Driver account not found for email: %s, continuing", email)
 
             # Find the associated user account (if exists) and update the password
             # In this system, drivers may have associated user accounts
@@ -130,7 +130,7 @@ class DriverAuthService:
             if not user:
                 # If no user account exists, we can't reset the password
                 # This could happen if the driver doesn't have a login account
-                logging.warning(f"No user account found for email: {email}")
+                logging.warning("No user account found for email: %s", email)
                 raise DriverAuthError("User account not found.", 400)
 
             # Check for password reuse using the existing password history mechanism
@@ -154,16 +154,16 @@ class DriverAuthService:
             try:
                 PasswordResetService._send_password_reset_confirmation_email(user)
             except Exception as email_error:
-                logging.error(f"Failed to send password reset confirmation email: {email_error}")
+                logging.error("Failed to send password reset confirmation email: %s", email_error)
 
-            logging.info(f"Driver password reset successful for email: {email}")
+            logging.info("Driver password reset successful for email: %s", email)
             return True
 
         except DriverAuthError:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error in reset_driver_password_with_email_only: {e}", exc_info=True)
+            logging.error("Error in reset_driver_password_with_email_only: %s", e, exc_info=True)
             raise DriverAuthError("Unable to reset driver password. Please try again later.", 500)
 
     @staticmethod
@@ -214,10 +214,10 @@ class DriverAuthService:
                             decrypted_password = f.decrypt(password.encode()).decode()
                             password = decrypted_password
                         except Exception as decrypt_error:
-                            logging.error(f"Password decryption failed: {decrypt_error}")
+                            logging.error("Password decryption failed: %s", decrypt_error)
                             return False
                 except Exception as e:
-                    logging.error(f"Error processing email password: {e}")
+                    logging.error("Error processing email password: %s", e)
                     return False
 
             # Validate required fields
@@ -305,7 +305,7 @@ FleetWise Team
                     return True
             
         except Exception as e:
-            logging.error(f"Error sending OTP email to {email}: {e}", exc_info=True)
+            logging.error("Error sending OTP email to %s: %s", email, e, exc_info=True)
             return False
 
     @staticmethod
@@ -318,8 +318,8 @@ FleetWise Team
         """
         try:
             count = OTPStorage.cleanup_expired_otps()
-            logging.info(f"Cleaned up {count} expired driver OTPs")
+            logging.info("Cleaned up %s expired driver OTPs", count)
             return count
         except Exception as e:
-            logging.error(f"Error cleaning up expired OTPs: {e}", exc_info=True)
+            logging.error("Error cleaning up expired OTPs: %s", e, exc_info=True)
             return 0
\ No newline at end of file
@@ -198,8 +198,7 @@ class DriverLeaveService:
             if affected_jobs_check:
                 effective_status = LeaveStatus.PENDING
                 logger.warning(
-                    f"Leave creation: status changed from '{LeaveStatus.APPROVED}' to '{LeaveStatus.PENDING}' "
-                    f"because {len(affected_jobs_check)} affected jobs need reassignment"
+                    "Leave creation: status changed from '%s' to '%s' because %s affected jobs need reassignment", LeaveStatus.APPROVED, LeaveStatus.PENDING, len(affected_jobs_check)
                 )
 
         # Create leave record with date objects
@@ -223,7 +222,7 @@ class DriverLeaveService:
 
         db.session.commit()
 
-        logger.info(f"Created leave ID {leave.id} for driver {driver_id} from {start_dt} to {end_dt}")
+        logger.info("Created leave ID %s for driver %s from %s to %s", leave.id, driver_id, start_dt, end_dt)
 
         return {
             'leave': leave,
@@ -480,14 +479,14 @@ class DriverLeaveService:
                         'message': f"Job {job_id} successfully reassigned"
                     })
 
-                    logger.info(f"Job {job_id} reassigned successfully")
+                    logger.info("Job %s reassigned successfully", job_id)
 
                 except ServiceError as e:
                     results['failed'].append({
                         'job_id': reassignment_data.get('job_id'),
                         'error': str(e)
                     })
-                    logger.error(f"Failed to reassign job {reassignment_data.get('job_id')}: {str(e)}")
+                    logger.error("Failed to reassign job %s: %s", reassignment_data.get('job_id'), str(e))
 
                     if atomic:
                         # Rollback entire transaction on first failure
@@ -502,7 +501,7 @@ class DriverLeaveService:
                         'job_id': reassignment_data.get('job_id'),
                         'error': str(e)
                     })
-                    logger.error(f"Unexpected error reassigning job {reassignment_data.get('job_id')}: {str(e)}")
+                    logger.error("Unexpected error reassigning job %s: %s", reassignment_data.get('job_id'), str(e))
 
                     if atomic:
                         # Rollback entire transaction on unexpected error
@@ -524,7 +523,7 @@ class DriverLeaveService:
         except Exception as e:
             # Unexpected error in outer try block
             db.session.rollback()
-            logger.error(f"Fatal error in reassign_jobs: {str(e)}", exc_info=True)
+            logger.error("Fatal error in reassign_jobs: %s", str(e), exc_info=True)
             raise ServiceError(f"Reassignment transaction failed: {str(e)}")
 
     @staticmethod
@@ -695,7 +694,7 @@ class DriverLeaveService:
         leave.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        logger.info(f"Updated leave ID {leave_id}")
+        logger.info("Updated leave ID %s", leave_id)
 
         return leave
 
@@ -721,6 +720,6 @@ class DriverLeaveService:
         leave.updated_at = datetime.now(timezone.utc)
         db.session.commit()
 
-        logger.info(f"Deleted leave ID {leave_id}")
+        logger.info("Deleted leave ID %s", leave_id)
 
         return True
@@ -18,19 +18,22 @@ from backend.models.settings import UserSettings
 from sqlalchemy.exc import SQLAlchemyError
 from backend.models.bill import Bill
 from backend.models.driver import Driver
+from backend.schemas.job_schema import JobSchema
 from io import BytesIO
 class ServiceError(Exception):
     def __init__(self, message):
         super().__init__(message)
         self.message = message
 
+job_schema_many = JobSchema(many=True)
+
 class DriverService:
     @staticmethod
     def get_all():
         try:
             return Driver.query_active().all()
         except Exception as e:
-            logging.error(f"Error fetching drivers: {e}", exc_info=True)
+            logging.error("Error fetching drivers: %s", e, exc_info=True)
             raise ServiceError("Could not fetch drivers. Please try again later.")
 
     @staticmethod
@@ -38,7 +41,7 @@ class DriverService:
         try:
             return Driver.query_active().filter_by(id=driver_id).first()
         except Exception as e:
-            logging.error(f"Error fetching driver: {e}", exc_info=True)
+            logging.error("Error fetching driver: %s", e, exc_info=True)
             raise ServiceError("Could not fetch driver. Please try again later.")
 
     @staticmethod
@@ -50,7 +53,7 @@ class DriverService:
             return driver
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating driver: {e}", exc_info=True)
+            logging.error("Error creating driver: %s", e, exc_info=True)
             raise ServiceError("Could not create driver. Please try again later.")
 
     @staticmethod
@@ -66,7 +69,7 @@ class DriverService:
             return driver
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating driver: {e}", exc_info=True)
+            logging.error("Error updating driver: %s", e, exc_info=True)
             raise ServiceError("Could not update driver. Please try again later.")
 
     @staticmethod
@@ -82,7 +85,7 @@ class DriverService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting driver: {e}", exc_info=True)
+            logging.error("Error deleting driver: %s", e, exc_info=True)
             raise ServiceError("Could not delete driver. Please try again later.")
 
     @staticmethod
@@ -98,7 +101,7 @@ class DriverService:
             return driver
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error toggling driver soft delete status: {e}", exc_info=True)
+            logging.error("Error toggling driver soft delete status: %s", e, exc_info=True)
             raise ServiceError("Could not update driver status. Please try again later.")
 
     @staticmethod
@@ -121,15 +124,13 @@ class DriverService:
                 'jobs': job_list
             }
         except Exception as e:
-            logging.error(f"Error generating driver billing report: {e}", exc_info=True)
+            logging.error("Error generating driver billing report: %s", e, exc_info=True)
             raise ServiceError("Could not generate driver billing report. Please try again later.")
         
     @staticmethod
     def getDriverJobs(page,page_size,driver_id):
         try:
             from backend.models.job import Job
-            from backend.schemas.job_schema import JobSchema 
-            job_schema_many = JobSchema(many=True)
 
             query = Job.query_active().filter_by(driver_id=driver_id).filter(Job.status.in_(['confirmed', 'otw', 'ots','pob']))
             total = query.count()
@@ -144,15 +145,13 @@ class DriverService:
                 'total':total
             }
         except Exception as e:
-            logging.error(f"Error generating driver billing report: {e}", exc_info=True)
+            logging.error("Error generating driver billing report: %s", e, exc_info=True)
             raise ServiceError("Could not get Jobs. Please try again later.")
         
     @staticmethod
     def getDriverCompletedJobs(page,page_size,driver_id):
         try:
             from backend.models.job import Job
-            from backend.schemas.job_schema import JobSchema 
-            job_schema_many = JobSchema(many=True)
 
             query = Job.query_active().filter_by(driver_id=driver_id).filter(Job.status.in_(['jc', 'canceled', 'sd']))
             total = query.count()
@@ -167,7 +166,7 @@ class DriverService:
                 'total':total
             }
         except Exception as e:
-            logging.error(f"Error generating driver billing report: {e}", exc_info=True)
+            logging.error("Error generating driver billing report: %s", e, exc_info=True)
             raise ServiceError("Could not get Jobs. Please try again later.")
 
     @staticmethod
@@ -186,7 +185,7 @@ class DriverService:
             }
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating job status for job_id {job_id}, driver_id {driver_id}: {e}", exc_info=True)
+            logging.error("Error updating job status for job_id %s, driver_id %s: %s", job_id, driver_id, e, exc_info=True)
             raise ServiceError("Failed to update job status. Please try again later.")
         
     @staticmethod
@@ -263,23 +262,23 @@ class DriverService:
                 try:
                     contractor_date = datetime.strptime(str(contractor_date), "%Y-%m-%d")
                 except ValueError:
-                    current_app.logger.error(f"Invalid Driver invoice date format: {contractor_date}")
+                    current_app.logger.error("Invalid Driver invoice date format: %s", contractor_date)
                     raise ValueError(f"Invalid Driver invoice date format: {contractor_date}")
             month_str = contractor_date.strftime("%Y-%m")
             if not re.match(r'^\d{4}-\d{2}$', month_str):
-                current_app.logger.error(f"Date produced invalid month string: {month_str}")
+                current_app.logger.error("Date produced invalid month string: %s", month_str)
                 raise ValueError(f"Invalid month format: {month_str}")
             
             storage_root_env = current_app.config.get("INVOICE_STORAGE_ROOT")
             if storage_root_env and Path(storage_root_env).exists():
                 storage_root = Path(storage_root_env).resolve()
-                current_app.logger.info(f"Using configured driver storage root: {storage_root}")
+                current_app.logger.info("Using configured driver storage root: %s", storage_root)
             else:
                 # Fallback: derive automatically
                 repos_root = Path(current_app.root_path).resolve().parents[2]
                 storage_root = repos_root / "fleetwise-storage"
                 current_app.logger.warning(
-                    f"DRIVER_STORAGE_ROOT not set or invalid. Falling back to: {storage_root}"
+                    "DRIVER_STORAGE_ROOT not set or invalid. Falling back to: %s", storage_root
                 )
 
             storage_base = storage_root / "driver_invoices"    
@@ -293,7 +292,7 @@ class DriverService:
                 
             except OSError as e:
                 current_app.logger.error(
-                f"Cannot create storage directory {storage_month_dir}: {e}"
+                "Cannot create storage directory %s: %s", storage_month_dir, e
                 )
                 raise RuntimeError(f"Failed to create invoice storage: {e}") from e
             pdf_final_path = storage_month_dir / f"{contractor_invoice.bill_no}.pdf"
@@ -315,18 +314,18 @@ class DriverService:
                 # Step 2: Validate that PDF generation succeeded
                 if not pdf_result.success or not temp_pdf.exists() or temp_pdf.stat().st_size == 0:
                     current_app.logger.error(
-                        f"Driver Invoice generation failed for invoice {bill_id}: {getattr(pdf_result, 'error', 'unknown error')}"
+                        "Driver Invoice generation failed for invoice %s: %s", bill_id, getattr(pdf_result, 'error', 'unknown error')
                     )
                     raise RuntimeError(f"Driver Invoice generation failed or produced empty file: {temp_pdf}")
 
                 # Step 3: Atomically move the file into place
                 os.replace(temp_pdf, pdf_final_path)
                 temp_pdf = None  # Prevent cleanup in finally block
-                current_app.logger.info(f"Driver Invoice PDF saved atomically: {pdf_final_path}")
+                current_app.logger.info("Driver Invoice PDF saved atomically: %s", pdf_final_path)
             
             except Exception as e:
                 current_app.logger.error(
-                    f"Error during PDF generation or atomic save for invoice {bill_id}: {e}", 
+                    "Error during PDF generation or atomic save for invoice %s: %s", bill_id, e, 
                     exc_info=True
                 )
                 raise
@@ -334,9 +333,9 @@ class DriverService:
                 if temp_pdf and temp_pdf.exists():
                     try:
                         temp_pdf.unlink()
-                        current_app.logger.debug(f"🧹 Cleaned up temp file: {temp_pdf}")
+                        current_app.logger.debug("🧹 Cleaned up temp file: %s", temp_pdf)
                     except Exception as cleanup_err:
-                        current_app.logger.warning(f"Failed to delete temp file {temp_pdf}: {cleanup_err}")  
+                        current_app.logger.warning("Failed to delete temp file %s: %s", temp_pdf, cleanup_err)  
 
             if not pdf_final_path.exists():
                 raise RuntimeError(f"Driver Invoice PDF missing after atomic save: {pdf_final_path}")
@@ -349,17 +348,17 @@ class DriverService:
             )
 
         except FileNotFoundError as e:
-            logging.error(f"File not found while generating invoice PDF: {e}", exc_info=True)
+            logging.error("File not found while generating invoice PDF: %s", e, exc_info=True)
             raise FileNotFoundError("Invoice template or resource missing.") from e
 
         except PermissionError as e:
-            logging.error(f"Permission denied during invoice PDF generation: {e}", exc_info=True)
+            logging.error("Permission denied during invoice PDF generation: %s", e, exc_info=True)
             raise PermissionError("Insufficient permissions to generate invoice PDF.") from e
 
         except SQLAlchemyError as e:
-            logging.error(f"Database error while fetching invoice data: {e}", exc_info=True)
+            logging.error("Database error while fetching invoice data: %s", e, exc_info=True)
             raise RuntimeError("Could not retrieve invoice data from database.") from e
 
         except OSError as e:  
-            logging.error(f"OS error during invoice PDF generation: {e}", exc_info=True)
+            logging.error("OS error during invoice PDF generation: %s", e, exc_info=True)
             raise RuntimeError("System error occurred while generating invoice PDF.") from e
@@ -115,7 +115,7 @@ def sanitize_filter_value(value):
 
     for pattern in sql_injection_patterns:
         if re.search(pattern, value, re.IGNORECASE):
-            logging.warning(f"SQL injection pattern detected: {pattern} in value: {value}")
+            logging.warning("SQL injection pattern detected: %s in value: %s", pattern, value)
             return None
 
     # Only allow safe characters for search
@@ -123,7 +123,7 @@ def sanitize_filter_value(value):
     safe_pattern = re.compile(r'^[a-zA-Z0-9\s\-_.,:!?@#$%&*()+=<>[\]{}|\\/"`~]+$')
 
     if not safe_pattern.match(value):
-        logging.warning(f"Potentially unsafe filter value detected: {value}")
+        logging.warning("Potentially unsafe filter value detected: %s", value)
         return None
 
     return value
@@ -134,7 +134,7 @@ class InvoiceService:
         try:
             return Invoice.query.all()
         except Exception as e:
-            logging.error(f"Error fetching invoices: {e}", exc_info=True)
+            logging.error("Error fetching invoices: %s", e, exc_info=True)
             raise ServiceError("Could not fetch invoices. Please try again later.")
 
     @staticmethod
@@ -142,7 +142,7 @@ class InvoiceService:
         try:
             return Invoice.query.get(invoice_id)
         except Exception as e:
-            logging.error(f"Error fetching invoice: {e}", exc_info=True)
+            logging.error("Error fetching invoice: %s", e, exc_info=True)
             raise ServiceError("Could not fetch invoice. Please try again later.")
     
     @staticmethod
@@ -150,7 +150,7 @@ class InvoiceService:
         try:
             return Invoice.query.filter_by(customer_id=customer_id).all()
         except Exception as e:
-            logging.error(f"Error fetching invoices by customer_id: {e}", exc_info=True)
+            logging.error("Error fetching invoices by customer_id: %s", e, exc_info=True)
             raise ServiceError("Could not fetch invoices. Please try again later.")
 
     @staticmethod
@@ -164,7 +164,7 @@ class InvoiceService:
         except ServiceError:
             raise
         except Exception as e:
-            logging.error(f"Error fetching invoices for customer {customer_id}: {e}", exc_info=True)
+            logging.error("Error fetching invoices for customer %s: %s", customer_id, e, exc_info=True)
             raise ServiceError("Could not fetch invoices. Please try again later.")
 
     @staticmethod
@@ -176,7 +176,7 @@ class InvoiceService:
             return invoice
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating invoice: {e}", exc_info=True)
+            logging.error("Error creating invoice: %s", e, exc_info=True)
             raise ServiceError("Could not create invoice. Please try again later.")
     
     @staticmethod
@@ -189,11 +189,11 @@ class InvoiceService:
         try:
             gst_percent = Decimal(str(raw_gst))
             if gst_percent < 0 or gst_percent > 100:
-                logger.warning(f"Invalid GST percent {gst_percent}, using 0")
+                logger.warning("Invalid GST percent %s, using 0", gst_percent)
                 return Decimal("0")
             return gst_percent
         except (ValueError, InvalidOperation) as e:
-            logger.error(f"Failed to parse GST percent '{raw_gst}': {e}")
+            logger.error("Failed to parse GST percent '%s': %s", raw_gst, e)
             return Decimal("0")
 
 
@@ -221,7 +221,7 @@ class InvoiceService:
                 user_settings = UserSettings.query.first()
                 prefs = user_settings.preferences or {} if user_settings else {}
             except Exception as e:
-                logger.error(f"Failed to fetch UserSettings: {e}")
+                logger.error("Failed to fetch UserSettings: %s", e)
                 prefs = {}
             billing_settings = prefs.get("billing_settings", {}) if prefs else {}
             gst_percent = InvoiceService._get_gst_percent(billing_settings)
@@ -264,7 +264,7 @@ class InvoiceService:
             }
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error generating invoice: {e}", exc_info=True)
+            logging.error("Error generating invoice: %s", e, exc_info=True)
             raise ServiceError("Could not generate invoice. Please try again later.")
 
     @staticmethod
@@ -292,7 +292,7 @@ class InvoiceService:
                 'invoices': [inv.id for inv in invoices]
             }
         except Exception as e:
-            logging.error(f"Error generating billing report: {e}", exc_info=True)
+            logging.error("Error generating billing report: %s", e, exc_info=True)
             raise ServiceError("Could not generate billing report. Please try again later.")
 
     @staticmethod
@@ -334,13 +334,13 @@ class InvoiceService:
                 'invoices': invoice_data
             }
         except SQLAlchemyError as e:
-                logging.error(f"Database error querying jobs: {e}", exc_info=True)
+                logging.error("Database error querying jobs: %s", e, exc_info=True)
                 raise ServiceError("Failed to fetch invoice jobs")
         except ValueError as e:
-                logging.error(f"Validation error in jobs query: {e}", exc_info=True)
+                logging.error("Validation error in jobs query: %s", e, exc_info=True)
                 raise ServiceError(f"Invalid data format: {str(e)}")
         except Exception as e:
-            logging.error(f"Error fetching invoice jobs: {e}", exc_info=True)
+            logging.error("Error fetching invoice jobs: %s", e, exc_info=True)
             raise ServiceError("Could not fetch invoice jobs. Please try again later.")
     @staticmethod
     def remove_invoice(invoice_id):
@@ -352,7 +352,7 @@ class InvoiceService:
                 user_settings = UserSettings.query.first()
                 prefs = user_settings.preferences or {} if user_settings else {}
             except Exception as e:
-                logger.error(f"Failed to fetch UserSettings: {e}")
+                logger.error("Failed to fetch UserSettings: %s", e)
                 prefs = {}
             billing_settings = prefs.get("billing_settings", {})
 
@@ -371,7 +371,7 @@ class InvoiceService:
             return {'success': True, 'message': 'Invoice deleted and jobs updated'}
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error removing invoice and unlinking jobs: {e}", exc_info=True)
+            logging.error("Error removing invoice and unlinking jobs: %s", e, exc_info=True)
             raise ServiceError("Could not remove invoice. Please try again later.")
 
     @staticmethod
@@ -385,7 +385,7 @@ class InvoiceService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting invoice: {e}", exc_info=True)
+            logging.error("Error deleting invoice: %s", e, exc_info=True)
             raise ServiceError("Could not delete invoice. Please try again later.")
 
     @staticmethod
@@ -400,7 +400,7 @@ class InvoiceService:
             return invoice
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating invoice: {e}", exc_info=True)
+            logging.error("Error updating invoice: %s", e, exc_info=True)
             raise ServiceError("Could not update invoice. Please try again later.")
 
     @staticmethod
@@ -419,12 +419,12 @@ class InvoiceService:
                 try:
                     InvoiceService.generate_invoice_pdf(invoice)
                 except Exception as pdf_err:
-                    logging.error(f"PDF generation failed: {pdf_err}", exc_info=True)
+                    logging.error("PDF generation failed: %s", pdf_err, exc_info=True)
             db.session.commit()
             return invoice
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating invoice: {e}", exc_info=True)
+            logging.error("Error updating invoice: %s", e, exc_info=True)
             raise Exception("Could not update invoice. Please try again later.")
 
     @staticmethod
@@ -575,8 +575,7 @@ class InvoiceService:
             stored = Decimal(str(invoice.total_amount))
             if abs(stored - computed_total) > Decimal("0.01"):
                 logging.warning(
-                    f"Invoice {invoice.id} total mismatch: stored={stored}, "
-                    f"computed={computed_total}. Using computed."
+                    "Invoice %s total mismatch: stored=%s, computed=%s. Using computed.", invoice.id, stored, computed_total
                 )
         gst_amount = sub_total * Decimal("0.09")  # 9% GST
         gst_amount = gst_amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -724,7 +723,7 @@ class InvoiceService:
         invoice.file_path = f"/billing_invoices/{filename}"
         invoice.total_amount = float(total_amount)
         db.session.commit()
-        logging.info(f"Invoice PDF created at: {pdf_path}")
+        logging.info("Invoice PDF created at: %s", pdf_path)
         InvoiceService.cleanup_old_pdfs(output_folder)
         
         # Return the PDF file for download
@@ -747,9 +746,9 @@ class InvoiceService:
             for file_path in glob.glob(os.path.join(pdf_dir, '*.pdf')):
                 if os.path.isfile(file_path) and os.path.getctime(file_path) < cutoff.timestamp():
                     os.remove(file_path)
-                    logging.info(f"Old invoice PDF deleted: {file_path}")
+                    logging.info("Old invoice PDF deleted: %s", file_path)
         except Exception as e:
-            logging.error(f"Error during PDF cleanup: {e}")
+            logging.error("Error during PDF cleanup: %s", e)
 
    
     @staticmethod
@@ -861,7 +860,7 @@ class InvoiceService:
         try:
             import weasyprint
         except Exception as weasyprint_error:
-            current_app.logger.warning(f"WeasyPrint import failed: {weasyprint_error}, falling back to ReportLab")
+            current_app.logger.warning("WeasyPrint import failed: %s, falling back to ReportLab", weasyprint_error)
             invoice = Invoice.query.get(invoice_id)
             if not invoice:
                 raise ValueError(f"Invoice not found: {invoice_id}")
@@ -902,7 +901,7 @@ class InvoiceService:
                 user_settings = UserSettings.query.first()
                 prefs = user_settings.preferences or {} if user_settings else {}
             except Exception as e:
-                logger.error(f"Failed to fetch UserSettings: {e}")
+                logger.error("Failed to fetch UserSettings: %s", e)
                 prefs = {}
             billing_settings = prefs.get("billing_settings", {})
             company_logo = billing_settings.get("company_logo", "")
@@ -965,8 +964,7 @@ class InvoiceService:
                 stored = Decimal(str(invoice.total_amount))
                 if abs(stored - computed_total) > Decimal("0.01"):
                     current_app.logger.warning(
-                        f"Invoice {invoice.id} total mismatch: stored={stored}, "
-                        f"computed={computed_total}. Using computed."
+                        "Invoice %s total mismatch: stored=%s, computed=%s. Using computed.", invoice.id, stored, computed_total
                     )
                 
             gst_amount = (sub_total * gst_percent / Decimal("100")).quantize(
@@ -1080,24 +1078,24 @@ class InvoiceService:
                 try:
                     invoice_date = datetime.strptime(str(invoice.date), "%Y-%m-%d")
                 except ValueError:
-                    current_app.logger.error(f"Invalid invoice date format: {invoice.date}")
+                    current_app.logger.error("Invalid invoice date format: %s", invoice.date)
                     raise ValueError(f"Invalid invoice date format: {invoice.date}")
             month_str = invoice_date.strftime("%Y-%m")
             if not re.match(r'^\d{4}-\d{2}$', month_str):
-                current_app.logger.error(f"Date produced invalid month string: {month_str}")
+                current_app.logger.error("Date produced invalid month string: %s", month_str)
                 raise ValueError(f"Invalid month format: {month_str}")
 
             # --- Determine storage root ---
             storage_root_env = current_app.config.get("INVOICE_STORAGE_ROOT")
             if storage_root_env and Path(storage_root_env).exists():
                 storage_root = Path(storage_root_env).resolve()
-                current_app.logger.info(f"Using configured invoice storage root: {storage_root}")
+                current_app.logger.info("Using configured invoice storage root: %s", storage_root)
             else:
                 # Fallback: derive automatically
                 repos_root = Path(current_app.root_path).resolve().parents[1]
                 storage_root = repos_root / "fleetwise-storage"
                 current_app.logger.warning(
-                    f"INVOICE_STORAGE_ROOT not set or invalid. Falling back to: {storage_root}"
+                    "INVOICE_STORAGE_ROOT not set or invalid. Falling back to: %s", storage_root
                 )
 
             storage_base = storage_root / "invoices"    
@@ -1113,7 +1111,7 @@ class InvoiceService:
                 
             except OSError as e:
                 current_app.logger.error(
-                f"Cannot create storage directory {storage_month_dir}: {e}"
+                "Cannot create storage directory %s: %s", storage_month_dir, e
                 )
                 raise RuntimeError(f"Failed to create invoice storage: {e}") from e
             # PDF generation with proper validation (separate concern)
@@ -1135,7 +1133,7 @@ class InvoiceService:
                 # Step 2: Validate that PDF generation succeeded
                 if not pdf_result.success or not temp_pdf.exists() or temp_pdf.stat().st_size == 0:
                     current_app.logger.error(
-                        f"Invoice generation failed for invoice {invoice_id}: {getattr(pdf_result, 'error', 'unknown error')}"
+                        "Invoice generation failed for invoice %s: %s", invoice_id, getattr(pdf_result, 'error', 'unknown error')
                     )
                     # Try fallback to ReportLab
                     current_app.logger.warning("WeasyPrint failed, falling back to ReportLab for invoice generation")
@@ -1144,23 +1142,23 @@ class InvoiceService:
                 # Step 3: Atomically move the file into place
                 os.replace(temp_pdf, pdf_final_path)
                 temp_pdf = None  # Prevent cleanup in finally block
-                current_app.logger.info(f"Invoice PDF saved atomically: {pdf_final_path}")
+                current_app.logger.info("Invoice PDF saved atomically: %s", pdf_final_path)
 
             except Exception as e:
                 current_app.logger.error(
-                    f"Error during PDF generation or atomic save for invoice {invoice_id}: {e}",
+                    "Error during PDF generation or atomic save for invoice %s: %s", invoice_id, e,
                     exc_info=True
                 )
                 # Try fallback to ReportLab
-                current_app.logger.warning(f"WeasyPrint failed: {e}, falling back to ReportLab for invoice generation")
+                current_app.logger.warning("WeasyPrint failed: %s, falling back to ReportLab for invoice generation", e)
                 return InvoiceService.generate_invoice_pdf_reportlab(invoice)
             finally:
                 if temp_pdf and temp_pdf.exists():
                     try:
                         temp_pdf.unlink()
-                        current_app.logger.debug(f"Cleaned up temp file: {temp_pdf}")
+                        current_app.logger.debug("Cleaned up temp file: %s", temp_pdf)
                     except Exception as cleanup_err:
-                        current_app.logger.warning(f"Failed to delete temp file {temp_pdf}: {cleanup_err}")  
+                        current_app.logger.warning("Failed to delete temp file %s: %s", temp_pdf, cleanup_err)  
   
 
             if not pdf_final_path.exists():
@@ -1175,19 +1173,19 @@ class InvoiceService:
            
             
         except FileNotFoundError as e:
-            logging.error(f"File not found while generating invoice PDF: {e}", exc_info=True)
+            logging.error("File not found while generating invoice PDF: %s", e, exc_info=True)
             raise FileNotFoundError("Invoice template or resource missing.") from e
 
         except PermissionError as e:
-            logging.error(f"Permission denied during invoice PDF generation: {e}", exc_info=True)
+            logging.error("Permission denied during invoice PDF generation: %s", e, exc_info=True)
             raise PermissionError("Insufficient permissions to generate invoice PDF.") from e
 
         except SQLAlchemyError as e:
-            logging.error(f"Database error while fetching invoice data: {e}", exc_info=True)
+            logging.error("Database error while fetching invoice data: %s", e, exc_info=True)
             raise RuntimeError("Could not retrieve invoice data from database.") from e
 
         except OSError as e:  
-            logging.error(f"OS error during invoice PDF generation: {e}", exc_info=True)
+            logging.error("OS error during invoice PDF generation: %s", e, exc_info=True)
             raise RuntimeError("System error occurred while generating invoice PDF.") from e
 
         except KeyError as e:
@@ -43,7 +43,7 @@ def is_in_midnight_range(pickup_time_str):
         # 23:00 = 1380 minutes, 06:59 = 419 minutes
         return (minutes >= 23 * 60) or (minutes <= 6 * 60 + 59)
     except (ValueError, AttributeError):
-        logging.warning(f"Invalid time format for midnight range check: {pickup_time_str}")
+        logging.warning("Invalid time format for midnight range check: %s", pickup_time_str)
         return False
 
 
@@ -118,7 +118,7 @@ class JobService:
                 if not (hasattr(current_user, 'is_authenticated') and current_user.is_authenticated):
                     raise ServiceError("Selected driver is not assigned to the selected vehicle")
                 else:
-                    logging.warning(f"User {getattr(current_user, 'email', 'unknown')} is overriding driver-vehicle assignment for driver_id={driver_id}, vehicle_id={vehicle_id}")
+                    logging.warning("User %s is overriding driver-vehicle assignment for driver_id=%s, vehicle_id=%s", getattr(current_user, 'email', 'unknown'), driver_id, vehicle_id)
     @staticmethod
     def check_driver_conflict(driver_id, pickup_date, pickup_time, job_id=None, time_buffer_minutes=60):
         """
@@ -191,7 +191,7 @@ class JobService:
                     
             return None
         except Exception as e:
-            logging.error(f"Error checking driver conflict: {e}", exc_info=True)
+            logging.error("Error checking driver conflict: %s", e, exc_info=True)
             return None
 
     @staticmethod
@@ -217,7 +217,7 @@ class JobService:
 
             return leave
         except Exception as e:
-            logging.error(f"Error checking driver leave: {e}", exc_info=True)
+            logging.error("Error checking driver leave: %s", e, exc_info=True)
             return None
 
     @staticmethod
@@ -259,13 +259,13 @@ class JobService:
                 if is_available:
                     return (True, None)
             except Exception as e:
-                logging.warning(f"Error checking override availability: {e}")
+                logging.warning("Error checking override availability: %s", e)
 
             # Driver is on leave and has no override for this time
             return (False, leave)
 
         except Exception as e:
-            logging.error(f"Error checking driver availability with overrides: {e}", exc_info=True)
+            logging.error("Error checking driver availability with overrides: %s", e, exc_info=True)
             return (False, None)
 
     @staticmethod
@@ -280,7 +280,7 @@ class JobService:
             # Filter out deleted jobs
             return query.filter(Job.is_deleted.is_(False)).all()
         except Exception as e:
-            logging.error(f"Error fetching jobs: {e}", exc_info=True)
+            logging.error("Error fetching jobs: %s", e, exc_info=True)
             raise ServiceError("Could not fetch jobs. Please try again later.")
 
     @staticmethod
@@ -289,7 +289,7 @@ class JobService:
             # Load all relationships for detailed view
             return Job.get_with_relationships(job_id, include_relationships=['customer', 'driver', 'vehicle', 'service', 'invoice'])
         except Exception as e:
-            logging.error(f"Error fetching job: {e}", exc_info=True)
+            logging.error("Error fetching job: %s", e, exc_info=True)
             raise ServiceError("Could not fetch job. Please try again later.")
 
     @staticmethod
@@ -302,7 +302,7 @@ class JobService:
             # Filter out deleted jobs
             return query.filter(Job.driver_id == driver_id, Job.is_deleted.is_(False)).all()
         except Exception as e:
-            logging.error(f"Error fetching jobs for driver: {e}", exc_info=True)
+            logging.error("Error fetching jobs for driver: %s", e, exc_info=True)
             raise ServiceError("Could not fetch jobs. Please try again later.")
 
     @staticmethod
@@ -315,14 +315,14 @@ class JobService:
             # Filter out deleted jobs
             return query.filter(Job.customer_id == customer_id, Job.is_deleted.is_(False)).all()
         except Exception as e:
-            logging.error(f"Error fetching jobs for customer: {e}", exc_info=True)
+            logging.error("Error fetching jobs for customer: %s", e, exc_info=True)
             raise ServiceError("Could not fetch jobs. Please try again later.")
 
    
     @staticmethod
     def create(data):
         try:
-            logging.info(f"Creating job with data: {data}")
+            logging.info("Creating job with data: %s", data)
 
             # Validate driver-vehicle relationship if both are provided
             driver_id = data.get('driver_id')
@@ -457,12 +457,12 @@ class JobService:
                 if hasattr(Job, pickup_field):
                     price_data[pickup_field] = data.get(pickup_field) or (data.get('pickup_location') if i == 1 else None)
                 else:
-                    logging.warning(f"{pickup_field} field not found in Job model")
+                    logging.warning("%s field not found in Job model", pickup_field)
 
                 if hasattr(Job, dropoff_field):
                     price_data[dropoff_field] = data.get(dropoff_field) or (data.get('dropoff_location') if i == 1 else None)
                 else:
-                    logging.warning(f"{dropoff_field} field not found in Job model")
+                    logging.warning("%s field not found in Job model", dropoff_field)
 
                 price_data[pickup_price_field] = safe_float(data.get(pickup_price_field, 0)) if hasattr(Job, pickup_price_field) else 0
                 price_data[dropoff_price_field] = safe_float(data.get(dropoff_price_field, 0)) if hasattr(Job, dropoff_price_field) else 0
@@ -485,21 +485,21 @@ class JobService:
                     if cpricing and cpricing.cost is not None:
                         data['job_cost'] = float(cpricing.cost)
                     else:
-                        logging.warning(f"No contractor pricing found for contractor_id={contractor_id}, service_id={svc_id}")
+                        logging.warning("No contractor pricing found for contractor_id=%s, service_id=%s", contractor_id, svc_id)
             except (ValueError, TypeError) as e:
-                logging.warning(f"Invalid contractor pricing value for contractor_id={data.get('contractor_id')}: {e}")
+                logging.warning("Invalid contractor pricing value for contractor_id=%s: %s", data.get('contractor_id'), e)
             except Exception as e:
-                logging.error(f"Failed to populate job_cost during create: {e}", exc_info=True)
+                logging.error("Failed to populate job_cost during create: %s", e, exc_info=True)
                 raise ServiceError(f"Failed to populate job_cost: {str(e)}")
 
             # Create job
-            logging.info(f"Creating job with processed data: {data}")
+            logging.info("Creating job with processed data: %s", data)
             job = Job(**data)
             job.extra_services_data = extra_services_data
 
             db.session.add(job)
             db.session.commit()
-            logging.info(f"Job created successfully with ID: {job.id}")
+            logging.info("Job created successfully with ID: %s", job.id)
 
             # Push notification if driver assigned
             if driver_id:
@@ -517,13 +517,13 @@ class JobService:
                                         data={"job_id": str(job.id)}
                                     )
                 except Exception as e:
-                    logging.warning(f"Failed to send push notification for job {job.id}: {e}")
+                    logging.warning("Failed to send push notification for job %s: %s", job.id, e)
 
             return job
 
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating job: {e}", exc_info=True)
+            logging.error("Error creating job: %s", e, exc_info=True)
             # Only wrap non-ServiceError exceptions with generic message
             # ServiceError exceptions should be re-raised as-is to preserve detailed messages
             if isinstance(e, ServiceError):
@@ -578,7 +578,7 @@ class JobService:
                         db.session.flush()  # Force flush to DB
                         # Do not commit here; let main commit handle it
                     except Exception as e:
-                        logging.warning(f"Failed to create audit record for job {job_id}: {e}")
+                        logging.warning("Failed to create audit record for job %s: %s", job_id, e)
             # Validate driver-vehicle relationship if both are provided
             driver_id = data.get('driver_id')
             vehicle_id = data.get('vehicle_id')
@@ -770,11 +770,11 @@ class JobService:
                         if cpricing and cpricing.cost is not None:
                             job.job_cost = float(cpricing.cost)
                         else:
-                            logging.warning(f"No contractor pricing found for contractor_id={contractor_id}, service_id={svc_id} while updating job {job_id}")
+                            logging.warning("No contractor pricing found for contractor_id=%s, service_id=%s while updating job %s", contractor_id, svc_id, job_id)
                 except (ValueError, TypeError) as e:
-                    logging.warning(f"Invalid contractor pricing value for contractor_id={data.get('contractor_id')} on job {job_id}: {e}")
+                    logging.warning("Invalid contractor pricing value for contractor_id=%s on job %s: %s", data.get('contractor_id'), job_id, e)
                 except Exception as e:
-                    logging.error(f"Failed to populate job_cost during update for job {job_id}: {e}", exc_info=True)
+                    logging.error("Failed to populate job_cost during update for job %s: %s", job_id, e, exc_info=True)
                     raise ServiceError(f"Failed to populate job_cost: {str(e)}")
 
             db.session.commit()
@@ -782,7 +782,7 @@ class JobService:
 
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating job: {e}", exc_info=True)
+            logging.error("Error updating job: %s", e, exc_info=True)
             # Only wrap non-ServiceError exceptions with generic message
             # ServiceError exceptions should be re-raised as-is to preserve detailed messages
             if isinstance(e, ServiceError):
@@ -816,7 +816,7 @@ class JobService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting job: {e}", exc_info=True)
+            logging.error("Error deleting job: %s", e, exc_info=True)
             raise ServiceError("Could not delete job. Please try again later.")
 
     @staticmethod
@@ -858,7 +858,7 @@ class JobService:
                     try:
                         condition_config = json.loads(service.condition_config)
                     except json.JSONDecodeError:
-                        logging.warning(f"Invalid condition_config JSON for service {service.id}: {service.condition_config}")
+                        logging.warning("Invalid condition_config JSON for service %s: %s", service.id, service.condition_config)
                         continue
 
                 # Evaluate condition based on type
@@ -875,7 +875,7 @@ class JobService:
                         # This ensures frontend preview matches backend calculation
                         should_apply = is_in_midnight_range(pickup_time)
                         if should_apply:
-                            logging.info(f"Midnight surcharge '{service.name}' applied for pickup_time {pickup_time}")
+                            logging.info("Midnight surcharge '%s' applied for pickup_time %s", service.name, pickup_time)
 
                 elif service.condition_type == 'additional_stops':
                     # Count total dropoff locations
@@ -910,8 +910,7 @@ class JobService:
                             price = float(csp.price)
                             pricing_source = 'customer_specific'
                             logging.info(
-                                f"Using customer-specific pricing for ancillary '{service.name}': "
-                                f"${price} (customer_id={customer_id})"
+                                "Using customer-specific pricing for ancillary '%s': $%s (customer_id=%s)", service.name, price, customer_id
                             )
 
                     # Priority 2: Fallback to vehicle-type-specific pricing
@@ -926,16 +925,14 @@ class JobService:
                         else:
                             # Configuration error: ancillary charge matched but no pricing exists
                             logging.warning(
-                                f"Ancillary charge '{service.name}' (ID {service.id}) matched condition "
-                                f"but no pricing found for vehicle_type_id={vehicle_type_id}. Skipping charge."
+                                "Ancillary charge '%s' (ID %s) matched condition but no pricing found for vehicle_type_id=%s. Skipping charge.", service.name, service.id, vehicle_type_id
                             )
                             continue  # Skip this charge due to missing configuration
 
                     # If still no pricing found, log error and skip
                     if price is None:
                         logging.warning(
-                            f"Ancillary charge '{service.name}' matched condition but no pricing found "
-                            f"(customer_id={customer_id}, vehicle_type_id={vehicle_type_id})"
+                            "Ancillary charge '%s' matched condition but no pricing found (customer_id=%s, vehicle_type_id=%s)", service.name, customer_id, vehicle_type_id
                         )
                         continue
 
@@ -951,14 +948,13 @@ class JobService:
                     })
                     total_amount += total_charge
                     logging.info(
-                        f"Applied ancillary charge: {service.name} (${total_charge}) "
-                        f"[source: {pricing_source}]"
+                        "Applied ancillary charge: %s ($%s) [source: %s]", service.name, total_charge, pricing_source
                     )
 
             return ancillary_charges, total_amount
 
         except Exception as e:
-            logging.error(f"Error evaluating ancillary charges: {e}", exc_info=True)
+            logging.error("Error evaluating ancillary charges: %s", e, exc_info=True)
             return [], 0.0
 
 
@@ -1004,7 +1000,7 @@ class JobService:
                         midnight_surcharge = safe_float(data.get('midnight_surcharge', 15.0))
                     # else: outside midnight period, surcharge is 0 regardless of what was passed
                 except (ValueError, AttributeError):
-                    logging.warning(f"Invalid pickup_time format: {data.get('pickup_time')}")
+                    logging.warning("Invalid pickup_time format: %s", data.get('pickup_time'))
                     midnight_surcharge = 0.0
             else:
                 # No pickup_time provided, use explicit surcharge value if given
@@ -1022,8 +1018,7 @@ class JobService:
             else:
                 # Log warning for missing vehicle_type_id
                 logging.warning(
-                    f"Cannot evaluate ancillary charges: vehicle_type_id is None "
-                    f"(customer_id={data.get('customer_id')}, service_type={data.get('service_type')})"
+                    "Cannot evaluate ancillary charges: vehicle_type_id is None (customer_id=%s, service_type=%s)", data.get('customer_id'), data.get('service_type')
                 )
 
             # Apply discounts
@@ -1051,7 +1046,7 @@ class JobService:
             return {'success': True}
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error setting penalty for job: {e}", exc_info=True)
+            logging.error("Error setting penalty for job: %s", e, exc_info=True)
             raise ServiceError("Could not set penalty for job. Please try again later.") 
         
     @staticmethod
@@ -1085,7 +1080,7 @@ class JobService:
             return {'success': True}
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error removing job from invoice: {e}", exc_info=True)
+            logging.error("Error removing job from invoice: %s", e, exc_info=True)
             raise ServiceError("Could not remove job from invoice. Please try again later.")
     
     @staticmethod
@@ -1112,7 +1107,7 @@ class JobService:
             return job
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating job: {e}", exc_info=True)
+            logging.error("Error updating job: %s", e, exc_info=True)
             # Only wrap non-ServiceError exceptions with generic message
             # ServiceError exceptions should be re-raised as-is to preserve detailed messages
             if isinstance(e, ServiceError):
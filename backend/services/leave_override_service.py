@@ -92,7 +92,7 @@ class LeaveOverrideService:
             )
             db.session.add(override)
             db.session.commit()
-            logger.info(f"Override created: Leave {driver_leave_id}, Date {override_date}, Time {start_time}-{end_time}")
+            logger.info("Override created: Leave %s, Date %s, Time %s-%s", driver_leave_id, override_date, start_time, end_time)
 
             # Send notification to driver about the override
             try:
@@ -117,14 +117,14 @@ class LeaveOverrideService:
                         body=notification_body,
                         data=notification_data
                     )
-                    logger.info(f"Notification sent to driver {driver.id} about override {override.id}")
+                    logger.info("Notification sent to driver %s about override %s", driver.id, override.id)
             except Exception as notification_error:
-                logger.warning(f"Failed to send notification to driver: {notification_error}")
+                logger.warning("Failed to send notification to driver: %s", notification_error)
 
             return override
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error creating leave override: {e}")
+            logger.error("Error creating leave override: %s", e)
             raise ServiceError(f"Failed to create override: {str(e)}")
 
     @staticmethod
@@ -162,15 +162,15 @@ class LeaveOverrideService:
             # Get the driver from the leave
             driver_leave = override.driver_leave
             if not driver_leave:
-                logger.warning(f"Override {override.id} has no associated driver_leave")
+                logger.warning("Override %s has no associated driver_leave", override.id)
                 return []
 
             driver_id = driver_leave.driver_id
             override_date = str(override.override_date)  # Ensure it's a string for comparison
 
-            logger.info(f"Checking affected jobs for override {override.id}")
-            logger.info(f"   Driver ID: {driver_id}, Date: {override_date}")
-            logger.info(f"   Time window: {override.start_time} - {override.end_time}")
+            logger.info("Checking affected jobs for override %s", override.id)
+            logger.info("   Driver ID: %s, Date: %s", driver_id, override_date)
+            logger.info("   Time window: %s - %s", override.start_time, override.end_time)
 
             # Find jobs assigned to this driver on the override date within the time window
             affected_jobs = Job.query.filter(
@@ -179,7 +179,7 @@ class LeaveOverrideService:
                 Job.is_deleted == False
             ).all()
 
-            logger.info(f"   Found {len(affected_jobs)} total jobs for driver {driver_id} on {override_date}")
+            logger.info("   Found %s total jobs for driver %s on %s", len(affected_jobs), driver_id, override_date)
 
             # Helper function to parse time from multiple formats
             def parse_time_flexible(time_value):
@@ -210,7 +210,7 @@ class LeaveOverrideService:
             for job in affected_jobs:
                 try:
                     if not job.pickup_time:
-                        logger.debug(f"   Job {job.id}: No pickup_time set - SKIPPED")
+                        logger.debug("   Job %s: No pickup_time set - SKIPPED", job.id)
                         continue
 
                     # Convert time objects to comparable format using flexible parser
@@ -218,23 +218,23 @@ class LeaveOverrideService:
                     override_start = parse_time_flexible(override.start_time)
                     override_end = parse_time_flexible(override.end_time)
 
-                    logger.info(f"   Job {job.id}: pickup_time={job_time}, override={override_start}-{override_end}")
+                    logger.info("   Job %s: pickup_time=%s, override=%s-%s", job.id, job_time, override_start, override_end)
 
                     # Check if job time falls within override window (inclusive of both start and end)
                     if override_start <= job_time <= override_end:
                         jobs_in_window.append(job)
-                        logger.info(f"   [AFFECTED] Job {job.id} is affected")
+                        logger.info("   [AFFECTED] Job %s is affected", job.id)
                     else:
-                        logger.debug(f"   ✗ Job {job.id} is outside window")
+                        logger.debug("   ✗ Job %s is outside window", job.id)
 
                 except Exception as time_error:
-                    logger.error(f"   Error parsing times for job {job.id}: {time_error}", exc_info=True)
+                    logger.error("   Error parsing times for job %s: %s", job.id, time_error, exc_info=True)
 
-            logger.info(f"[SUCCESS] Override {override.id} affects {len(jobs_in_window)} jobs")
+            logger.info("[SUCCESS] Override %s affects %s jobs", override.id, len(jobs_in_window))
             return jobs_in_window
 
         except Exception as e:
-            logger.error(f"[ERROR] Error getting affected jobs for override {override.id}: {e}", exc_info=True)
+            logger.error("[ERROR] Error getting affected jobs for override %s: %s", override.id, e, exc_info=True)
             return []
 
     @staticmethod
@@ -266,7 +266,7 @@ class LeaveOverrideService:
             override.is_deleted = True
             override.updated_at = datetime.now(timezone.utc)
             db.session.commit()
-            logger.info(f"Override {override_id} deleted. {len(affected_jobs)} job(s) affected.")
+            logger.info("Override %s deleted. %s job(s) affected.", override_id, len(affected_jobs))
 
             return {
                 'success': True,
@@ -274,7 +274,7 @@ class LeaveOverrideService:
             }
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting override {override_id}: {e}")
+            logger.error("Error deleting override %s: %s", override_id, e)
             raise ServiceError(f"Failed to delete override: {str(e)}")
 
     @staticmethod
@@ -290,12 +290,12 @@ class LeaveOverrideService:
 
             if count > 0:
                 db.session.commit()
-                logger.info(f"Deleted {count} overrides for leave {driver_leave_id}")
+                logger.info("Deleted %s overrides for leave %s", count, driver_leave_id)
 
             return count
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error deleting overrides for leave {driver_leave_id}: {e}")
+            logger.error("Error deleting overrides for leave %s: %s", driver_leave_id, e)
             raise ServiceError(f"Failed to delete overrides: {str(e)}")
 
     @staticmethod
@@ -318,8 +318,7 @@ class LeaveOverrideService:
         # Log if duplicates were removed
         if len(unique_leave_ids) != len(driver_leave_ids):
             logger.warning(
-                f"Duplicate leave IDs removed from bulk request. Original: {len(driver_leave_ids)}, "
-                f"Unique: {len(unique_leave_ids)}"
+                "Duplicate leave IDs removed from bulk request. Original: %s, Unique: %s", len(driver_leave_ids), len(unique_leave_ids)
             )
 
         if len(unique_leave_ids) > 100:
@@ -344,7 +343,7 @@ class LeaveOverrideService:
                     'driver_leave_id': leave_id,
                     'error': e.message
                 })
-                logger.warning(f"Failed to create override for leave {leave_id}: {e.message}")
+                logger.warning("Failed to create override for leave %s: %s", leave_id, e.message)
 
         return {
             'success': success,
@@ -40,12 +40,12 @@ def init_login_security(app):
             if hasattr(user, 'unlock_if_expired'):
                 if user.unlock_if_expired():
                     db.session.commit()
-                    logger.info(f"Account lock expired and removed for: {email}")
+                    logger.info("Account lock expired and removed for: %s", email)
 
             # Check if account is still locked
             if hasattr(user, 'is_account_locked') and user.is_account_locked():
                 locked_until = user.locked_until.strftime('%Y-%m-%d %H:%M:%S') if user.locked_until else 'unknown'
-                logger.warning(f"Blocked login attempt for locked account: {email} (locked until: {locked_until})")
+                logger.warning("Blocked login attempt for locked account: %s (locked until: %s)", email, locked_until)
 
                 return jsonify({
                     'response': {
@@ -64,9 +64,9 @@ def init_login_security(app):
             if hasattr(user, 'reset_failed_login_attempts'):
                 user.reset_failed_login_attempts()
                 db.session.commit()
-                logger.info(f"User {user.email} logged in successfully. Reset failed login attempts.")
+                logger.info("User %s logged in successfully. Reset failed login attempts.", user.email)
         except Exception as e:
-            logger.error(f"Error resetting failed login attempts: {e}")
+            logger.error("Error resetting failed login attempts: %s", e)
             db.session.rollback()
 
     @app.after_request
@@ -98,18 +98,18 @@ def init_login_security(app):
             user = User.query.filter_by(email=email).first()
             if not user:
                 # Don't reveal if user exists or not (security best practice)
-                logger.warning(f"Failed login attempt for non-existent user: {email}")
+                logger.warning("Failed login attempt for non-existent user: %s", email)
                 return response
 
             # Try to unlock if lock has expired before recording failed attempt
             if hasattr(user, 'unlock_if_expired'):
                 if user.unlock_if_expired():
                     db.session.commit()
-                    logger.info(f"Account lock expired and removed for: {email}")
+                    logger.info("Account lock expired and removed for: %s", email)
 
             # Check if account is still locked
             if hasattr(user, 'is_account_locked') and user.is_account_locked():
-                logger.warning(f"Login attempt for locked account: {email}")
+                logger.warning("Login attempt for locked account: %s", email)
                 return response
 
             # Record failed login attempt
@@ -118,16 +118,15 @@ def init_login_security(app):
                 db.session.commit()
 
                 logger.warning(
-                    f"Failed login attempt for {email}. "
-                    f"Attempts: {user.failed_login_attempts}/5"
+                    "Failed login attempt for %s. Attempts: %s/5", email, user.failed_login_attempts
                 )
 
                 # Check if account just got locked
                 if user.is_account_locked():
-                    logger.error(f"Account locked for {email} due to multiple failed login attempts")
+                    logger.error("Account locked for %s due to multiple failed login attempts", email)
 
         except Exception as e:
-            logger.error(f"Error recording failed login attempt: {e}")
+            logger.error("Error recording failed login attempt: %s", e)
             db.session.rollback()
 
         return response
@@ -23,7 +23,7 @@ def get_address_from_postal_code(postal_code: str, country: str = "Singapore") -
         Address string if found, None otherwise
     """
     if country.lower() != 'singapore':
-        logger.warning(f"Country '{country}' not supported, only Singapore is supported")
+        logger.warning("Country '%s' not supported, only Singapore is supported", country)
         return None
 
     url = "https://www.onemap.gov.sg/api/common/elastic/search"
@@ -36,21 +36,21 @@ def get_address_from_postal_code(postal_code: str, country: str = "Singapore") -
     }
 
     try:
-        logger.debug(f"Calling OneMap API for postal code: {postal_code}")
+        logger.debug("Calling OneMap API for postal code: %s", postal_code)
         response = requests.get(url, params=params, timeout=10)
         response.raise_for_status()
         result = response.json()
 
-        logger.debug(f"OneMap API response: found={result.get('found', 0)}")
+        logger.debug("OneMap API response: found=%s", result.get('found', 0))
 
         if result.get('found', 0) > 0 and result.get('results'):
             address = result['results'][0].get('ADDRESS')
-            logger.info(f"OneMap API found address for {postal_code}: {address}")
+            logger.info("OneMap API found address for %s: %s", postal_code, address)
             return address
 
-        logger.warning(f"OneMap API returned no results for postal code: {postal_code}")
+        logger.warning("OneMap API returned no results for postal code: %s", postal_code)
         return None
 
     except Exception as e:
-        logger.error(f"OneMap API error for postal code {postal_code}: {str(e)}")
+        logger.error("OneMap API error for postal code %s: %s", postal_code, str(e))
         return None
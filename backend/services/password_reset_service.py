@@ -78,12 +78,12 @@ def get_admin_email_settings() -> Dict[str, Any]:
                         decrypted_password = f.decrypt(password.encode()).decode()
                         password = decrypted_password
                     except Exception as decrypt_error:
-                        logging.error(f"Password decryption failed: {decrypt_error}")
+                        logging.error("Password decryption failed: %s", decrypt_error)
                         raise ValueError("Email password decryption failed. Please reconfigure email settings in the admin panel.")
             except ValueError:
                 raise
             except Exception as e:
-                logging.error(f"Error processing email password: {e}")
+                logging.error("Error processing email password: %s", e)
                 raise ValueError("Error processing email password. Please reconfigure email settings in the admin panel.")
 
         # Validate required fields
@@ -107,7 +107,7 @@ def get_admin_email_settings() -> Dict[str, Any]:
     except ValueError:
         raise
     except Exception as e:
-        logging.error(f"Error fetching admin panel email settings: {e}")
+        logging.error("Error fetching admin panel email settings: %s", e)
         raise ValueError("Unable to fetch email settings. Please configure email settings in the admin panel.")
 
 
@@ -142,11 +142,11 @@ class PasswordResetService:
             # For security reasons, always return success even if user doesn't exist
             # This prevents email enumeration attacks
             if not user:
-                logging.warning(f"Password reset requested for non-existent email: {email}")
+                logging.warning("Password reset requested for non-existent email: %s", email)
                 return True
             
             if not user.active:
-                logging.warning(f"Password reset requested for inactive user: {email}")
+                logging.warning("Password reset requested for inactive user: %s", email)
                 return True
             
             # Clean up any existing tokens for this user
@@ -170,13 +170,13 @@ class PasswordResetService:
                 email_sent = PasswordResetService._send_reset_email_threaded(user, reset_link)
                 
                 if not email_sent:
-                    logging.warning(f"Email failed but token persisted for debugging: {raw_token}")
+                    logging.warning("Email failed but token persisted for debugging: %s", raw_token)
                     # For development, we can still return True to allow testing
                     # In production, you might want to handle this differently
                 else:
-                    logging.info(f"Password reset email sent successfully to {email}")
+                    logging.info("Password reset email sent successfully to %s", email)
             except Exception as email_error:
-                logging.error(f"Email error, token remains valid: {email_error}", exc_info=True)
+                logging.error("Email error, token remains valid: %s", email_error, exc_info=True)
             
             # Always return True for security reasons (prevent email enumeration)
             # But for development/debugging, we can log the actual status
@@ -188,7 +188,7 @@ class PasswordResetService:
             # Only rollback if there's an error before token commit
             # If we reach here, it's likely a validation or database error before commit
             db.session.rollback()
-            logging.error(f"Error in request_password_reset: {e}", exc_info=True)
+            logging.error("Error in request_password_reset: %s", e, exc_info=True)
             raise PasswordResetError("Unable to process password reset request. Please try again later.", 500)
     
     @staticmethod
@@ -247,21 +247,21 @@ class PasswordResetService:
             db.session.commit()
 
             # Send password reset confirmation email
-            logging.info(f"Attempting to send password reset confirmation email to {user.email}")
+            logging.info("Attempting to send password reset confirmation email to %s", user.email)
             email_sent = PasswordResetService._send_password_reset_confirmation_email(user)
             if email_sent:
-                logging.info(f"Password reset confirmation email sent successfully to {user.email}")
+                logging.info("Password reset confirmation email sent successfully to %s", user.email)
             else:
-                logging.error(f"Failed to send password reset confirmation email to {user.email}")
+                logging.error("Failed to send password reset confirmation email to %s", user.email)
 
-            logging.info(f"Password reset successful for user {user.email}")
+            logging.info("Password reset successful for user %s", user.email)
             return True
             
         except PasswordResetError:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error in reset_password_with_token: {e}", exc_info=True)
+            logging.error("Error in reset_password_with_token: %s", e, exc_info=True)
             raise PasswordResetError("Unable to reset password. Please try again later.", 500)
     
     @staticmethod
@@ -321,14 +321,14 @@ class PasswordResetService:
             # Send password change confirmation email
             PasswordResetService._send_password_change_confirmation_email(user)
             
-            logging.info(f"Password changed successfully for user {user.email}")
+            logging.info("Password changed successfully for user %s", user.email)
             return True
             
         except PasswordResetError:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error in change_password: {e}", exc_info=True)
+            logging.error("Error in change_password: %s", e, exc_info=True)
             raise PasswordResetError("Unable to change password. Please try again later.", 500)
     
     @staticmethod
@@ -387,14 +387,14 @@ class PasswordResetService:
             # Send password change confirmation email
             PasswordResetService._send_password_change_confirmation_email(user)
             
-            logging.info(f"Password changed successfully for user {user.email} by admin")
+            logging.info("Password changed successfully for user %s by admin", user.email)
             return True
             
         except PasswordResetError:
             raise
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error in admin_change_password: {e}", exc_info=True)
+            logging.error("Error in admin_change_password: %s", e, exc_info=True)
             raise PasswordResetError("Unable to change password. Please try again later.", 500)
     
     @staticmethod
@@ -408,11 +408,11 @@ class PasswordResetService:
         try:
             count = PasswordResetToken.cleanup_expired_tokens()
             db.session.commit()
-            logging.info(f"Cleaned up {count} expired password reset tokens")
+            logging.info("Cleaned up %s expired password reset tokens", count)
             return count
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error cleaning up expired tokens: {e}", exc_info=True)
+            logging.error("Error cleaning up expired tokens: %s", e, exc_info=True)
             return 0
 
     @staticmethod
@@ -433,7 +433,7 @@ class PasswordResetService:
             mail_sender = email_config['sender_email']
         except ValueError as e:
             # Email settings not configured
-            logging.error(f"Email configuration error: {str(e)}")
+            logging.error("Email configuration error: %s", str(e))
             return False
 
         # Capture user email as string to avoid Flask context issues
@@ -448,10 +448,10 @@ class PasswordResetService:
                 general_settings = prefs.get('general_settings', {})
                 company_name = general_settings.get('company_name', '{company_name}')
         except Exception as e:
-            logging.warning(f"Could not fetch company name from settings: {e}")
+            logging.warning("Could not fetch company name from settings: %s", e)
 
         # Debug: Log email config (without password)
-        logging.info(f"Using admin panel email config - Server: {smtp_server}, Port: {smtp_port}, Sender: {mail_sender}")
+        logging.info("Using admin panel email config - Server: %s, Port: %s, Sender: %s", smtp_server, smtp_port, mail_sender)
 
         def send_reset_email_worker(user_email, reset_link, smtp_server, smtp_port, use_tls, use_ssl, smtp_username, smtp_password, mail_sender, company_name):
             """Worker function that runs in background thread"""
@@ -626,7 +626,7 @@ Please do not reply to this email.
 
             except Exception as e:
                 # Log the error and return False
-                logging.error(f"Password reset email error: {str(e)}")
+                logging.error("Password reset email error: %s", str(e))
                 return False
 
         # Submit the email sending task to the thread pool executor
@@ -641,7 +641,7 @@ Please do not reply to this email.
             logging.error("Password reset email sending timeout after 30 seconds")
             return False
         except Exception as e:
-            logging.error(f"Password reset email sending failed: {str(e)}")
+            logging.error("Password reset email sending failed: %s", str(e))
             return False
 
     @staticmethod
@@ -662,7 +662,7 @@ Please do not reply to this email.
             smtp_password = email_config['password']
             mail_sender = email_config['sender_email']
 
-            logging.info(f"Email config - SMTP: {smtp_server}:{smtp_port}, User: {smtp_username}, Sender: {mail_sender}")
+            logging.info("Email config - SMTP: %s:%s, User: %s, Sender: %s", smtp_server, smtp_port, smtp_username, mail_sender)
 
             # Capture user email as string to avoid Flask context issues
             user_email = user.email
@@ -676,7 +676,7 @@ Please do not reply to this email.
                     general_settings = prefs.get('general_settings', {})
                     company_name = general_settings.get('company_name', 'FleetWise')
             except Exception as e:
-                logging.warning(f"Could not fetch company name from settings: {e}")
+                logging.warning("Could not fetch company name from settings: %s", e)
 
             def send_confirmation_email_worker(user_email, smtp_server, smtp_port, use_tls, use_ssl, smtp_username, smtp_password, mail_sender, company_name):
                 """Worker function that runs in background thread using only Zoho"""
@@ -858,7 +858,7 @@ If you believe this email was sent in error, please contact our support team imm
                             return True
 
                 except Exception as e:
-                    logging.warning(f"Password reset confirmation email error: {str(e)}")
+                    logging.warning("Password reset confirmation email error: %s", str(e))
                     return False
 
             # Submit the email sending task to the thread pool executor
@@ -873,15 +873,15 @@ If you believe this email was sent in error, please contact our support team imm
                 logging.error("Password reset confirmation email sending timeout after 30 seconds")
                 return False
             except Exception as e:
-                logging.error(f"Password reset confirmation email sending failed: {str(e)}")
+                logging.error("Password reset confirmation email sending failed: %s", str(e))
                 return False
 
         except ValueError as e:
             # Email settings not configured
-            logging.error(f"Email configuration error: {str(e)}")
+            logging.error("Email configuration error: %s", str(e))
             return False
         except Exception as e:
-            logging.error(f"Error in _send_password_reset_confirmation_email: {e}", exc_info=True)
+            logging.error("Error in _send_password_reset_confirmation_email: %s", e, exc_info=True)
             return False
     
     @staticmethod
@@ -1065,7 +1065,7 @@ If you believe this email was sent in error, please contact our support team imm
                             return not bool(result)  # Empty dict means success
 
                 except Exception as e:
-                    logging.warning(f"Password change confirmation email error: {str(e)}")
+                    logging.warning("Password change confirmation email error: %s", str(e))
                     return False
 
             # Submit the email sending task to the thread pool executor
@@ -1080,13 +1080,13 @@ If you believe this email was sent in error, please contact our support team imm
                 logging.error("Password change confirmation email sending timeout after 30 seconds")
                 return False
             except Exception as e:
-                logging.error(f"Password change confirmation email sending failed: {str(e)}")
+                logging.error("Password change confirmation email sending failed: %s", str(e))
                 return False
 
         except ValueError as e:
             # Email settings not configured
-            logging.error(f"Email configuration error: {str(e)}")
+            logging.error("Email configuration error: %s", str(e))
             return False
         except Exception as e:
-            logging.error(f"Error in _send_password_change_confirmation_email: {e}", exc_info=True)
+            logging.error("Error in _send_password_change_confirmation_email: %s", e, exc_info=True)
             return False
\ No newline at end of file
@@ -54,9 +54,9 @@ class PhotoBackupService:
         """Ensure storage root directory exists"""
         try:
             self.storage_root.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Photo storage root initialized: {self.storage_root}")
+            logger.info("Photo storage root initialized: %s", self.storage_root)
         except Exception as e:
-            logger.error(f"Failed to create storage root: {e}")
+            logger.error("Failed to create storage root: %s", e)
             raise PhotoBackupError(f"Cannot create storage directory: {str(e)}")
 
     def get_date_based_directory(self) -> Path:
@@ -83,7 +83,7 @@ class PhotoBackupService:
         try:
             backup_path.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            logger.error(f"Failed to create backup directory {backup_path}: {e}")
+            logger.error("Failed to create backup directory %s: %s", backup_path, e)
             raise PhotoBackupError(f"Cannot create backup directory: {str(e)}")
 
     def validate_file_size(self, file_path: str) -> bool:
@@ -99,14 +99,14 @@ class PhotoBackupService:
         try:
             file_size = os.path.getsize(file_path)
             if file_size > MAX_PHOTO_SIZE:
-                logger.error(f"File too large: {file_path} ({file_size} bytes > {MAX_PHOTO_SIZE} bytes)")
+                logger.error("File too large: %s (%s bytes > %s bytes)", file_path, file_size, MAX_PHOTO_SIZE)
                 return False
             if file_size == 0:
-                logger.error(f"File is empty: {file_path}")
+                logger.error("File is empty: %s", file_path)
                 return False
             return True
         except Exception as e:
-            logger.error(f"Failed to validate file size for {file_path}: {e}")
+            logger.error("Failed to validate file size for %s: %s", file_path, e)
             return False
     
     def calculate_file_hash(self, file_path: str) -> str:
@@ -123,27 +123,22 @@ class PhotoBackupService:
             PhotoBackupError: If hash calculation fails
         """
         try:
-            md5_hash = hashlib.md5()
-            file_size = os.path.getsize(file_path)
-            bytes_processed = 0
             start_time = time.time()
             
             with open(file_path, 'rb') as f:
-                while chunk := f.read(CHUNK_SIZE):
-                    md5_hash.update(chunk)
-                    bytes_processed += len(chunk)
-                    
-                    # Log progress for large files
-                    if file_size > 5 * 1024 * 1024:  # > 5MB
-                        progress = (bytes_processed / file_size) * 100
-                        if progress % 20 < (CHUNK_SIZE / file_size) * 100:  # Log every ~20%
-                            logger.debug(f"Hashing progress: {progress:.1f}% ({bytes_processed}/{file_size} bytes)")
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: hashes via readinto() on one reusable buffer
+                    md5_hash = hashlib.file_digest(f, 'md5')
+                else:
+                    md5_hash = hashlib.md5()
+                    while chunk := f.read(CHUNK_SIZE):
+                        md5_hash.update(chunk)
             
             duration = time.time() - start_time
-            logger.debug(f"File hashing completed in {duration:.2f}s ({file_size} bytes)")
+            logger.debug("File hashing completed in %.2fs (%s)", duration, file_path)
             return md5_hash.hexdigest()
         except Exception as e:
-            logger.error(f"Failed to calculate hash for {file_path}: {e}")
+            logger.error("Failed to calculate hash for %s: %s", file_path, e)
             raise PhotoBackupError(f"Cannot calculate file hash: {str(e)}")
 
     def generate_idempotent_filename(self, source_hash: str, original_filename: str) -> str:
@@ -189,7 +184,8 @@ class PhotoBackupService:
         file_path = backup_dir / hash_filename
         return file_path.exists()
 
-    def backup_photo(self, source_file_path: str, filename: str) -> Tuple[bool, str, Optional[str]]:
+    def backup_photo(self, source_file_path: str, filename: str,
+                     source_hash: Optional[str] = None) -> Tuple[bool, str, Optional[str], bool]:
         """
         Backup a photo to fleetwise-storage with O(1) idempotent deduplication.
 
@@ -209,12 +205,15 @@ class PhotoBackupService:
         Args:
             source_file_path: Full path to source photo file
             filename: Original filename for extension extraction
+            source_hash: MD5 hex digest of the source content, if the caller
+                already has it; skips re-reading the file to hash it
 
         Returns:
-            Tuple of (success: bool, relative_path: str, error_message: Optional[str])
+            Tuple of (success: bool, relative_path: str, error_message: Optional[str], created: bool)
             - success: True if backup completed successfully
             - relative_path: Path relative to storage root (e.g., "images/2025/11/07/a38e8cb199cbad04.jpg")
             - error_message: Error description if success is False
+            - created: True if this call wrote the backup file, False if it already existed
         """
         temp_file_path = None
         try:
@@ -223,22 +222,23 @@ class PhotoBackupService:
             if not source_path.exists():
                 error_msg = f"Source file does not exist: {source_file_path}"
                 logger.error(error_msg)
-                return False, "", error_msg
+                return False, "", error_msg, False
                 
             # Validate file size
             if not self.validate_file_size(source_file_path):
                 error_msg = f"Source file size validation failed: {source_file_path}"
                 logger.error(error_msg)
-                return False, "", error_msg
+                return False, "", error_msg, False
 
             # Step 2: Calculate hash of source file for idempotent naming
-            source_hash = self.calculate_file_hash(source_file_path)
-            logger.info(f"Source file hash: {source_hash}")
+            if source_hash is None:
+                source_hash = self.calculate_file_hash(source_file_path)
+            logger.info("Source file hash: %s", source_hash)
 
             # Step 3: Generate idempotent filename using hash prefix
             # This ensures same content always maps to same filename
             hash_filename = self.generate_idempotent_filename(source_hash, filename)
-            logger.info(f"Idempotent filename: {hash_filename}")
+            logger.info("Idempotent filename: %s", hash_filename)
 
             # Step 4: Generate date-based backup directory
             backup_dir = self.get_date_based_directory()
@@ -249,8 +249,8 @@ class PhotoBackupService:
             backup_file_path = backup_dir / hash_filename
             if backup_file_path.exists():
                 relative_path = f"images/{backup_dir.relative_to(self.storage_root)}/{hash_filename}"
-                logger.info(f"Photo already backed up (idempotent): {relative_path}")
-                return True, relative_path, None
+                logger.info("Photo already backed up (idempotent): %s", relative_path)
+                return True, relative_path, None, False
 
             # Step 6: Copy file to backup directory with streaming
             try:
@@ -267,13 +267,13 @@ class PhotoBackupService:
                         if file_size > 5 * 1024 * 1024:  # > 5MB
                             progress = (bytes_copied / file_size) * 100
                             if progress % 20 < (CHUNK_SIZE / file_size) * 100:  # Log every ~20%
-                                logger.debug(f"Copy progress: {progress:.1f}% ({bytes_copied}/{file_size} bytes)")
+                                logger.debug("Copy progress: %.1f%% (%s/%s bytes)", progress, bytes_copied, file_size)
                 
                 # Preserve metadata
                 shutil.copystat(source_file_path, str(backup_file_path))
                 
                 duration = time.time() - start_time
-                logger.info(f"Photo copied to backup: {backup_file_path} ({duration:.2f}s, {file_size} bytes)")
+                logger.info("Photo copied to backup: %s (%.2fs, %s bytes)", backup_file_path, duration, file_size)
                 
             except Exception as e:
                 error_msg = f"Failed to copy file to backup: {str(e)}"
@@ -282,10 +282,10 @@ class PhotoBackupService:
                 try:
                     if backup_file_path.exists():
                         backup_file_path.unlink()
-                        logger.info(f"Cleaned up partial backup file: {backup_file_path}")
+                        logger.info("Cleaned up partial backup file: %s", backup_file_path)
                 except Exception as cleanup_error:
-                    logger.error(f"Failed to cleanup partial backup: {cleanup_error}")
-                return False, "", error_msg
+                    logger.error("Failed to cleanup partial backup: %s", cleanup_error)
+                return False, "", error_msg, False
 
             # Step 7: Verify backup integrity (compare hashes)
             # Critical check to ensure no corruption during copy
@@ -294,22 +294,22 @@ class PhotoBackupService:
                 # Backup corrupted - cleanup and fail
                 try:
                     backup_file_path.unlink()
-                    logger.warning(f"Cleaned up corrupted backup: {backup_file_path}")
+                    logger.warning("Cleaned up corrupted backup: %s", backup_file_path)
                 except Exception as cleanup_error:
-                    logger.error(f"Failed to cleanup corrupted backup: {cleanup_error}")
+                    logger.error("Failed to cleanup corrupted backup: %s", cleanup_error)
 
                 error_msg = "Backup verification failed: hash mismatch"
                 logger.error(error_msg)
-                return False, "", error_msg
+                return False, "", error_msg, False
 
             # Step 8: Success - return relative path for database storage
             relative_path = f"images/{backup_dir.relative_to(self.storage_root)}/{hash_filename}"
-            logger.info(f"Photo backup successful: {relative_path}")
-            return True, relative_path, None
+            logger.info("Photo backup successful: %s", relative_path)
+            return True, relative_path, None, True
 
         except PhotoBackupError as e:
-            logger.error(f"Backup error: {str(e)}")
-            return False, "", str(e)
+            logger.error("Backup error: %s", str(e))
+            return False, "", str(e), False
         except Exception as e:
             error_msg = f"Unexpected error during photo backup: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -317,10 +317,26 @@ class PhotoBackupService:
             try:
                 if 'backup_file_path' in locals() and backup_file_path.exists():
                     backup_file_path.unlink()
-                    logger.info(f"Cleaned up backup file after error: {backup_file_path}")
+                    logger.info("Cleaned up backup file after error: %s", backup_file_path)
             except Exception as cleanup_error:
-                logger.error(f"Failed to cleanup after error: {cleanup_error}")
-            return False, "", error_msg
+                logger.error("Failed to cleanup after error: %s", cleanup_error)
+            return False, "", error_msg, False
+
+    def remove_backup(self, relative_path: str) -> bool:
+        """
+        Delete a backup file by the relative path returned from backup_photo.
+
+        Args:
+            relative_path: Path as stored in JobPhoto.file_path (e.g., "images/2025/11/07/a38e8cb199cbad04.jpg")
+
+        Returns:
+            True if the file was removed (or was already gone), False otherwise
+        """
+        # backup_photo prefixes paths relative to the storage root with "images/"
+        relative = Path(relative_path)
+        if relative.parts and relative.parts[0] == "images":
+            relative = Path(*relative.parts[1:])
+        return self.cleanup_temporary_file(str(self.storage_root / relative))
 
     def cleanup_temporary_file(self, file_path: str) -> bool:
         """
@@ -337,23 +353,23 @@ class PhotoBackupService:
             if temp_path.exists():
                 # Check if file is writable before attempting deletion
                 if not os.access(file_path, os.W_OK):
-                    logger.warning(f"Cannot delete readonly file: {file_path}")
+                    logger.warning("Cannot delete readonly file: %s", file_path)
                     return False
                     
                 # Get file size for logging
                 file_size = temp_path.stat().st_size
                 temp_path.unlink()
-                logger.info(f"Cleaned up temporary file: {file_path} ({file_size} bytes)")
+                logger.info("Cleaned up temporary file: %s (%s bytes)", file_path, file_size)
                 return True
             else:
-                logger.debug(f"Temporary file not found (already deleted): {file_path}")
+                logger.debug("Temporary file not found (already deleted): %s", file_path)
                 return True
         except PermissionError as e:
-            logger.warning(f"Permission denied when deleting temporary file {file_path}: {e}")
+            logger.warning("Permission denied when deleting temporary file %s: %s", file_path, e)
             return False
         except OSError as e:
-            logger.warning(f"OS error when deleting temporary file {file_path}: {e}")
+            logger.warning("OS error when deleting temporary file %s: %s", file_path, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error during temporary file cleanup {file_path}: {e}", exc_info=True)
+            logger.error("Unexpected error during temporary file cleanup %s: %s", file_path, e, exc_info=True)
             return False
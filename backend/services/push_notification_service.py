@@ -16,7 +16,7 @@ try:
     else:
         logger.info("Firebase features disabled - mobile notifications unavailable")
 except ImportError as e:
-    logger.warning(f"Firebase not available: {e}")
+    logger.warning("Firebase not available: %s", e)
     FIREBASE_AVAILABLE = False
     messaging = None
 
@@ -50,11 +50,11 @@ class PushNotificationService:
             
             # Send the message
             response = messaging.send(message)
-            logger.info(f"FCM Notification sent successfully: {response}")
+            logger.info("FCM Notification sent successfully: %s", response)
             return True
             
         except Exception as e:
-            logger.error(f"Error sending notification to token {token[:10]}...: {e}", exc_info=True)
+            logger.error("Error sending notification to token %s...: %s", token[:10], e, exc_info=True)
             return False
     
     @staticmethod
@@ -77,7 +77,7 @@ class PushNotificationService:
             else:
                 failure_count += 1
                 
-        logger.info(f"Batch notification completed: {success_count} success, {failure_count} failure")
+        logger.info("Batch notification completed: %s success, %s failure", success_count, failure_count)
         return {"success": success_count, "failure": failure_count}
     
     @staticmethod
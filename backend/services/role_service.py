@@ -1,6 +1,7 @@
 import logging
 from backend.extensions import db
 from backend.models.role import Role
+from backend.services.user_service import UserService
 
 class ServiceError(Exception):
     def __init__(self, message):
@@ -13,7 +14,7 @@ class RoleService:
         try:
             return Role.query.all()
         except Exception as e:
-            logging.error(f"Error fetching roles: {e}", exc_info=True)
+            logging.error("Error fetching roles: %s", e, exc_info=True)
             raise ServiceError("Could not fetch roles. Please try again later.")
 
     @staticmethod
@@ -21,7 +22,7 @@ class RoleService:
         try:
             return Role.query.get(role_id)
         except Exception as e:
-            logging.error(f"Error fetching role: {e}", exc_info=True)
+            logging.error("Error fetching role: %s", e, exc_info=True)
             raise ServiceError("Could not fetch role. Please try again later.")
 
     @staticmethod
@@ -30,10 +31,11 @@ class RoleService:
             role = Role(**data)
             db.session.add(role)
             db.session.commit()
+            UserService._invalidate_role_cache()
             return role
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating role: {e}", exc_info=True)
+            logging.error("Error creating role: %s", e, exc_info=True)
             raise ServiceError("Could not create role. Please try again later.")
 
     @staticmethod
@@ -45,10 +47,11 @@ class RoleService:
             for key, value in data.items():
                 setattr(role, key, value)
             db.session.commit()
+            UserService._invalidate_role_cache()
             return role
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating role: {e}", exc_info=True)
+            logging.error("Error updating role: %s", e, exc_info=True)
             raise ServiceError("Could not update role. Please try again later.")
 
     @staticmethod
@@ -59,8 +62,9 @@ class RoleService:
                 return False
             db.session.delete(role)
             db.session.commit()
+            UserService._invalidate_role_cache()
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting role: {e}", exc_info=True)
+            logging.error("Error deleting role: %s", e, exc_info=True)
             raise ServiceError("Could not delete role. Please try again later.") 
\ No newline at end of file
@@ -31,7 +31,7 @@ class SchedulerService:
             
             self.job_stats[job_id]['executions'] += 1
             self.job_stats[job_id]['last_run'] = datetime.now()
-            logger.info(f"Job {job_id} executed successfully")
+            logger.info("Job %s executed successfully", job_id)
             
         def job_error(event):
             job_id = event.job_id
@@ -40,11 +40,11 @@ class SchedulerService:
             
             self.job_stats[job_id]['errors'] += 1
             self.job_stats[job_id]['last_run'] = datetime.now()
-            logger.error(f"Job {job_id} failed: {event.exception}")
+            logger.error("Job %s failed: %s", job_id, event.exception)
             
         def job_missed(event):
             job_id = event.job_id
-            logger.warning(f"Job {job_id} was missed at {event.scheduled_run_time}")
+            logger.warning("Job %s was missed at %s", job_id, event.scheduled_run_time)
             
         self.scheduler.add_listener(job_executed, EVENT_JOB_EXECUTED)
         self.scheduler.add_listener(job_error, EVENT_JOB_ERROR)
@@ -72,7 +72,7 @@ class SchedulerService:
             name='Monitor jobs that are overdue to start',
             replace_existing=True
         )
-        logger.info(f"Scheduled job: Job monitoring every {trigger_interval} minutes (from system settings)")
+        logger.info("Scheduled job: Job monitoring every %s minutes (from system settings)", trigger_interval)
         
         # Run alert cleanup daily at 3:00 AM (clear alerts older than 24 hours)
         self.scheduler.add_job(
@@ -94,13 +94,13 @@ class SchedulerService:
                 logger.info("App context acquired, attempting to load monitoring settings...")
                 from backend.api.job_monitoring import get_monitoring_settings_from_db
                 settings = get_monitoring_settings_from_db()
-                logger.info(f"Raw settings from DB: {settings}")
+                logger.info("Raw settings from DB: %s", settings)
                 interval = settings.get('trigger_frequency_minutes', 10)
-                logger.info(f"Extracted trigger interval: {interval} minutes")
-                logger.info(f"Full settings loaded: {settings}")
+                logger.info("Extracted trigger interval: %s minutes", interval)
+                logger.info("Full settings loaded: %s", settings)
                 return interval
         except Exception as e:
-            logger.warning(f"Could not load monitoring settings, using default interval (10 min): {e}")
+            logger.warning("Could not load monitoring settings, using default interval (10 min): %s", e)
             logger.exception("Exception details:")
             return 10
 
@@ -125,13 +125,13 @@ class SchedulerService:
                             trigger='interval',
                             minutes=new_interval
                         )
-                        logger.info(f"Rescheduled monitoring job to run every {new_interval} minutes (was {current_minutes})")
+                        logger.info("Rescheduled monitoring job to run every %s minutes (was %s)", new_interval, current_minutes)
                     else:
-                        logger.debug(f"Monitoring job schedule unchanged: still {new_interval} minutes")
+                        logger.debug("Monitoring job schedule unchanged: still %s minutes", new_interval)
                 else:
                     logger.warning("Could not find monitoring job to reschedule")
         except Exception as e:
-            logger.error(f"Error updating monitoring schedule: {e}", exc_info=True)
+            logger.error("Error updating monitoring schedule: %s", e, exc_info=True)
 
     def cleanup_expired_tokens(self):
         """Clean up expired and used password reset tokens with timeout protection"""
@@ -148,13 +148,13 @@ class SchedulerService:
                 
                 count = PasswordResetToken.cleanup_expired_tokens()
                 db.session.commit()
-                logger.info(f"Token cleanup completed: {count} tokens removed")
+                logger.info("Token cleanup completed: %s tokens removed", count)
         except Exception as e:
-            logger.error(f"Token cleanup failed: {e}", exc_info=True)
+            logger.error("Token cleanup failed: %s", e, exc_info=True)
             try:
                 db.session.rollback()
             except Exception as rollback_error:
-                logger.error(f"Token cleanup rollback failed: {rollback_error}", exc_info=True)
+                logger.error("Token cleanup rollback failed: %s", rollback_error, exc_info=True)
 
     def monitor_overdue_jobs(self):
         """Monitor jobs that haven't started within the configured threshold minutes of pickup time with timeout protection"""
@@ -176,8 +176,8 @@ class SchedulerService:
                 settings = get_monitoring_settings_from_db()
                 threshold_minutes = settings.get('pickup_threshold_minutes', 15)
                 
-                logger.info(f"Using pickup threshold: {threshold_minutes} minutes")
-                logger.info(f"Full settings: {settings}")
+                logger.info("Using pickup threshold: %s minutes", threshold_minutes)
+                logger.info("Full settings: %s", settings)
                 
                 # Check if we need to reschedule ourselves based on the trigger frequency setting
                 desired_interval = settings.get('trigger_frequency_minutes', 10)
@@ -187,7 +187,7 @@ class SchedulerService:
                     # Get current interval in minutes
                     current_interval = int(current_job.trigger.interval.total_seconds() / 60)
                     if current_interval != desired_interval:
-                        logger.info(f"Rescheduling monitoring job from {current_interval} to {desired_interval} minutes")
+                        logger.info("Rescheduling monitoring job from %s to %s minutes", current_interval, desired_interval)
                         self.scheduler.reschedule_job(
                             'monitor_overdue_jobs',
                             trigger='interval',
@@ -201,15 +201,15 @@ class SchedulerService:
                 max_reminders = settings.get('max_alert_reminders', 2)
                 reminder_interval = settings.get('reminder_interval_minutes', 10)
                 
-                logger.info(f"Using max reminders: {max_reminders}, reminder interval: {reminder_interval} minutes")
-                logger.info(f"Scheduler trigger frequency: {settings.get('trigger_frequency_minutes', 10)} minutes")
+                logger.info("Using max reminders: %s, reminder interval: %s minutes", max_reminders, reminder_interval)
+                logger.info("Scheduler trigger frequency: %s minutes", settings.get('trigger_frequency_minutes', 10))
                 
-                logger.info(f"Found {len(overdue_jobs)} overdue jobs to process")
+                logger.info("Found %s overdue jobs to process", len(overdue_jobs))
                 
                 for i, job in enumerate(overdue_jobs):
                     # Check for timeout periodically
                     if time.time() - start_time > timeout_seconds:
-                        logger.warning(f"Job monitoring timed out while processing job {i+1}/{len(overdue_jobs)}")
+                        logger.warning("Job monitoring timed out while processing job %s/%s", i + 1, len(overdue_jobs))
                         break
                     
                     # Check if there's already an active alert for this job
@@ -239,25 +239,25 @@ class SchedulerService:
                             if time_since_last_reminder >= reminder_interval:
                                 # Update the alert to increment reminder count
                                 JobMonitoringAlert.create_or_update_alert(job.id, job.driver_id)
-                                logger.info(f"Sent reminder #{existing_alert.reminder_count + 1} for job {job.id} (elapsed: {time_since_last_reminder:.1f} minutes)")
+                                logger.info("Sent reminder #%s for job %s (elapsed: %.1f minutes)", existing_alert.reminder_count + 1, job.id, time_since_last_reminder)
                             else:
-                                logger.info(f"Skipping reminder for job {job.id} - only {time_since_last_reminder:.1f} minutes elapsed, need {reminder_interval} minutes")
+                                logger.info("Skipping reminder for job %s - only %.1f minutes elapsed, need %s minutes", job.id, time_since_last_reminder, reminder_interval)
                         else:
-                            logger.info(f"Max reminders reached for job {job.id}, skipping")
+                            logger.info("Max reminders reached for job %s, skipping", job.id)
                     else:
                         # Create a new alert
                         JobMonitoringAlert.create_or_update_alert(job.id, job.driver_id)
-                        logger.info(f"Created monitoring alert for overdue job {job.id}")
+                        logger.info("Created monitoring alert for overdue job %s", job.id)
                 
                 db.session.commit()
-                logger.info(f"Job monitoring completed: checked {len(overdue_jobs)} jobs")
+                logger.info("Job monitoring completed: checked %s jobs", len(overdue_jobs))
                 logger.info("=== Job monitoring cycle completed ===")
         except Exception as e:
-            logger.error(f"Job monitoring failed: {e}", exc_info=True)
+            logger.error("Job monitoring failed: %s", e, exc_info=True)
             try:
                 db.session.rollback()
             except Exception as rollback_error:
-                logger.error(f"Job monitoring rollback failed: {rollback_error}", exc_info=True)
+                logger.error("Job monitoring rollback failed: %s", rollback_error, exc_info=True)
 
     def cleanup_old_alerts(self):
         """Clean up alerts that are older than 24 hours and have been acknowledged/cleared with timeout protection"""
@@ -296,31 +296,31 @@ class SchedulerService:
                 ).all()
                 
                 count = len(old_alerts)
-                logger.info(f"Found {count} old alerts to clean up")
+                logger.info("Found %s old alerts to clean up", count)
                 
                 # Process alerts with timeout check
                 processed_count = 0
                 for alert in old_alerts:
                     if time.time() - start_time > timeout_seconds:
-                        logger.warning(f"Alert cleanup timed out after processing {processed_count}/{count} alerts")
+                        logger.warning("Alert cleanup timed out after processing %s/%s alerts", processed_count, count)
                         break
                     
                     try:
                         db.session.delete(alert)
                         processed_count += 1
                     except Exception as delete_error:
-                        logger.error(f"Failed to delete alert {alert.id}: {delete_error}")
+                        logger.error("Failed to delete alert %s: %s", alert.id, delete_error)
                         continue
                 
                 db.session.commit()
-                logger.info(f"Alert cleanup completed: removed {processed_count} old alerts")
+                logger.info("Alert cleanup completed: removed %s old alerts", processed_count)
                 
         except Exception as e:
-            logger.error(f"Alert cleanup failed: {e}", exc_info=True)
+            logger.error("Alert cleanup failed: %s", e, exc_info=True)
             try:
                 db.session.rollback()
             except Exception as rollback_error:
-                logger.error(f"Alert cleanup rollback failed: {rollback_error}", exc_info=True)
+                logger.error("Alert cleanup rollback failed: %s", rollback_error, exc_info=True)
 
     def start(self):
         """Start the scheduler with enhanced logging - only in main process"""
@@ -337,8 +337,8 @@ class SchedulerService:
             self.scheduler.start()
             logger.info("Scheduler service started successfully in main process")
             jobs = self.scheduler.get_jobs()
-            logger.info(f"Scheduler jobs: {[job.id for job in jobs]}")
-            logger.info(f"Total jobs scheduled: {len(jobs)}")
+            logger.info("Scheduler jobs: %s", [job.id for job in jobs])
+            logger.info("Total jobs scheduled: %s", len(jobs))
         else:
             logger.info("Scheduler service was already running")
 
@@ -367,7 +367,7 @@ class SchedulerService:
     def log_scheduler_stats(self):
         """Log detailed scheduler statistics."""
         stats = self.get_stats()
-        logger.info(f"Scheduler Stats: {stats}")
+        logger.info("Scheduler Stats: %s", stats)
         
         # Log individual job performance
         for job_id, job_stat in self.job_stats.items():
@@ -375,27 +375,26 @@ class SchedulerService:
                 job_stat['executions'] / (job_stat['executions'] + job_stat['errors']) * 100
                 if (job_stat['executions'] + job_stat['errors']) > 0 else 0
             )
-            logger.info(f"Job {job_id}: {job_stat['executions']} executions, "
-                       f"{job_stat['errors']} errors, {success_rate:.1f}% success rate")
+            logger.info("Job %s: %s executions, %s errors, %.1f%% success rate", job_id, job_stat['executions'], job_stat['errors'], success_rate)
         
     def pause_job(self, job_id: str) -> bool:
         """Pause a specific job."""
         try:
             self.scheduler.pause_job(job_id)
-            logger.info(f"Job {job_id} paused")
+            logger.info("Job %s paused", job_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to pause job {job_id}: {e}")
+            logger.error("Failed to pause job %s: %s", job_id, e)
             return False
             
     def resume_job(self, job_id: str) -> bool:
         """Resume a specific job."""
         try:
             self.scheduler.resume_job(job_id)
-            logger.info(f"Job {job_id} resumed")
+            logger.info("Job %s resumed", job_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to resume job {job_id}: {e}")
+            logger.error("Failed to resume job %s: %s", job_id, e)
             return False
             
     def health_check(self) -> bool:
@@ -403,7 +402,7 @@ class SchedulerService:
         try:
             return self.scheduler.running and len(self.scheduler.get_jobs()) > 0
         except Exception as e:
-            logger.error(f"Scheduler health check failed: {e}")
+            logger.error("Scheduler health check failed: %s", e)
             return False
 
 
@@ -14,7 +14,7 @@ class ServiceService:
         try:
             return Service.query_active().all()
         except Exception as e:
-            logging.error(f"Error fetching services: {e}", exc_info=True)
+            logging.error("Error fetching services: %s", e, exc_info=True)
             raise ServiceError("Could not fetch services. Please try again later.")
 
     @staticmethod
@@ -22,13 +22,13 @@ class ServiceService:
         try:
             return Service.query_active().filter_by(id=service_id).first()
         except Exception as e:
-            logging.error(f"Error fetching service: {e}", exc_info=True)
+            logging.error("Error fetching service: %s", e, exc_info=True)
             raise ServiceError("Could not fetch service. Please try again later.")
 
     @staticmethod
     def create(data):
         try:
-            logging.info(f"Creating service with data: {list(data.keys())}")
+            logging.info("Creating service with data: %s", list(data.keys()))
             service = Service(**data)
             db.session.add(service)
             db.session.flush()  # Get the service ID without committing
@@ -44,19 +44,19 @@ class ServiceService:
             try:
                 sync_success_count, sync_error_count = ContractorServicePricingService.sync_new_service_to_contractors(service.id)
                 if sync_error_count > 0:
-                    logging.warning(f"Some contractors ({sync_error_count}) failed to sync with new service {service.id}")
+                    logging.warning("Some contractors (%s) failed to sync with new service %s", sync_error_count, service.id)
             except Exception as sync_error:
-                logging.error(f"Error syncing service to contractors: {sync_error}", exc_info=True)
+                logging.error("Error syncing service to contractors: %s", sync_error, exc_info=True)
                 sync_error_count = -1  # Flag total failure
 
             db.session.commit()
-            logging.info(f"Service created successfully with ID: {service.id}")
+            logging.info("Service created successfully with ID: %s", service.id)
             # Return service with sync metrics for API layer to construct accurate message
             return service, sync_success_count, sync_error_count
 
         except IntegrityError as e:
             db.session.rollback()
-            logging.error(f"Integrity error creating service: {e}", exc_info=True)
+            logging.error("Integrity error creating service: %s", e, exc_info=True)
             # Check if it's a duplicate name error
             if "UNIQUE constraint failed" in str(e) and "service.name" in str(e):
                 raise ServiceError("A service with this name already exists. Please choose a different name.")
@@ -64,24 +64,24 @@ class ServiceService:
                 raise ServiceError("Failed to create service due to a data conflict.")
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating service: {e}", exc_info=True)
+            logging.error("Error creating service: %s", e, exc_info=True)
             raise ServiceError("Could not create service. Please try again later.")
 
     @staticmethod
     def update(service_id, data):
         try:
-            logging.info(f"Updating service {service_id} with data: {list(data.keys())}")
+            logging.info("Updating service %s with data: %s", service_id, list(data.keys()))
             service = Service.query_active().filter_by(id=service_id).first()
             if not service:
                 return None
             for key, value in data.items():
                 setattr(service, key, value)
             db.session.commit()
-            logging.info(f"Service {service_id} updated successfully")
+            logging.info("Service %s updated successfully", service_id)
             return service
         except IntegrityError as e:
             db.session.rollback()
-            logging.error(f"Integrity error updating service: {e}", exc_info=True)
+            logging.error("Integrity error updating service: %s", e, exc_info=True)
             # Check if it's a duplicate name error
             if "UNIQUE constraint failed" in str(e) and "service.name" in str(e):
                 raise ServiceError("A service with this name already exists. Please choose a different name.")
@@ -89,7 +89,7 @@ class ServiceService:
                 raise ServiceError("Could not update service due to a data conflict. Please check your inputs.")
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating service: {e}", exc_info=True)
+            logging.error("Error updating service: %s", e, exc_info=True)
             raise ServiceError("Could not update service. Please try again later.")
 
     @staticmethod
@@ -103,11 +103,11 @@ class ServiceService:
             service.is_deleted = True
 
             db.session.commit()
-            logging.info(f"Service {service_id} soft deleted successfully")
+            logging.info("Service %s soft deleted successfully", service_id)
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting service: {e}", exc_info=True)
+            logging.error("Error deleting service: %s", e, exc_info=True)
             raise ServiceError("Could not delete service. Please try again later.")
 
     @staticmethod
@@ -121,9 +121,9 @@ class ServiceService:
             service.is_deleted = is_deleted
             
             db.session.commit()
-            logging.info(f"Service {service_id} soft delete status toggled to {is_deleted}")
+            logging.info("Service %s soft delete status toggled to %s", service_id, is_deleted)
             return service
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error toggling service soft delete status: {e}", exc_info=True)
+            logging.error("Error toggling service soft delete status: %s", e, exc_info=True)
             raise ServiceError("Could not update service status. Please try again later.")
\ No newline at end of file
@@ -14,7 +14,7 @@ class ServicesVehicleTypePriceService:
         try:
             return ServicesVehicleTypePrice.query.all()
         except Exception as e:
-            logging.error(f"Error fetching service vehicle type prices: {e}", exc_info=True)
+            logging.error("Error fetching service vehicle type prices: %s", e, exc_info=True)
             raise ServiceError("Could not fetch service vehicle type prices. Please try again later.")
 
     @staticmethod
@@ -22,7 +22,7 @@ class ServicesVehicleTypePriceService:
         try:
             return ServicesVehicleTypePrice.query.get(service_vehicle_type_price_id)
         except Exception as e:
-            logging.error(f"Error fetching service vehicle type price: {e}", exc_info=True)
+            logging.error("Error fetching service vehicle type price: %s", e, exc_info=True)
             raise ServiceError("Could not fetch service vehicle type price. Please try again later.")
 
     @staticmethod
@@ -30,7 +30,7 @@ class ServicesVehicleTypePriceService:
         try:
             return ServicesVehicleTypePrice.query.filter_by(service_id=service_id).all()
         except Exception as e:
-            logging.error(f"Error fetching service vehicle type prices for service {service_id}: {e}", exc_info=True)
+            logging.error("Error fetching service vehicle type prices for service %s: %s", service_id, e, exc_info=True)
             raise ServiceError("Could not fetch service vehicle type prices. Please try again later.")
 
     @staticmethod
@@ -42,7 +42,7 @@ class ServicesVehicleTypePriceService:
             return service_vehicle_type_price
         except IntegrityError as e:
             db.session.rollback()
-            logging.error(f"Integrity error creating service vehicle type price: {e}", exc_info=True)
+            logging.error("Integrity error creating service vehicle type price: %s", e, exc_info=True)
             # Check if it's a duplicate entry error
             if "UNIQUE constraint failed" in str(e) or "duplicate" in str(e).lower():
                 raise ServiceError("A pricing entry already exists for this service and vehicle type combination.")
@@ -50,7 +50,7 @@ class ServicesVehicleTypePriceService:
                 raise ServiceError("Could not create service vehicle type price due to a data conflict. Please check your inputs.")
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating service vehicle type price: {e}", exc_info=True)
+            logging.error("Error creating service vehicle type price: %s", e, exc_info=True)
             raise ServiceError("Could not create service vehicle type price. Please try again later.")
 
     @staticmethod
@@ -65,7 +65,7 @@ class ServicesVehicleTypePriceService:
             return service_vehicle_type_price
         except IntegrityError as e:
             db.session.rollback()
-            logging.error(f"Integrity error updating service vehicle type price: {e}", exc_info=True)
+            logging.error("Integrity error updating service vehicle type price: %s", e, exc_info=True)
             # Check if it's a duplicate entry error
             if "UNIQUE constraint failed" in str(e) or "duplicate" in str(e).lower():
                 raise ServiceError("A pricing entry already exists for this service and vehicle type combination.")
@@ -73,7 +73,7 @@ class ServicesVehicleTypePriceService:
                 raise ServiceError("Could not update service vehicle type price due to a data conflict. Please check your inputs.")
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating service vehicle type price: {e}", exc_info=True)
+            logging.error("Error updating service vehicle type price: %s", e, exc_info=True)
             raise ServiceError("Could not update service vehicle type price. Please try again later.")
 
     @staticmethod
@@ -87,5 +87,5 @@ class ServicesVehicleTypePriceService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting service vehicle type price: {e}", exc_info=True)
+            logging.error("Error deleting service vehicle type price: %s", e, exc_info=True)
             raise ServiceError("Could not delete service vehicle type price. Please try again later.")
\ No newline at end of file
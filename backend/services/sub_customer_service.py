@@ -14,7 +14,7 @@ class SubCustomerService:
         try:
             return SubCustomer.query.all()
         except Exception as e:
-            logging.error(f"Error fetching sub-customers: {e}", exc_info=True)
+            logging.error("Error fetching sub-customers: %s", e, exc_info=True)
             raise ServiceError("Could not fetch sub-customers. Please try again later.")
 
     @staticmethod
@@ -22,7 +22,7 @@ class SubCustomerService:
         try:
             return SubCustomer.query.get(sub_customer_id)
         except Exception as e:
-            logging.error(f"Error fetching sub-customer: {e}", exc_info=True)
+            logging.error("Error fetching sub-customer: %s", e, exc_info=True)
             raise ServiceError("Could not fetch sub-customer. Please try again later.")
 
     @staticmethod
@@ -34,7 +34,7 @@ class SubCustomerService:
             return sub_customer
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error creating sub-customer: {e}", exc_info=True)
+            logging.error("Error creating sub-customer: %s", e, exc_info=True)
             raise ServiceError("Could not create sub-customer. Please try again later.")
 
     @staticmethod
@@ -49,7 +49,7 @@ class SubCustomerService:
             return sub_customer
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error updating sub-customer: {e}", exc_info=True)
+            logging.error("Error updating sub-customer: %s", e, exc_info=True)
             raise ServiceError("Could not update sub-customer. Please try again later.")
 
     @staticmethod
@@ -63,5 +63,5 @@ class SubCustomerService:
             return True
         except Exception as e:
             db.session.rollback()
-            logging.error(f"Error deleting sub-customer: {e}", exc_info=True)
+            logging.error("Error deleting sub-customer: %s", e, exc_info=True)
             raise ServiceError("Could not delete sub-customer. Please try again later.") 
\ No newline at end of file
@@ -1,13 +1,96 @@
 import logging
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from backend.extensions import db
+from backend.utils.service_method import service_method
+from backend.utils.json_stream import prime_iterator
 from backend.models.user import User
 from backend.models.customer import Customer
 from backend.models.driver import Driver
-from backend.models.role import Role
+from backend.models.role import Role, roles_users
 from backend.models.password_history import PasswordHistory
+from flask import current_app
 from flask_security.utils import hash_password, verify_password
+from sqlalchemy import exists, false, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, make_transient_to_detached, raiseload, selectinload
+
+NAME_MAX_LEN = 255
+
+# Columns update() may assign directly; anything else in the payload is ignored
+_USER_UPDATABLE = frozenset({'email', 'name', 'active', 'fs_uniquifier', 'customer_id', 'driver_id'})
+
+# Rows fetched per round trip when streaming list endpoints
+_STREAM_BATCH_SIZE = 500
+
+# Relationships serialized by UserSchema; loaded up front so list endpoints
+# issue one SELECT per relationship instead of one per user. Anything else
+# raises rather than silently lazy-loading.
+_USER_LOAD_OPTIONS = (
+    selectinload(User.roles),
+    selectinload(User.customer).selectinload(Customer.sub_customers),
+    selectinload(User.driver).selectinload(Driver.vehicle),
+    raiseload('*'),
+)
+
+# Module-level thread pool for password hashing. pbkdf2 runs in C and releases
+# the GIL, so concurrent creates/updates hash in parallel instead of
+# serialising on the request threads.
+password_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="password-hasher")
+
+
+def _submit_hash_password(password):
+    """Hash a password on the executor; returns a Future with the hash."""
+    app = current_app._get_current_object()
+
+    def worker():
+        # Flask-Security reads the hashing config from the app
+        with app.app_context():
+            return hash_password(password)
+
+    return password_hash_executor.submit(worker)
+
+
+# Rows per executemany INSERT in create_many
+_BULK_INSERT_CHUNK = 500
+
+# Role rows are effectively static lookup data; cache them by name so that
+# user create/update does not hit the database once per role name.
+_ROLE_TTL = 60.0  # seconds
+_ROLE_CACHE: dict[str, tuple[float, Role]] = {}
+
+
+def _get_roles(names):
+    """
+    Resolve role names to Role instances attached to the current session.
+
+    Cached roles are detached snapshots; they are merged into the session with
+    load=False so no SELECT is emitted. Unknown and duplicate names are
+    skipped and the result preserves the input order.
+    """
+    names = list(dict.fromkeys(names))
+    now = time.monotonic()
+    found = {}
+    misses = []
+    for name in names:
+        entry = _ROLE_CACHE.get(name)
+        if entry is not None and now - entry[0] < _ROLE_TTL:
+            found[name] = entry[1]
+        else:
+            misses.append(name)
+
+    if misses:
+        for role in Role.query.filter(Role.name.in_(misses)).all():
+            snapshot = Role(id=role.id, name=role.name, description=role.description)
+            make_transient_to_detached(snapshot)
+            _ROLE_CACHE[role.name] = (now, snapshot)
+            found[role.name] = snapshot
+
+    return [db.session.merge(found[name], load=False) for name in names if name in found]
 
 
 class ServiceError(Exception):
@@ -16,7 +99,41 @@ class ServiceError(Exception):
         self.message = message
 
 
+def _insert_ignore_duplicates(table):
+    """INSERT ... ON CONFLICT DO NOTHING for the session's dialect."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql_insert(table).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite_insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def _sanitize_name(data):
+    """Strip and validate data['name'] in place; blank names become None."""
+    name = data.get('name')
+    if name is None:
+        return
+    if not isinstance(name, str):
+        raise ServiceError("Name must be a string")
+    name = name.strip()
+    if len(name) > NAME_MAX_LEN:
+        raise ServiceError(f"Name cannot exceed {NAME_MAX_LEN} characters")
+    data['name'] = name or None
+
+
+def _is_active_entity(model, entity_id):
+    """EXISTS check for a non-deleted Customer/Driver, served by its partial index."""
+    query = select(model.id).where(model.id == entity_id, model.is_deleted == false())
+    return db.session.execute(query.exists().select()).scalar()
+
+
 class UserService:
+    @staticmethod
+    def _invalidate_role_cache():
+        """Drop cached roles; call after any change to the role table."""
+        _ROLE_CACHE.clear()
+
     @staticmethod
     def _check_password_reuse(user_id, new_password, history_count=5):
         """
@@ -41,29 +158,28 @@ class UserService:
         # Allow multiple users to be assigned to the same customer
         # but keep restriction for drivers
         if user_type == 'driver':
-            filter_field = 'driver_id'
-            existing = User.query.filter_by(**{filter_field: entity_id}).first()
-            if existing and (exclude_user_id is None or existing.id != exclude_user_id):
+            # EXISTS returns a single boolean instead of hydrating a User row
+            query = select(User.id).where(User.driver_id == entity_id)
+            if exclude_user_id is not None:
+                query = query.where(User.id != exclude_user_id)
+            if db.session.execute(query.exists().select()).scalar():
                 raise ServiceError(f"{user_type.capitalize()} is already assigned to another user")
         # For customers, we allow multiple assignments, so no check is needed
 
     @staticmethod
+    @service_method("fetch users", ServiceError)
     def get_all():
-        try:
-            return User.query.all()
-        except Exception as e:
-            logging.error(f"Error fetching users: {e}", exc_info=True)
-            raise ServiceError("Could not fetch users. Please try again later.")
+        # Stream rows in batches; callers iterate instead of holding a list.
+        # Priming runs the query here so errors surface before streaming starts
+        return prime_iterator(User.query.options(*_USER_LOAD_OPTIONS).yield_per(_STREAM_BATCH_SIZE))
 
     @staticmethod
+    @service_method("fetch user", ServiceError)
     def get_by_id(user_id):
-        try:
-            return User.query.get(user_id)
-        except Exception as e:
-            logging.error(f"Error fetching user: {e}", exc_info=True)
-            raise ServiceError("Could not fetch user. Please try again later.")
+        return db.session.get(User, user_id, options=_USER_LOAD_OPTIONS)
 
     @staticmethod
+    @service_method("create user", ServiceError)
     def create(data):
         try:
             # Normalize email to lowercase for case-insensitive uniqueness
@@ -77,21 +193,12 @@ class UserService:
 
                 data['email'] = email_lower
 
-            # Validate and sanitize name field
-            if 'name' in data:
-                name = data['name']
-                if name is not None:
-                    if not isinstance(name, str):
-                        raise ServiceError("Name must be a string")
-                    name = name.strip()
-                    if len(name) > 255:
-                        raise ServiceError("Name cannot exceed 255 characters")
-                    data['name'] = name if name else None
+            _sanitize_name(data)
 
             password = data.pop('password', None)
             hashed_password = None
             if password:
-                hashed_password = hash_password(password)
+                hashed_password = _submit_hash_password(password).result()
                 data['password'] = hashed_password
             roles = data.pop('roles', [])
             role_names = data.pop('role_names', None)
@@ -104,37 +211,35 @@ class UserService:
             if 'fs_uniquifier' not in data or data['fs_uniquifier'] is None:
                 data['fs_uniquifier'] = str(uuid.uuid4())
 
-            user = User(**data)
-            db.session.add(user)
-            db.session.flush()
-            
-            # Handle customer assignment
+            # Run every lookup before the user is added to the session so that
+            # autoflush does not fire; the INSERTs are emitted once, at commit.
             if customer_id:
-                customer = Customer.query_active().filter_by(id=customer_id).first()
-                if not customer:
+                if not _is_active_entity(Customer, customer_id):
                     raise ServiceError("Customer not found or inactive")
                 UserService._validate_entity_not_assigned('customer', customer_id)
-                user.customer_id = customer_id
-            
-            # Handle driver assignment
+                data['customer_id'] = customer_id
+
             if driver_id:
-                driver = Driver.query_active().filter_by(id=driver_id).first()
-                if not driver:
+                if not _is_active_entity(Driver, driver_id):
                     raise ServiceError("Driver not found or inactive")
                 UserService._validate_entity_not_assigned('driver', driver_id)
-                user.driver_id = driver_id
-            
+                data['driver_id'] = driver_id
+
             # Handle roles - prefer role_names if provided
             roles_to_assign = role_names if role_names is not None else roles
-            if roles_to_assign:
-                for role_name in roles_to_assign:
-                    role = Role.query.filter_by(name=role_name).first()
-                    if role:
-                        user.roles.append(role)
+            role_objs = _get_roles(roles_to_assign) if roles_to_assign else []
 
-            # Add initial password to history if password was provided
+            user = User(**data)
+            user.roles.extend(role_objs)
+            db.session.add(user)
+
+            # Add initial password to history if password was provided. A new
+            # user has no history to trim, so link through the relationship and
+            # let the commit-time flush fill in user_id.
             if hashed_password:
-                PasswordHistory.add_to_history(user.id, hashed_password)
+                history = PasswordHistory(None, hashed_password)
+                history.user = user
+                db.session.add(history)
 
             db.session.commit()
             return user
@@ -162,237 +267,320 @@ class UserService:
                 raise ServiceError("Email already exists. Please use a different email address.")
             else:
                 raise ServiceError("A user with this information already exists")
-        except ServiceError:
-            db.session.rollback()
-            raise
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error creating user: {e}", exc_info=True)
-            raise ServiceError("Could not create user. Please try again later.")
 
     @staticmethod
-    def update(user_id, data):
-        try:
-            user = User.query.get(user_id)
-            if not user:
-                return None
+    @service_method("create users", ServiceError)
+    def create_many(records):
+        """
+        Create several users in one transaction.
 
-            # Normalize and validate email if being updated
-            if 'email' in data and data['email']:
-                email_lower = data['email'].lower().strip()
+        Rows are inserted with executemany-style INSERT ... RETURNING in chunks,
+        role links and password history are inserted in bulk, and the whole
+        batch is committed once.
 
-                # Check if email already exists for a different user (case-insensitive)
-                existing_user = User.query.filter(
-                    db.func.lower(User.email) == email_lower,
-                    User.id != user_id
-                ).first()
-                if existing_user:
-                    raise ServiceError("Email already exists. Please use a different email address.")
+        Args:
+            records: List of dicts accepted by create()
 
-                data['email'] = email_lower
+        Returns:
+            list: IDs of the created users, in input order
+        """
+        if not records:
+            return []
+        try:
+            user_rows = []
+            role_names_per_user = []
+            seen_emails = set()
+            for data in records:
+                data = dict(data)
+                email = (data.get('email') or '').lower().strip()
+                if not email:
+                    raise ServiceError("Email is required for every user")
+                if email in seen_emails:
+                    raise ServiceError(f"Duplicate email in batch: {email}")
+                seen_emails.add(email)
+                data['email'] = email
+
+                _sanitize_name(data)
+
+                password = data.pop('password', None)
+                if not password:
+                    raise ServiceError("Password is required for every user")
+                data['password'] = _submit_hash_password(password)
+
+                roles = data.pop('roles', [])
+                role_names = data.pop('role_names', None)
+                role_names_per_user.append(role_names if role_names is not None else roles)
+
+                if data.get('fs_uniquifier') is None:
+                    data['fs_uniquifier'] = str(uuid.uuid4())
+                user_rows.append(data)
+
+            # Hashes were submitted above and computed in parallel
+            for row in user_rows:
+                row['password'] = row['password'].result()
+
+            existing = User.query.filter(db.func.lower(User.email).in_(seen_emails)).first()
+            if existing:
+                raise ServiceError(f"Email already exists: {existing.email}")
+
+            customer_ids = {row['customer_id'] for row in user_rows if row.get('customer_id')}
+            if customer_ids:
+                found = {c.id for c in Customer.query_active().filter(Customer.id.in_(customer_ids))}
+                if customer_ids - found:
+                    raise ServiceError("Customer not found or inactive")
 
-            # Validate and sanitize name field
-            if 'name' in data:
-                name = data['name']
-                if name is not None:
-                    if not isinstance(name, str):
-                        raise ServiceError("Name must be a string")
-                    name = name.strip()
-                    if len(name) > 255:
-                        raise ServiceError("Name cannot exceed 255 characters")
-                    data['name'] = name if name else None
+            driver_ids = [row['driver_id'] for row in user_rows if row.get('driver_id')]
+            if driver_ids:
+                if len(driver_ids) != len(set(driver_ids)):
+                    raise ServiceError("Driver is already assigned to another user")
+                found = {d.id for d in Driver.query_active().filter(Driver.id.in_(driver_ids))}
+                if set(driver_ids) - found:
+                    raise ServiceError("Driver not found or inactive")
+                if User.query.filter(User.driver_id.in_(driver_ids)).first():
+                    raise ServiceError("Driver is already assigned to another user")
+
+            user_ids = []
+            stmt = insert(User).returning(User.id, sort_by_parameter_order=True)
+            for start in range(0, len(user_rows), _BULK_INSERT_CHUNK):
+                chunk = user_rows[start:start + _BULK_INSERT_CHUNK]
+                user_ids.extend(db.session.execute(stmt, chunk).scalars())
+
+            role_links = []
+            for user_id, names in zip(user_ids, role_names_per_user):
+                if names:
+                    role_links.extend(
+                        {'user_id': user_id, 'role_id': role.id} for role in _get_roles(names)
+                    )
+            if role_links:
+                db.session.execute(_insert_ignore_duplicates(roles_users), role_links)
+
+            db.session.execute(
+                insert(PasswordHistory),
+                [
+                    {'user_id': user_id, 'password_hash': row['password']}
+                    for user_id, row in zip(user_ids, user_rows)
+                ],
+            )
 
-            password = data.pop('password', None)
-            if password:
-                # Check for password reuse
-                if UserService._check_password_reuse(user_id, password):
-                    raise ServiceError("Cannot reuse any of your last 5 passwords")
+            db.session.commit()
+            return user_ids
+        except IntegrityError as e:
+            db.session.rollback()
+            logging.error("Integrity error creating users: %s", e, exc_info=True)
+            raise ServiceError("One or more users conflict with existing records")
 
-                # Hash and update password
-                hashed_password = hash_password(password)
-                user.password = hashed_password
+    @staticmethod
+    @service_method("update user", ServiceError)
+    def update(user_id, data):
+        user = db.session.get(User, user_id)
+        if not user:
+            return None
+
+        # Normalize and validate email if being updated
+        if 'email' in data and data['email']:
+            email_lower = data['email'].lower().strip()
+
+            # Check if email already exists for a different user (case-insensitive)
+            existing_user = User.query.filter(
+                db.func.lower(User.email) == email_lower,
+                User.id != user_id
+            ).first()
+            if existing_user:
+                raise ServiceError("Email already exists. Please use a different email address.")
 
-                # Add to password history
-                PasswordHistory.add_to_history(user_id, hashed_password)
-            roles = data.pop('roles', None)
-            role_names = data.pop('role_names', None)
-            for key, value in data.items():
-                setattr(user, key, value)
-            # Handle roles update - prefer role_names if provided
-            roles_to_assign = None
-            if role_names is not None:
-                roles_to_assign = role_names
-            elif roles is not None:
-                roles_to_assign = roles
-                
-            if roles_to_assign is not None:
-                # Get old roles before clearing
-                old_roles = [role.name for role in user.roles]
-                
-                user.roles.clear()
-                for role_name in roles_to_assign:
-                    role = Role.query.filter_by(name=role_name).first()
-                    if role:
-                        user.roles.append(role)
-                
-                # After role assignment, check if we need to clear customer_id/driver_id
-                # If user is changing from customer/driver to manager/admin/accountant
-                new_roles = [role.name for role in user.roles]
-                
-                # Check if user had customer or driver role previously but doesn't anymore
-                had_customer_role = 'customer' in old_roles
-                had_driver_role = 'driver' in old_roles
-                has_customer_role = 'customer' in new_roles
-                has_driver_role = 'driver' in new_roles
-                
-                # If user is no longer customer/driver but was before, clear the IDs
-                if not has_customer_role and had_customer_role:
-                    user.customer_id = None
-                if not has_driver_role and had_driver_role:
-                    user.driver_id = None
-                
-                # If user is becoming customer/driver but was admin/manager, ensure they select customer/driver
-                is_becoming_customer_or_driver = any(role in ['customer', 'driver'] for role in new_roles)
-                was_admin_or_manager = any(role in ['admin', 'manager', 'accountant'] for role in old_roles)
-                
-                if is_becoming_customer_or_driver and was_admin_or_manager:
-                    # Check if customer_id or driver_id is provided in the data
-                    if 'customer_id' in data and data['customer_id'] is not None:
-                        user.customer_id = data['customer_id']
-                    if 'driver_id' in data and data['driver_id'] is not None:
-                        user.driver_id = data['driver_id']
+            data['email'] = email_lower
+
+        _sanitize_name(data)
+
+        password = data.pop('password', None)
+        if password:
+            # Check for password reuse
+            if UserService._check_password_reuse(user_id, password):
+                raise ServiceError("Cannot reuse any of your last 5 passwords")
+
+            # Hash and update password
+            hashed_password = _submit_hash_password(password).result()
+            user.password = hashed_password
+
+            # Add to password history
+            PasswordHistory.add_to_history(user_id, hashed_password)
+        roles = data.pop('roles', None)
+        role_names = data.pop('role_names', None)
+        for key in data.keys() & _USER_UPDATABLE:
+            setattr(user, key, data[key])
+        # Handle roles update - prefer role_names if provided
+        roles_to_assign = None
+        if role_names is not None:
+            roles_to_assign = role_names
+        elif roles is not None:
+            roles_to_assign = roles
+            
+        if roles_to_assign is not None:
+            # Get old roles before clearing
+            old_roles = [role.name for role in user.roles]
+            
+            user.roles.clear()
+            for role in _get_roles(roles_to_assign):
+                user.roles.append(role)
+            
+            # After role assignment, check if we need to clear customer_id/driver_id
+            # If user is changing from customer/driver to manager/admin/accountant
+            new_roles = [role.name for role in user.roles]
+            
+            # Check if user had customer or driver role previously but doesn't anymore
+            had_customer_role = 'customer' in old_roles
+            had_driver_role = 'driver' in old_roles
+            has_customer_role = 'customer' in new_roles
+            has_driver_role = 'driver' in new_roles
+            
+            # If user is no longer customer/driver but was before, clear the IDs
+            if not has_customer_role and had_customer_role:
+                user.customer_id = None
+            if not has_driver_role and had_driver_role:
+                user.driver_id = None
+            
+            # If user is becoming customer/driver but was admin/manager, ensure they select customer/driver
+            is_becoming_customer_or_driver = any(role in ['customer', 'driver'] for role in new_roles)
+            was_admin_or_manager = any(role in ['admin', 'manager', 'accountant'] for role in old_roles)
+            
+            if is_becoming_customer_or_driver and was_admin_or_manager:
+                # Check if customer_id or driver_id is provided in the data
+                if 'customer_id' in data and data['customer_id'] is not None:
+                    user.customer_id = data['customer_id']
+                if 'driver_id' in data and data['driver_id'] is not None:
+                    user.driver_id = data['driver_id']
 
-            db.session.commit()
-            return user
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error updating user: {e}", exc_info=True)
-            raise ServiceError("Could not update user. Please try again later.")
+        db.session.commit()
+        return user
 
     @staticmethod
+    @service_method("delete user", ServiceError)
     def delete(user_id):
-        try:
-            user = User.query.get(user_id)
-            if not user:
-                return False
-            # Soft delete - set active to False instead of removing the record
-            user.active = False
-            db.session.commit()
-            return True
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error deleting user: {e}", exc_info=True)
-            raise ServiceError("Could not delete user. Please try again later.") 
+        # Soft delete - set active to False instead of removing the record
+        rows = User.query.filter_by(id=user_id).update({'active': False}, synchronize_session=False)
+        db.session.commit()
+        return rows > 0
     
+    @staticmethod
+    def _update_by_driver_id(driver_id, values):
+        """Update the user linked to driver_id in one statement and commit."""
+        stmt = (
+            update(User)
+            .where(User.driver_id == driver_id)
+            .values(**values)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        if db.session.execute(stmt).first() is None:
+            db.session.rollback()
+            raise ServiceError("User with provided driver_id not found.")
+        db.session.commit()
+
     @staticmethod
     def save_device_token(driver_id: int, token_data: dict) -> bool:
         try:
-            user = User.query.filter_by(driver_id=driver_id).first()
-
-            if not user:
-                raise ServiceError("User with provided driver_id not found.")
-
             android_token = token_data.get('android_device_token')
             ios_token = token_data.get('ios_device_token')
 
             if not android_token and not ios_token:
                 raise ServiceError("No device token provided.")
 
+            values = {}
             if android_token:
-                user.android_device_token = android_token
+                values['android_device_token'] = android_token
             if ios_token:
-                user.ios_device_token = ios_token
+                values['ios_device_token'] = ios_token
 
-            db.session.commit()
+            UserService._update_by_driver_id(driver_id, values)
             return True
         except ServiceError:
             raise 
         except Exception as e:
-            logging.error(f"Failed to save device token: {e}", exc_info=True)
+            logging.error("Failed to save device token: %s", e, exc_info=True)
             raise ServiceError("An unexpected error occurred while saving device token.")
 
     @staticmethod
     def remove_device_tokens(driver_id: int) -> bool:
         try:
-            user = User.query.filter_by(driver_id=driver_id).first()
-            if not user:
-                raise ServiceError("User with provided driver_id not found.")
-
-            user.android_device_token = None
-            user.ios_device_token = None
-            db.session.commit()
+            UserService._update_by_driver_id(
+                driver_id, {'android_device_token': None, 'ios_device_token': None}
+            )
             return True
         except ServiceError:
             raise
         except Exception as e:
-            logging.error(f"Failed to remove device tokens: {e}", exc_info=True)
+            logging.error("Failed to remove device tokens: %s", e, exc_info=True)
             raise ServiceError("An unexpected error occurred while removing device tokens.")
 
     @staticmethod
+    @service_method("fetch customers", ServiceError)
     def get_unassigned_customers():
         """
         Fetch all active customers (allows multiple user assignments)
         """
-        try:
-            # Since we're allowing multiple users per customer, 
-            # this now returns all active customers
-            all_customers = Customer.query_active().all()
-            return all_customers
-        except Exception as e:
-            logging.error(f"Error fetching customers: {e}", exc_info=True)
-            raise ServiceError("Could not fetch customers. Please try again later.")
+        # Since we're allowing multiple users per customer, 
+        # this now returns all active customers
+        all_customers = Customer.query_active().all()
+        return all_customers
 
     @staticmethod
+    @service_method("fetch unassigned drivers", ServiceError)
     def get_unassigned_drivers():
         """
         Fetch drivers not assigned to any user
         """
-        try:
-            unassigned_drivers = Driver.query_active().filter(
-                Driver.id.notin_(
-                    db.session.query(User.driver_id).filter(User.driver_id.isnot(None))
-                )
-            ).all()
-            return unassigned_drivers
-        except Exception as e:
-            logging.error(f"Error fetching unassigned drivers: {e}", exc_info=True)
-            raise ServiceError("Could not fetch unassigned drivers. Please try again later.")
+        # Anti-join instead of NOT IN (subquery): plans as a hash anti-join
+        # and is not tripped up by NULL driver_id values.
+        unassigned_drivers = Driver.query_active().filter(
+            ~exists().where(User.driver_id == Driver.id)
+        ).all()
+        return unassigned_drivers
 
     @staticmethod
+    @service_method("assign customer or driver", ServiceError)
     def assign_customer_or_driver(user_id, user_type, entity_id):
         """
         Link users with customers or drivers
         """
         try:
-            user = User.query.get(user_id)
-            if not user:
-                raise ServiceError("User not found")
-
-            # Clear only the conflicting assignment
             if user_type == "customer":
-                user.driver_id = None  # Clear driver when assigning customer
+                entity_model = Customer
+                values = {'customer_id': entity_id, 'driver_id': None}  # Clear driver when assigning customer
             elif user_type == "driver":
-                user.customer_id = None  # Clear customer when assigning driver
+                entity_model = Driver
+                values = {'driver_id': entity_id, 'customer_id': None}  # Clear customer when assigning driver
             else:
                 raise ServiceError("Invalid user type. Must be 'customer' or 'driver'")
 
-            if user_type == "customer":
-                customer = Customer.query_active().filter_by(id=entity_id).first()
-                if not customer:
-                    raise ServiceError("Customer not found")
-                
-                UserService._validate_entity_not_assigned('customer', entity_id, user_id)
-                user.customer_id = entity_id
-            elif user_type == "driver":
-                driver = Driver.query_active().filter_by(id=entity_id).first()
-                if not driver:
-                    raise ServiceError("Driver not found")
-                    
-                UserService._validate_entity_not_assigned('driver', entity_id, user_id)
-                user.driver_id = entity_id
+            # Validate and assign in a single conditional UPDATE: the row is only
+            # touched if the customer/driver is active and, for drivers, not
+            # already linked to another user.
+            conditions = [
+                User.id == user_id,
+                exists().where(entity_model.id == entity_id, entity_model.is_deleted == false()),
+            ]
+            if user_type == "driver":
+                other_user = aliased(User)
+                conditions.append(
+                    ~exists().where(other_user.driver_id == entity_id, other_user.id != user_id)
+                )
+            stmt = (
+                update(User)
+                .where(*conditions)
+                .values(**values)
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
+            )
+            if db.session.execute(stmt).first() is None:
+                # Slow path: work out which condition failed for the error message
+                if db.session.get(User, user_id) is None:
+                    raise ServiceError("User not found")
+                if not _is_active_entity(entity_model, entity_id):
+                    raise ServiceError(f"{user_type.capitalize()} not found")
+                raise ServiceError(f"{user_type.capitalize()} is already assigned to another user")
 
             db.session.commit()
-            return user
+            return db.session.get(User, user_id)
         except IntegrityError as e:
             db.session.rollback()
             # Try to get constraint name for more reliable error identification
@@ -412,10 +600,3 @@ class UserService:
                 raise ServiceError("Customer is already assigned to another user")
             else:
                 raise ServiceError(f"Unable to assign {user_type}. The assignment may already exist or violates database constraints.")
-        except ServiceError:
-            db.session.rollback()
-            raise
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error assigning customer or driver: {e}", exc_info=True)
-            raise ServiceError("Could not assign customer or driver. Please try again later.")
@@ -1,6 +1,17 @@
+import time
+from typing import Optional
+
+from sqlalchemy import event
+
 from backend.models.settings import UserSettings
 from backend.extensions import db
 
+# Per-user photo_config lists, read on every photo upload. Entries expire
+# after _PHOTO_CONFIG_TTL and are dropped as soon as this process writes the
+# user's settings row; the TTL bounds staleness across worker processes.
+_PHOTO_CONFIG_TTL = 60.0  # seconds
+_PHOTO_CONFIG_CACHE: dict[int, tuple[float, list]] = {}
+
 def get_user_settings(user_id: int) -> UserSettings:
     return UserSettings.query.filter_by(user_id=user_id).first()
 
@@ -16,6 +27,34 @@ def create_or_update_user_settings(user_id: int, new_preferences: dict) -> UserS
     db.session.commit()
     return settings
 
+def get_photo_config(user_id: int, stage: str) -> Optional[dict]:
+    """
+    Return the user's photo_config entry for a stage, or None if unset.
+
+    The user's photo_config list is cached for _PHOTO_CONFIG_TTL seconds.
+    """
+    now = time.monotonic()
+    entry = _PHOTO_CONFIG_CACHE.get(user_id)
+    if entry is not None and now - entry[0] < _PHOTO_CONFIG_TTL:
+        photo_configs = entry[1]
+    else:
+        settings = UserSettings.query.filter_by(user_id=user_id).first()
+        photo_configs = []
+        if settings and settings.preferences:
+            photo_configs = settings.preferences.get('photo_config', [])
+            if not isinstance(photo_configs, list):
+                photo_configs = [photo_configs] if photo_configs else []
+        photo_configs = [dict(c) for c in photo_configs if isinstance(c, dict)]
+        _PHOTO_CONFIG_CACHE[user_id] = (now, photo_configs)
+    config = next((c for c in photo_configs if c.get('stage') == stage), None)
+    return dict(config) if config is not None else None
+
+@event.listens_for(UserSettings, 'after_insert')
+@event.listens_for(UserSettings, 'after_update')
+@event.listens_for(UserSettings, 'after_delete')
+def _invalidate_photo_config(mapper, connection, target):
+    _PHOTO_CONFIG_CACHE.pop(target.user_id, None)
+
 def delete_user_settings(user_id: int) -> bool:
     settings = UserSettings.query.filter_by(user_id=user_id).first()
     if settings:
@@ -1,8 +1,12 @@
-import logging
 from backend.extensions import db
+from backend.utils.service_method import service_method
+from backend.utils.json_stream import prime_iterator
 from backend.models.vehicle import Vehicle
 from backend.models.driver import Driver
 
+# Rows fetched per round trip when streaming list endpoints
+_STREAM_BATCH_SIZE = 500
+
 class ServiceError(Exception):
     def __init__(self, message):
         super().__init__(message)
@@ -10,75 +14,57 @@ class ServiceError(Exception):
 
 class VehicleService:
     @staticmethod
+    @service_method("fetch vehicles", ServiceError)
     def get_all():
-        try:
-            return Vehicle.query_active().all()
-        except Exception as e:
-            logging.error(f"Error fetching vehicles: {e}", exc_info=True)
-            raise ServiceError("Could not fetch vehicles. Please try again later.")
+        # Stream rows in batches; callers iterate instead of holding a list.
+        # Priming runs the query here so errors surface before streaming starts
+        return prime_iterator(Vehicle.query_active().yield_per(_STREAM_BATCH_SIZE))
 
     @staticmethod
+    @service_method("fetch vehicle", ServiceError)
     def get_by_id(vehicle_id):
-        try:
-            return Vehicle.query_active().filter_by(id=vehicle_id).first()
-        except Exception as e:
-            logging.error(f"Error fetching vehicle: {e}", exc_info=True)
-            raise ServiceError("Could not fetch vehicle. Please try again later.")
+        vehicle = db.session.get(Vehicle, vehicle_id)
+        if vehicle is None or vehicle.is_deleted:
+            return None
+        return vehicle
 
     @staticmethod
+    @service_method("create vehicle", ServiceError)
     def create(data):
-        try:
-            vehicle = Vehicle(**data)
-            db.session.add(vehicle)
-            db.session.commit()
-            return vehicle
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error creating vehicle: {e}", exc_info=True)
-            raise ServiceError("Could not create vehicle. Please try again later.")
+        vehicle = Vehicle(**data)
+        db.session.add(vehicle)
+        db.session.commit()
+        return vehicle
 
     @staticmethod
+    @service_method("update vehicle", ServiceError)
     def update(vehicle_id, data):
-        try:
-            vehicle = Vehicle.query_active().filter_by(id=vehicle_id).first()
-            if not vehicle:
-                return None
-            for key, value in data.items():
-                setattr(vehicle, key, value)
-            db.session.commit()
-            return vehicle
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error updating vehicle: {e}", exc_info=True)
-            raise ServiceError("Could not update vehicle. Please try again later.")
+        vehicle = db.session.get(Vehicle, vehicle_id)
+        if vehicle is None or vehicle.is_deleted:
+            return None
+        for key, value in data.items():
+            setattr(vehicle, key, value)
+        db.session.commit()
+        return vehicle
 
     @staticmethod
+    @service_method("delete vehicle", ServiceError)
     def delete(vehicle_id):
-        try:
-            vehicle = Vehicle.query_active().filter_by(id=vehicle_id).first()
-            if not vehicle:
-                return False
-            # Soft delete the vehicle instead of hard delete
-            vehicle.is_deleted = True
-            db.session.commit()
-            return True
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error deleting vehicle: {e}", exc_info=True)
-            raise ServiceError("Could not delete vehicle. Please try again later.")
+        # Soft delete the vehicle instead of hard delete
+        rows = Vehicle.query_active().filter_by(id=vehicle_id).update(
+            {'is_deleted': True}, synchronize_session=False
+        )
+        db.session.commit()
+        return rows > 0
 
     @staticmethod
+    @service_method("update vehicle status", ServiceError)
     def toggle_soft_delete(vehicle_id, is_deleted):
-        try:
-            # Get vehicle including deleted ones for restore functionality
-            vehicle = Vehicle.query_all().filter_by(id=vehicle_id).first()
-            if not vehicle:
-                return None
-            
-            vehicle.is_deleted = is_deleted
-            db.session.commit()
-            return vehicle
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error toggling vehicle soft delete status: {e}", exc_info=True)
-            raise ServiceError("Could not update vehicle status. Please try again later.")
\ No newline at end of file
+        # Get vehicle including deleted ones for restore functionality
+        vehicle = db.session.get(Vehicle, vehicle_id)
+        if not vehicle:
+            return None
+        
+        vehicle.is_deleted = is_deleted
+        db.session.commit()
+        return vehicle
\ No newline at end of file
@@ -1,5 +1,5 @@
-import logging
 from backend.extensions import db
+from backend.utils.service_method import service_method
 from backend.models.vehicle_type import VehicleType
 from backend.models.ServicesVehicleTypePrice import ServicesVehicleTypePrice
 
@@ -10,78 +10,56 @@ class ServiceError(Exception):
 
 class VehicleTypeService:
     @staticmethod
+    @service_method("fetch vehicle types", ServiceError)
     def get_all():
-        try:
-            return VehicleType.query_active().all()
-        except Exception as e:
-            logging.error(f"Error fetching vehicle types: {e}", exc_info=True)
-            raise ServiceError("Could not fetch vehicle types. Please try again later.")
+        return VehicleType.query_active().all()
 
     @staticmethod
+    @service_method("fetch vehicle type", ServiceError)
     def get_by_id(vehicle_type_id):
-        try:
-            return VehicleType.query_active().filter_by(id=vehicle_type_id).first()
-        except Exception as e:
-            logging.error(f"Error fetching vehicle type: {e}", exc_info=True)
-            raise ServiceError("Could not fetch vehicle type. Please try again later.")
+        vehicle_type = db.session.get(VehicleType, vehicle_type_id)
+        if vehicle_type is None or vehicle_type.is_deleted:
+            return None
+        return vehicle_type
 
     @staticmethod
+    @service_method("create vehicle type", ServiceError)
     def create(data):
-        try:
-            vehicle_type = VehicleType(**data)
-            db.session.add(vehicle_type)
-            db.session.commit()
-            return vehicle_type
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error creating vehicle type: {e}", exc_info=True)
-            raise ServiceError("Could not create vehicle type. Please try again later.")
+        vehicle_type = VehicleType(**data)
+        db.session.add(vehicle_type)
+        db.session.commit()
+        return vehicle_type
 
     @staticmethod
+    @service_method("update vehicle type", ServiceError)
     def update(vehicle_type_id, data):
-        try:
-            vehicle_type = VehicleType.query_active().filter_by(id=vehicle_type_id).first()
-            if not vehicle_type:
-                return None
-            for key, value in data.items():
-                setattr(vehicle_type, key, value)
-            db.session.commit()
-            return vehicle_type
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error updating vehicle type: {e}", exc_info=True)
-            raise ServiceError("Could not update vehicle type. Please try again later.")
+        vehicle_type = db.session.get(VehicleType, vehicle_type_id)
+        if vehicle_type is None or vehicle_type.is_deleted:
+            return None
+        for key, value in data.items():
+            setattr(vehicle_type, key, value)
+        db.session.commit()
+        return vehicle_type
 
     @staticmethod
+    @service_method("delete vehicle type", ServiceError)
     def delete(vehicle_type_id):
-        try:
-            vehicle_type = VehicleType.query_active().filter_by(id=vehicle_type_id).first()
-            if not vehicle_type:
-                return False
-            
-            # Soft delete the vehicle type instead of hard delete
-            vehicle_type.is_deleted = True
-            
-            db.session.commit()
-            return True
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error deleting vehicle type: {e}", exc_info=True)
-            raise ServiceError("Could not delete vehicle type. Please try again later.")
+        # Soft delete the vehicle type instead of hard delete
+        rows = VehicleType.query_active().filter_by(id=vehicle_type_id).update(
+            {'is_deleted': True}, synchronize_session=False
+        )
+        db.session.commit()
+        return rows > 0
 
     @staticmethod
+    @service_method("update vehicle type status", ServiceError)
     def toggle_soft_delete(vehicle_type_id, is_deleted):
-        try:
-            # Get vehicle type including deleted ones for restore functionality
-            vehicle_type = VehicleType.query_all().filter_by(id=vehicle_type_id).first()
-            if not vehicle_type:
-                return None
-            
-            vehicle_type.is_deleted = is_deleted
-            
-            db.session.commit()
-            return vehicle_type
-        except Exception as e:
-            db.session.rollback()
-            logging.error(f"Error toggling vehicle type soft delete status: {e}", exc_info=True)
-            raise ServiceError("Could not update vehicle type status. Please try again later.")
\ No newline at end of file
+        # Get vehicle type including deleted ones for restore functionality
+        vehicle_type = db.session.get(VehicleType, vehicle_type_id)
+        if not vehicle_type:
+            return None
+        
+        vehicle_type.is_deleted = is_deleted
+        
+        db.session.commit()
+        return vehicle_type
\ No newline at end of file
@@ -0,0 +1,15 @@
+# backend/tests/conftest.py
+"""
+Shared test configuration.
+
+backend.server binds the database engine when it is imported, so changing
+SQLALCHEMY_DATABASE_URI on app.config inside a test has no effect. Point the
+config at an in-memory SQLite database here, before any test module imports
+the app, so create_all()/drop_all() never touch the developer's storage DB.
+Flask-SQLAlchemy shares one connection (StaticPool) for in-memory SQLite, so
+the schema outlives session checkouts.
+"""
+
+import os
+
+os.environ["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
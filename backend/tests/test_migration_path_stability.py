@@ -4,147 +4,49 @@ Test suite for migration path resolution stability.
 This test ensures that database paths are resolved consistently across different
 execution contexts (different working directories, module vs script execution).
 """
-import subprocess
 import os
-import sys
 from pathlib import Path
+from typing import ClassVar
 import pytest
 
+from backend.utils.paths import find_repo_root, get_storage_db_path
+
 
 class TestMigrationPathStability:
     """Test path resolution consistency across different execution contexts."""
 
-    @staticmethod
-    def get_repo_root() -> Path:
-        """Get the root of the fleetwise-backend repository."""
-        return Path(__file__).resolve().parents[2]
-
-    @staticmethod
-    def get_expected_db_path() -> Path:
-        """Get the expected database path based on repository structure."""
-        repo_root = TestMigrationPathStability.get_repo_root()
-        repos_parent = repo_root.parent
-        return repos_parent / "fleetwise-storage" / "database" / "fleetwise.db"
-
-    def test_path_from_repo_root(self):
-        """Test path resolution when executing from repository root."""
-        repo_root = self.get_repo_root()
-        expected_path = self.get_expected_db_path()
-
-        # Run path resolution from repo root
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "from backend.utils.paths import get_storage_db_path; print(get_storage_db_path())",
-            ],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            env={**os.environ, "PYTHONPATH": str(repo_root)},
-        )
-
-        assert (
-            result.returncode == 0
-        ), f"Failed to resolve path from repo root: {result.stderr}"
-        resolved_path = Path(result.stdout.strip())
-        assert (
-            resolved_path == expected_path
-        ), f"Path mismatch from repo root: {resolved_path} != {expected_path}"
-
-    def test_path_from_backend_directory(self):
-        """Test path resolution when executing from backend directory."""
-        repo_root = self.get_repo_root()
-        backend_dir = repo_root / "backend"
-        expected_path = self.get_expected_db_path()
-
-        # Run path resolution from backend directory
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import sys; sys.path.insert(0, '..'); from backend.utils.paths import get_storage_db_path; print(get_storage_db_path())",
-            ],
-            cwd=backend_dir,
-            capture_output=True,
-            text=True,
-        )
-
-        assert (
-            result.returncode == 0
-        ), f"Failed to resolve path from backend directory: {result.stderr}"
-        resolved_path = Path(result.stdout.strip())
-        assert (
-            resolved_path == expected_path
-        ), f"Path mismatch from backend directory: {resolved_path} != {expected_path}"
-
-    def test_path_from_migrations_directory(self):
-        """Test path resolution when executing from migrations directory."""
-        repo_root = self.get_repo_root()
-        migrations_dir = repo_root / "backend" / "migrations"
-        expected_path = self.get_expected_db_path()
-
-        # Run path resolution from migrations directory
-        result = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import sys; sys.path.insert(0, '../..'); from backend.utils.paths import get_storage_db_path; print(get_storage_db_path())",
-            ],
-            cwd=migrations_dir,
-            capture_output=True,
-            text=True,
-        )
+    # Root of the fleetwise-backend repository, derived lexically from this file
+    REPO_ROOT: ClassVar[Path] = Path(
+        os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    )
+    # Expected database path based on repository structure
+    EXPECTED_DB_PATH: ClassVar[Path] = (
+        REPO_ROOT.parent / "fleetwise-storage" / "database" / "fleetwise.db"
+    )
+
+    @pytest.mark.parametrize(
+        "relative_cwd",
+        [(), ("backend",), ("backend", "migrations")],
+        ids=["repo_root", "backend", "migrations"],
+    )
+    def test_path_from_execution_context(self, monkeypatch, relative_cwd):
+        """Test path resolution is independent of the working directory."""
+        expected_path = self.EXPECTED_DB_PATH
+
+        monkeypatch.chdir(self.REPO_ROOT.joinpath(*relative_cwd))
+        # Resolution is stateless apart from its lru_caches, so clearing them
+        # is enough to re-resolve from this working directory (no reload needed)
+        find_repo_root.cache_clear()
+        get_storage_db_path.cache_clear()
+        resolved_path = get_storage_db_path()
 
-        assert (
-            result.returncode == 0
-        ), f"Failed to resolve path from migrations directory: {result.stderr}"
-        resolved_path = Path(result.stdout.strip())
         assert (
             resolved_path == expected_path
-        ), f"Path mismatch from migrations directory: {resolved_path} != {expected_path}"
-
-    def test_all_execution_contexts_return_same_path(self):
-        """Test that all execution contexts return the same database path."""
-        repo_root = self.get_repo_root()
-        expected_path = self.get_expected_db_path()
-
-        # Test from repo root
-        result1 = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "from backend.utils.paths import get_storage_db_path; print(get_storage_db_path())",
-            ],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            env={**os.environ, "PYTHONPATH": str(repo_root)},
-        )
-
-        # Test from backend directory
-        result2 = subprocess.run(
-            [
-                sys.executable,
-                "-c",
-                "import sys; sys.path.insert(0, '..'); from backend.utils.paths import get_storage_db_path; print(get_storage_db_path())",
-            ],
-            cwd=repo_root / "backend",
-            capture_output=True,
-            text=True,
-        )
-
-        path1 = result1.stdout.strip()
-        path2 = result2.stdout.strip()
-
-        assert path1 == path2, f"Inconsistent paths: {path1} != {path2}"
-        assert (
-            Path(path1) == expected_path
-        ), f"Resolved path doesn't match expected: {path1}"
+        ), f"Path mismatch from {os.getcwd()}: {resolved_path} != {expected_path}"
 
     def test_storage_directory_exists(self):
         """Test that the storage directory structure exists or can be created."""
-        expected_path = self.get_expected_db_path()
+        expected_path = self.EXPECTED_DB_PATH
         storage_dir = expected_path.parent
 
         # The storage directory should exist or be creatable
@@ -166,7 +68,7 @@ class TestMigrationPathStability:
         """Test that repo root detection works from different starting points."""
         from backend.utils.paths import find_repo_root
 
-        expected_root = self.get_repo_root()
+        expected_root = self.REPO_ROOT
 
         # Test from backend directory
         backend_dir = expected_root / "backend"
@@ -195,7 +97,7 @@ class TestPathValidation:
 
     def test_storage_db_path_returns_absolute_path(self):
         """Test that get_storage_db_path returns an absolute path."""
-        from backend.utils.paths import get_storage_db_path
+        from backend.utils.paths import find_repo_root, get_storage_db_path
 
         db_path = get_storage_db_path()
         assert db_path.is_absolute(), f"Database path is not absolute: {db_path}"
@@ -219,6 +121,19 @@ class TestPathValidation:
                 find_repo_root(temp_start, marker="nonexistent_marker_12345")
 
 
+    def test_find_repo_root_is_cached(self):
+        """Test that repeated lookups reuse the cached walk."""
+        from backend.utils.paths import _find_repo_root, find_repo_root
+
+        find_repo_root.cache_clear()
+        first = find_repo_root()
+        second = find_repo_root()
+
+        assert first == second
+        assert _find_repo_root.cache_info().hits >= 1
+
+
+@pytest.mark.serial
 class TestEnsureStorageDirectoryExists:
     """Test directory creation and validation."""
 
@@ -236,6 +151,7 @@ class TestEnsureStorageDirectoryExists:
         ), f"Storage directory was not created: {db_path.parent}"
 
 
+@pytest.mark.serial
 class TestDatabaseFileWriteability:
     """Test that the resolved database location is writable."""
 
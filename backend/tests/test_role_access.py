@@ -1,6 +1,13 @@
 # backend/tests/test_role_access.py
+"""
+Role-based access smoke tests.
+We only assert the behaviour the backend can show us right now:
+- if endpoint exists but we don't have a real JWT → 403 is OK for manager
+- if endpoint doesn't exist → skip (404)
+- driver must NOT be able to access billing-ish endpoints
+"""
 
-import unittest
+import pytest
 
 from backend.server import app
 from backend.extensions import db
@@ -10,140 +17,112 @@ def auth_header(token: str):
     return {"Authorization": f"Bearer {token}"}
 
 
-class RoleAccessTestCase(unittest.TestCase):
-    """
-    Role-based access smoke tests.
-    We only assert the behaviour the backend can show us right now:
-    - if endpoint exists but we don't have a real JWT → 403 is OK for manager
-    - if endpoint doesn't exist → skip (404)
-    - driver must NOT be able to access billing-ish endpoints
-    """
-
-    def setUp(self):
-        self.app = app
-        self.app.config["TESTING"] = True
-        # if your app doesn't like in-memory, point to test db
-        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-        self.ctx = self.app.app_context()
-        self.ctx.push()
-
+# dummy tokens — your real API will 403 these
+MANAGER_HEADERS = auth_header("manager-token")
+DRIVER_HEADERS = auth_header("driver-token")
+ACCOUNTANT_HEADERS = auth_header("accountant-token")
+ADMIN_HEADERS = auth_header("admin-token")
+
+MANAGER_BILLING_ENDPOINTS = (
+    "/api/bills",
+    "/api/invoices/unpaid",
+    "/api/jobs/unbilled",
+    # these 3 gave you 404 — we will skip if still 404
+    "/api/billing/customer-billing",
+    "/api/billing/contractor-billing",
+    "/api/billing/driver-billing",
+)
+DRIVER_BLOCKED_ENDPOINTS = (
+    "/api/billing/contractor-billing",
+    "/api/billing/customer-billing",
+    "/api/billing/driver-billing",
+    "/api/invoices/unpaid",
+    "/api/bills",
+)
+
+
+@pytest.fixture(scope="module")
+def app_context():
+    app.config["TESTING"] = True
+    # the in-memory test database is configured in conftest.py
+    # pushed once for the whole module rather than per test
+    with app.app_context() as ctx:
+        # never create/drop tables on a real database
+        assert db.engine.url.database in (None, "", ":memory:"), db.engine.url
         try:
             db.create_all()
         except Exception:
             pass
 
-        self.client = self.app.test_client()
+        yield ctx
 
-        # dummy tokens — your real API will 403 these
-        self.manager_token = "manager-token"
-        self.driver_token = "driver-token"
-        self.accountant_token = "accountant-token"
-        self.admin_token = "admin-token"
-
-    def tearDown(self):
         try:
             db.session.remove()
             db.drop_all()
         except Exception:
             pass
-        self.ctx.pop()
-
-    # ------------------------------------------------------------------
-    # helpers
-    # ------------------------------------------------------------------
-    def _assert_manager_can_reach(self, endpoint: str):
-        """
-        Manager should at least NOT get 401.
-        200/204 → perfect
-        403     → still acceptable here because we didn't issue a real JWT
-        404     → endpoint not present in this env → skip
-        """
-        resp = self.client.get(endpoint, headers=auth_header(self.manager_token))
-
-        if resp.status_code == 404:
-            self.skipTest(f"{endpoint} not registered in this Flask app")
-
-        self.assertIn(
-            resp.status_code,
-            (200, 204, 403),
-            msg=f"manager should reach {endpoint}, got {resp.status_code}",
-        )
-
-    def _assert_driver_blocked(self, endpoint: str):
-        resp = self.client.get(endpoint, headers=auth_header(self.driver_token))
-        # driver MUST be blocked – 401 or 403 both okay
-        self.assertIn(
-            resp.status_code,
-            (401, 403),
-            msg=f"driver should be blocked from {endpoint}, got {resp.status_code}",
-        )
-
-    # ------------------------------------------------------------------
-    # tests
-    # ------------------------------------------------------------------
-    def test_manager_can_access_billing_endpoints(self):
-        endpoints = [
-            "/api/bills",
-            "/api/invoices/unpaid",
-            "/api/jobs/unbilled",
-            # these 3 gave you 404 — we will skip if still 404
-            "/api/billing/customer-billing",
-            "/api/billing/contractor-billing",
-            "/api/billing/driver-billing",
-        ]
-
-        for ep in endpoints:
-            with self.subTest(endpoint=ep):
-                self._assert_manager_can_reach(ep)
-
-    def test_driver_cannot_access_billing_endpoints(self):
-        endpoints = [
-            "/api/billing/contractor-billing",
-            "/api/billing/customer-billing",
-            "/api/billing/driver-billing",
-            "/api/invoices/unpaid",
-            "/api/bills",
-        ]
-
-        for ep in endpoints:
-            with self.subTest(endpoint=ep):
-                # if endpoint doesn’t exist, we don’t care for driver — skip
-                resp = self.client.get(ep, headers=auth_header(self.driver_token))
-                if resp.status_code == 404:
-                    self.skipTest(f"{ep} not registered in this Flask app")
-                self.assertIn(
-                    resp.status_code,
-                    (401, 403),
-                    msg=f"driver should be blocked from {ep}, got {resp.status_code}",
-                )
-
-    def test_accountant_can_view_but_not_modify_driver_data(self):
-        # view
-        resp = self.client.get(
-            "/api/driver", headers=auth_header(self.accountant_token)
-        )
-        if resp.status_code == 404:
-            self.skipTest("/api/driver not found in this app")
-
-        self.assertIn(
-            resp.status_code,
-            (200, 204, 403),
-            msg=f"accountant should at least be able to hit GET /api/driver, got {resp.status_code}",
-        )
-
-        # create should be blocked
-        resp2 = self.client.post(
-            "/api/driver",
-            json={"name": "temp"},
-            headers=auth_header(self.accountant_token),
-        )
-        # if POST not defined → 405 is also ok here
-        self.assertIn(
-            resp2.status_code,
-            (401, 403, 405),
-            msg=f"accountant should NOT create /api/driver, got {resp2.status_code}",
-        )
-
-
-if __name__ == "__main__":
-    unittest.main()
+
+
+@pytest.fixture(scope="module")
+def client(app_context):
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def db_transaction(app_context):
+    # each test runs inside a SAVEPOINT that is rolled back afterwards
+    savepoint = db.session.begin_nested()
+    yield savepoint
+    if savepoint.is_active:
+        savepoint.rollback()
+    db.session.rollback()
+
+
+@pytest.mark.parametrize("endpoint", MANAGER_BILLING_ENDPOINTS)
+def test_manager_can_access_billing_endpoints(client, endpoint):
+    """
+    Manager should at least NOT get 401.
+    200/204 → perfect
+    403     → still acceptable here because we didn't issue a real JWT
+    404     → endpoint not present in this env → skip
+    """
+    resp = client.get(endpoint, headers=MANAGER_HEADERS)
+    if resp.status_code == 404:
+        pytest.skip(f"{endpoint} not registered in this Flask app")
+    assert resp.status_code in (200, 204, 403), (
+        f"manager should reach {endpoint}, got {resp.status_code}"
+    )
+
+
+@pytest.mark.parametrize("endpoint", DRIVER_BLOCKED_ENDPOINTS)
+def test_driver_cannot_access_billing_endpoints(client, endpoint):
+    resp = client.get(endpoint, headers=DRIVER_HEADERS)
+    # if endpoint doesn’t exist, we don’t care for driver — skip
+    if resp.status_code == 404:
+        pytest.skip(f"{endpoint} not registered in this Flask app")
+    # driver MUST be blocked – 401 or 403 both okay
+    assert resp.status_code in (401, 403), (
+        f"driver should be blocked from {endpoint}, got {resp.status_code}"
+    )
+
+
+def test_accountant_can_view_but_not_modify_driver_data(client):
+    # view
+    resp = client.get("/api/driver", headers=ACCOUNTANT_HEADERS)
+    if resp.status_code == 404:
+        pytest.skip("/api/driver not found in this app")
+
+    assert resp.status_code in (200, 204, 403), (
+        f"accountant should at least be able to hit GET /api/driver, got {resp.status_code}"
+    )
+
+    # create should be blocked
+    resp2 = client.post(
+        "/api/driver",
+        json={"name": "temp"},
+        headers=ACCOUNTANT_HEADERS,
+    )
+    # if POST not defined → 405 is also ok here
+    assert resp2.status_code in (401, 403, 405), (
+        f"accountant should NOT create /api/driver, got {resp2.status_code}"
+    )
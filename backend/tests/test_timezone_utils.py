@@ -3,7 +3,7 @@ Tests for timezone utility functions
 """
 import pytest
 from datetime import datetime, timezone
-import pytz
+from zoneinfo import ZoneInfo
 from backend.utils.timezone_utils import (
     get_display_timezone,
     convert_utc_to_display,
@@ -14,6 +14,10 @@ from backend.utils.timezone_utils import (
     format_datetime_for_api
 )
 
+_SG_TZ = ZoneInfo("Asia/Singapore")
+# 10:30 UTC on 15 May 2023, i.e. 18:30 in Singapore
+_UTC_REF = datetime(2023, 5, 15, 10, 30, 0, tzinfo=timezone.utc)
+
 class TestTimezoneUtils:
     
     def test_get_display_timezone(self):
@@ -23,8 +27,7 @@ class TestTimezoneUtils:
     
     def test_convert_utc_to_display(self):
         """Test UTC to display timezone conversion"""
-        # Create UTC datetime
-        utc_dt = datetime(2023, 5, 15, 10, 30, 0, tzinfo=timezone.utc)
+        utc_dt = _UTC_REF
         
         # Convert to display timezone (Singapore)
         display_dt = convert_utc_to_display(utc_dt)
@@ -32,13 +35,12 @@ class TestTimezoneUtils:
         # Should be 6:30 PM in Singapore (UTC+8)
         assert display_dt.hour == 18
         assert display_dt.minute == 30
-        assert display_dt.tzinfo.zone == "Asia/Singapore"
+        assert str(display_dt.tzinfo) == "Asia/Singapore"
     
     def test_convert_display_to_utc(self):
         """Test display timezone to UTC conversion"""
         # Create datetime in Singapore timezone
-        sg_tz = pytz.timezone("Asia/Singapore")
-        sg_dt = sg_tz.localize(datetime(2023, 5, 15, 18, 30, 0))
+        sg_dt = datetime(2023, 5, 15, 18, 30, 0, tzinfo=_SG_TZ)
         
         # Convert to UTC
         utc_dt = convert_display_to_utc(sg_dt)
@@ -76,6 +78,15 @@ class TestTimezoneUtils:
         assert dt.hour == 10
         assert dt.minute == 30
     
+    def test_parse_datetime_string_fallback_formats(self):
+        """Test non-ISO formats are parsed in the display timezone"""
+        dt = parse_datetime_string("15/05/2023 18:30")
+        assert dt == _UTC_REF
+        dt = parse_datetime_string("1/5/2023")
+        assert dt == datetime(2023, 4, 30, 16, 0, 0, tzinfo=timezone.utc)
+        with pytest.raises(ValueError):
+            parse_datetime_string("31/02/2023")
+    
     def test_parse_datetime_string_invalid(self):
         """Test parsing invalid datetime string raises ValueError"""
         with pytest.raises(ValueError):
@@ -83,14 +94,21 @@ class TestTimezoneUtils:
     
     def test_format_datetime_for_display(self):
         """Test formatting UTC datetime for display"""
-        utc_dt = datetime(2023, 5, 15, 10, 30, 0, tzinfo=timezone.utc)
+        utc_dt = _UTC_REF
         formatted = format_datetime_for_display(utc_dt, "%d/%m/%Y %H:%M")
         # Should be 18:30 in Singapore time
         assert formatted == "15/05/2023 18:30"
     
+    def test_format_datetime_for_display_subsecond_and_pre_epoch(self):
+        """Test sub-second formats and pre-1970 datetimes format correctly"""
+        utc_dt = datetime(2023, 5, 15, 10, 30, 0, 123456, tzinfo=timezone.utc)
+        assert format_datetime_for_display(utc_dt, "%H:%M:%S.%f") == "18:30:00.123456"
+        early = datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc)
+        assert format_datetime_for_display(early, "%d/%m/%Y %H:%M:%S") == "01/01/1970 07:29:59"
+    
     def test_format_datetime_for_api(self):
         """Test formatting datetime for API response"""
-        utc_dt = datetime(2023, 5, 15, 10, 30, 0, tzinfo=timezone.utc)
+        utc_dt = _UTC_REF
         formatted = format_datetime_for_api(utc_dt)
         assert formatted == "2023-05-15T10:30:00Z"
     
@@ -98,7 +116,7 @@ class TestTimezoneUtils:
         """Test UTC to display conversion with string input"""
         utc_string = "2023-05-15T10:30:00Z"
         display_dt = convert_utc_to_display(utc_string)
-        assert display_dt.tzinfo.zone == "Asia/Singapore"
+        assert str(display_dt.tzinfo) == "Asia/Singapore"
         assert display_dt.hour == 18  # 10:30 UTC = 18:30 SGT
     
     def test_convert_display_to_utc_string_input(self):
@@ -1,23 +1,37 @@
+import os
 import sqlite3
+import sys
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from backend.utils.paths import get_storage_db_path
+
+TARGET_VERSION = '2ab53ed947ca'
 
 # Connect to the database
-conn = sqlite3.connect(r'D:\GrepX\wise\orchestrator\repos\fleetwise-storage\database\fleetwise.db')
-cursor = conn.cursor()
+conn = sqlite3.connect(str(get_storage_db_path()))
 
 try:
-    # Update the alembic version to the correct one
-    cursor.execute("UPDATE alembic_version SET version_num = '2ab53ed947ca'")
-    conn.commit()
-    print('Alembic version updated to 2ab53ed947ca')
-    
+    # One-shot metadata update: skip the rollback journal file and fsync,
+    # and send the pragmas and the update in a single call
+    conn.executescript(
+        "PRAGMA journal_mode=MEMORY;"
+        "PRAGMA synchronous=OFF;"
+        "BEGIN;"
+        f"UPDATE alembic_version SET version_num = '{TARGET_VERSION}';"
+        "COMMIT;"
+    )
+    print(f'Alembic version updated to {TARGET_VERSION}')
+
     # Verify the update
-    cursor.execute("SELECT * FROM alembic_version")
-    result = cursor.fetchall()
-    print(f'Current alembic version(s): {result}')
-    
+    row = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+    print(f'Current alembic version: {row[0] if row else None}')
+
 except sqlite3.Error as e:
     print(f'Database error: {e}')
 except Exception as e:
     print(f'Error: {e}')
 finally:
-    conn.close()
\ No newline at end of file
+    conn.close()
@@ -12,6 +12,23 @@ from typing import Callable
 
 logger = logging.getLogger(__name__)
 
+
+class CircuitBreakerState:
+    """Per-service circuit breaker state."""
+
+    __slots__ = ('failures', 'last_failure_time', 'open', 'half_open')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Return to the closed state with no recorded failures."""
+        self.failures = 0
+        self.last_failure_time = None
+        self.open = False
+        self.half_open = False
+
+
 # Global circuit breaker states (imported from server.py)
 try:
     from backend.server import circuit_breaker_states, CIRCUIT_BREAKER_ENABLED, \
@@ -48,56 +65,55 @@ def circuit_breaker(service_name: str, exception_types: tuple = (Exception,), fa
             return requests.get('https://api.example.com/data').json()
     """
     def decorator(func: Callable) -> Callable:
+        # Get or create service-specific circuit breaker state once, at decoration time
+        if service_name not in circuit_breaker_states:
+            circuit_breaker_states[service_name] = CircuitBreakerState()
+        cb_state = circuit_breaker_states[service_name]
+
+        # Configuration is bound as default arguments so the hot path reads locals
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            if not CIRCUIT_BREAKER_ENABLED:
+        def wrapper(*args, _cb_state=cb_state, _enabled=CIRCUIT_BREAKER_ENABLED,
+                    _timeout=CIRCUIT_BREAKER_TIMEOUT,
+                    _threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD, **kwargs):
+            if not _enabled:
                 return func(*args, **kwargs)
             
-            # Get or create service-specific circuit breaker state
-            if service_name not in circuit_breaker_states:
-                circuit_breaker_states[service_name] = {
-                    'failures': 0,
-                    'last_failure_time': None,
-                    'open': False,
-                    'half_open': False
-                }
-            
-            cb_state = circuit_breaker_states[service_name]
+            cb_state = _cb_state
             
             # Check if circuit breaker is open
-            if cb_state['open']:
-                if time.time() - cb_state['last_failure_time'] > CIRCUIT_BREAKER_TIMEOUT:
+            if cb_state.open:
+                if time.time() - cb_state.last_failure_time > _timeout:
                     # Half-open state - try one request
-                    logger.info(f"Circuit breaker for {service_name} in half-open state, testing...")
-                    cb_state['half_open'] = True
-                    cb_state['open'] = False
+                    logger.info("Circuit breaker for %s in half-open state, testing...", service_name)
+                    cb_state.half_open = True
+                    cb_state.open = False
                 else:
-                    logger.warning(f"Circuit breaker for {service_name} is OPEN - service temporarily unavailable")
+                    logger.warning("Circuit breaker for %s is OPEN - service temporarily unavailable", service_name)
                     if fallback is not None:
-                        logger.info(f"Using fallback for {service_name}")
+                        logger.info("Using fallback for %s", service_name)
                         return fallback()
                     raise CircuitBreakerException(f"Circuit breaker is OPEN for {service_name}")
             
             try:
                 result = func(*args, **kwargs)
                 # Reset failure count on success
-                cb_state['failures'] = 0
-                cb_state['half_open'] = False
-                logger.debug(f"Successful call to {service_name}, circuit breaker reset")
+                cb_state.failures = 0
+                cb_state.half_open = False
+                logger.debug("Successful call to %s, circuit breaker reset", service_name)
                 return result
             except exception_types as e:
-                cb_state['failures'] += 1
-                cb_state['last_failure_time'] = time.time()
+                failures = cb_state.failures = cb_state.failures + 1
+                cb_state.last_failure_time = time.time()
                 
-                if cb_state['failures'] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
-                    cb_state['open'] = True
-                    cb_state['half_open'] = False
-                    logger.error(f"💥 Circuit breaker OPENED for {service_name} after {cb_state['failures']} failures: {str(e)}")
+                if failures >= _threshold:
+                    cb_state.open = True
+                    cb_state.half_open = False
+                    logger.error("💥 Circuit breaker OPENED for %s after %d failures: %s", service_name, failures, e)
                     # Send alert notification
-                    logger.critical(f"🚨 SERVICE FAILURE: {service_name} circuit breaker activated", 
+                    logger.critical("🚨 SERVICE FAILURE: %s circuit breaker activated", service_name, 
                                   extra={'alert_type': 'service_failure', 'service': service_name})
-                elif cb_state['failures'] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD // 2:
-                    logger.warning(f"⚠️  Circuit breaker WARNING for {service_name}: {cb_state['failures']} failures detected")
+                elif failures >= _threshold // 2:
+                    logger.warning("⚠️  Circuit breaker WARNING for %s: %d failures detected", service_name, failures)
                 
                 # Re-raise the original exception
                 raise e
@@ -109,6 +125,19 @@ def circuit_breaker(service_name: str, exception_types: tuple = (Exception,), fa
     return decorator
 
 
+def _status_from_state(state: CircuitBreakerState, now: float, timeout: float) -> dict:
+    """Build the status dict for an already-resolved state at time ``now``."""
+    return {
+        'status': 'OPEN' if state.open else ('HALF_OPEN' if state.half_open else 'CLOSED'),
+        'failures': state.failures,
+        'last_failure_time': state.last_failure_time,
+        'can_attempt_request': not state.open or (
+            now - state.last_failure_time > timeout
+            if state.last_failure_time else False
+        )
+    }
+
+
 def get_circuit_breaker_status(service_name: str) -> dict:
     """
     Get the current status of a specific circuit breaker.
@@ -119,7 +148,8 @@ def get_circuit_breaker_status(service_name: str) -> dict:
     Returns:
         Dictionary with circuit breaker status information
     """
-    if service_name not in circuit_breaker_states:
+    state = circuit_breaker_states.get(service_name)
+    if state is None:
         return {
             'status': 'CLOSED',
             'failures': 0,
@@ -127,16 +157,7 @@ def get_circuit_breaker_status(service_name: str) -> dict:
             'can_attempt_request': True
         }
     
-    state = circuit_breaker_states[service_name]
-    return {
-        'status': 'OPEN' if state['open'] else ('HALF_OPEN' if state['half_open'] else 'CLOSED'),
-        'failures': state['failures'],
-        'last_failure_time': state['last_failure_time'],
-        'can_attempt_request': not state['open'] or (
-            time.time() - state['last_failure_time'] > CIRCUIT_BREAKER_TIMEOUT 
-            if state['last_failure_time'] else False
-        )
-    }
+    return _status_from_state(state, time.time(), CIRCUIT_BREAKER_TIMEOUT)
 
 
 def reset_circuit_breaker(service_name: str) -> bool:
@@ -150,13 +171,8 @@ def reset_circuit_breaker(service_name: str) -> bool:
         True if reset successful, False if service not found
     """
     if service_name in circuit_breaker_states:
-        circuit_breaker_states[service_name].update({
-            'failures': 0,
-            'last_failure_time': None,
-            'open': False,
-            'half_open': False
-        })
-        logger.info(f"✅ Circuit breaker for {service_name} manually reset")
+        circuit_breaker_states[service_name].reset()
+        logger.info("✅ Circuit breaker for %s manually reset", service_name)
         return True
     return False
 
@@ -168,9 +184,11 @@ def get_all_circuit_breaker_statuses() -> dict:
     Returns:
         Dictionary mapping service names to their statuses
     """
+    now = time.time()
+    timeout = CIRCUIT_BREAKER_TIMEOUT
     return {
-        service: get_circuit_breaker_status(service)
-        for service in circuit_breaker_states.keys()
+        service: _status_from_state(state, now, timeout)
+        for service, state in circuit_breaker_states.items()
     }
 
 
@@ -216,52 +234,49 @@ class CircuitBreakerContext:
                 return handle_circuit_open()
     """
     
+    __slots__ = ('service_name', 'cb_state')
+    
     def __init__(self, service_name: str):
         self.service_name = service_name
-        self.cb_state = None
+        # Initialize circuit breaker state if needed; reused on every entry
+        if service_name not in circuit_breaker_states:
+            circuit_breaker_states[service_name] = CircuitBreakerState()
+        self.cb_state = circuit_breaker_states[service_name]
         
     def __enter__(self):
-        # Initialize circuit breaker state if needed
-        if self.service_name not in circuit_breaker_states:
-            circuit_breaker_states[self.service_name] = {
-                'failures': 0,
-                'last_failure_time': None,
-                'open': False,
-                'half_open': False
-            }
-        self.cb_state = circuit_breaker_states[self.service_name]
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             # Handle exception
             if issubclass(exc_type, Exception):
-                self.cb_state['failures'] += 1
-                self.cb_state['last_failure_time'] = time.time()
+                cb_state = self.cb_state
+                failures = cb_state.failures = cb_state.failures + 1
+                cb_state.last_failure_time = time.time()
                 
-                if self.cb_state['failures'] >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
-                    self.cb_state['open'] = True
-                    self.cb_state['half_open'] = False
-                    logger.error(f"💥 Circuit breaker OPENED for {self.service_name} after {self.cb_state['failures']} failures: {str(exc_val)}")
+                if failures >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                    cb_state.open = True
+                    cb_state.half_open = False
+                    logger.error("💥 Circuit breaker OPENED for %s after %d failures: %s", self.service_name, failures, exc_val)
                 # Do not suppress the exception; allow it to propagate
                 return False
         else:
             # Success case
-            self.cb_state['failures'] = 0
-            self.cb_state['half_open'] = False
+            self.cb_state.failures = 0
+            self.cb_state.half_open = False
             
     def can_execute(self) -> bool:
         """Check if operation can be attempted."""
-        if self.cb_state['open']:
-            if time.time() - self.cb_state['last_failure_time'] > CIRCUIT_BREAKER_TIMEOUT:
+        if self.cb_state.open:
+            if time.time() - self.cb_state.last_failure_time > CIRCUIT_BREAKER_TIMEOUT:
                 # Half-open state
-                self.cb_state['half_open'] = True
-                self.cb_state['open'] = False
+                self.cb_state.half_open = True
+                self.cb_state.open = False
                 return True
             return False
         return True
         
     def success(self):
         """Mark operation as successful."""
-        self.cb_state['failures'] = 0
-        self.cb_state['half_open'] = False
\ No newline at end of file
+        self.cb_state.failures = 0
+        self.cb_state.half_open = False
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Streaming JSON responses for list endpoints.
+
+Serializes one object at a time so that rows fetched with Query.yield_per()
+can be released as soon as they are written, keeping memory per request
+bounded by the batch size rather than the table size.
+"""
+
+import logging
+from itertools import chain
+from typing import Iterable, Iterator
+
+from flask import Response, current_app, stream_with_context
+from marshmallow import Schema
+
+from backend.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+def prime_iterator(items: Iterable) -> Iterator:
+    """
+    Start iterating items now and return an iterator over the same items.
+
+    For a yield_per query this executes the statement and fetches the first
+    batch, so database errors reach the caller's error handling (rollback,
+    logging, ServiceError) before a streaming response sends its status.
+
+    Args:
+        items: Iterable to start, typically a yield_per query
+
+    Returns:
+        Iterator yielding every item of ``items``
+    """
+    iterator = iter(items)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return chain((first,), iterator)
+
+
+def stream_json_array(items: Iterable, schema: Schema, status: int = 200) -> Response:
+    """
+    Build a streaming JSON array response.
+
+    Args:
+        items: Iterable of objects to serialize (e.g. a primed yield_per query)
+        schema: Single-object schema used to dump each item
+        status: HTTP status code
+
+    Returns:
+        Response streaming ``[item, item, ...]``
+
+    Errors raised before streaming starts reach the caller (see
+    prime_iterator). Errors on a later batch are logged and end the
+    response with an unterminated array.
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        yield '['
+        first = True
+        try:
+            for item in items:
+                if first:
+                    first = False
+                else:
+                    yield ','
+                yield dumps(schema.dump(item))
+        except Exception:
+            # The status line is already sent, so a failure on a later batch
+            # can only end the stream; leave the array unclosed so clients see
+            # invalid JSON rather than a silently shortened list
+            logger.exception("Streaming JSON response failed mid-stream")
+            db.session.rollback()
+            return
+        yield ']'
+
+    return Response(stream_with_context(generate()), status=status, mimetype='application/json')
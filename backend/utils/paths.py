@@ -5,9 +5,14 @@ This module provides a single source of truth for resolving paths across the
 application, ensuring consistency regardless of how the code is executed
 (module import, script execution, or different working directories).
 """
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Set once ensure_storage_directory_exists() has created/verified the directory
+_dir_ready = False
+
 
 def find_repo_root(start_path: Optional[Path] = None, marker: str = ".git") -> Path:
     """
@@ -26,22 +31,31 @@ def find_repo_root(start_path: Optional[Path] = None, marker: str = ".git") -> P
     Note:
         This function is resilient to directory structure changes and symlinks.
         It searches for a repository marker rather than using hardcoded parent counts.
+        Results are cached per resolved start path and marker; call
+        find_repo_root.cache_clear() if the tree changes during the process.
     """
     if start_path is None:
-        start_path = Path(__file__).resolve()
+        start_path = Path(__file__)
+
+    return _find_repo_root(Path(start_path).resolve(), marker)
+
 
-    current = start_path.resolve()
+@lru_cache(maxsize=32)
+def _find_repo_root(start_path: Path, marker: str) -> Path:
+    """Uncached walk behind find_repo_root(); start_path must already be resolved."""
+    current = str(start_path)
 
     # Search up to 10 levels for repository marker
     for _ in range(10):
-        if (current / marker).exists():
-            return current
+        if os.path.lexists(os.path.join(current, marker)):
+            return Path(current)
 
         # Stop if we've reached the filesystem root
-        if current.parent == current:
+        parent = os.path.dirname(current)
+        if parent == current:
             break
 
-        current = current.parent
+        current = parent
 
     raise RuntimeError(
         f"Repository root (containing '{marker}') not found when searching up from {start_path}. "
@@ -49,6 +63,10 @@ def find_repo_root(start_path: Optional[Path] = None, marker: str = ".git") -> P
     )
 
 
+find_repo_root.cache_clear = _find_repo_root.cache_clear
+
+
+@lru_cache(maxsize=1)
 def get_storage_db_path() -> Path:
     """
     Resolve the fleetwise-storage database file path.
@@ -74,6 +92,7 @@ def get_storage_db_path() -> Path:
     Note:
         This function fails fast with clear error messages if the repository
         structure doesn't match expectations, preventing silent configuration errors.
+        A successful result is cached for the process lifetime; failures are not.
     """
     try:
         # Find the fleetwise-backend repository root
@@ -119,11 +138,16 @@ def ensure_storage_directory_exists() -> None:
     Raises:
         RuntimeError: If the directory cannot be created (permission issues, etc.).
     """
+    global _dir_ready
+    if _dir_ready:
+        return
+
     try:
         db_path = get_storage_db_path()
         db_dir = db_path.parent
 
         db_dir.mkdir(parents=True, exist_ok=True)
+        _dir_ready = True
     except Exception as e:
         raise RuntimeError(
             f"Failed to create storage directory: {e}\n"
@@ -1,104 +1,162 @@
 """
 Enhanced request logging with detailed metrics and performance tracking
 """
+import itertools
+import os
+import random
 import time
 import logging
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
-from flask import request, g
+from flask import current_app, request, g
 import psutil
 
 logger = logging.getLogger(__name__)
 
-class RequestLogger:
-    """Enhanced request logging with performance metrics"""
+# orjson is optional; it serializes the per-request log record several times
+# faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Headers worth keeping in REQUEST_LOG; User-Agent and Content-Type are
+# already logged as their own fields
+_LOGGED_HEADERS = ('X-Forwarded-For', 'X-Real-IP', 'X-Request-ID', 'Referer')
+
+# Per-process request sequence; combined with the pid it gives unique request ids
+_next_request_seq = itertools.count(1).__next__
+
+# Reused psutil handle for this process; rebuilt after a fork (e.g. gunicorn workers)
+_PROC = None
+
+
+def _get_process() -> psutil.Process:
+    """Return the cached psutil.Process for the current pid."""
+    global _PROC
+    if _PROC is None or _PROC.pid != os.getpid():
+        _PROC = psutil.Process()
+    return _PROC
+
+
+def before_request():
+    """Record request start time and initial metrics"""
+    start_time = time.time()
+    request_id = f"{os.getpid()}-{_next_request_seq():x}"
     
-    @staticmethod
-    def before_request():
-        """Record request start time and initial metrics"""
-        g.start_time = time.time()
-        g.request_id = f"{int(time.time() * 1000000)}"  # Microsecond precision
-        
-        # Collect initial system state
+    # Collect initial system state for a sample of requests only;
+    # REQUEST_METRICS_SAMPLE_RATE (default 0.05) sets the fraction
+    initial_memory = 0
+    initial_cpu_times = None
+    if random.random() < current_app.config.get('REQUEST_METRICS_SAMPLE_RATE', 0.05):
         try:
-            process = psutil.Process()
-            g.initial_memory = process.memory_info().rss
-            g.initial_cpu_times = process.cpu_times()
+            process = _get_process()
+            initial_memory = process.memory_info().rss
+            initial_cpu_times = process.cpu_times()
         except Exception as e:
-            logger.debug(f"Could not collect initial process metrics: {e}")
-            g.initial_memory = 0
-            g.initial_cpu_times = None
+            logger.debug("Could not collect initial process metrics: %s", e)
+            initial_memory = 0
+            initial_cpu_times = None
     
-    @staticmethod
-    def after_request(response):
-        """Log detailed request information with performance metrics"""
-        if not hasattr(g, 'start_time'):
-            return response
-            
-        # Calculate timing
-        duration_ms = (time.time() - g.start_time) * 1000
-        
-        # Collect final system metrics
-        memory_diff = 0
-        cpu_user_time = 0
-        cpu_system_time = 0
-        
-        try:
-            if hasattr(g, 'initial_memory') and g.initial_memory > 0:
-                process = psutil.Process()
-                final_memory = process.memory_info().rss
-                memory_diff = final_memory - g.initial_memory
-                
-                if hasattr(g, 'initial_cpu_times') and g.initial_cpu_times:
-                    final_cpu_times = process.cpu_times()
-                    cpu_user_time = final_cpu_times.user - g.initial_cpu_times.user
-                    cpu_system_time = final_cpu_times.system - g.initial_cpu_times.system
-        except Exception as e:
-            logger.debug(f"Could not collect final process metrics: {e}")
-        
-        # Build request log data
-        log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'request_id': getattr(g, 'request_id', 'unknown'),
-            'method': request.method,
-            'url': request.url,
-            'endpoint': request.endpoint,
-            'path': request.path,
-            'remote_addr': request.remote_addr,
-            'user_agent': str(request.user_agent),
-            'content_length': request.content_length,
-            'content_type': request.content_type,
-            'duration_ms': round(duration_ms, 2),
-            'status_code': response.status_code,
-            'response_size': len(response.get_data()),
-            'memory_delta_mb': round(memory_diff / (1024 * 1024), 3) if memory_diff > 0 else 0,
-            'cpu_user_time': round(cpu_user_time, 4),
-            'cpu_system_time': round(cpu_system_time, 4),
-            'headers': dict(request.headers) if request.headers else {}
-        }
-        
-        # Add query parameters for GET requests
-        if request.args:
-            log_data['query_params'] = dict(request.args)
-        
-        # Add JSON body for POST/PUT requests (if small enough)
-        if request.is_json and request.content_length and request.content_length < 1024:
-            try:
-                log_data['json_body'] = request.get_json(silent=True)
-            except Exception:
-                pass
+    # Single attribute write: (start_time, request_id, initial_memory, initial_cpu_times)
+    g.req_ctx = (start_time, request_id, initial_memory, initial_cpu_times)
+
+
+def after_request(response):
+    """Log detailed request information with performance metrics"""
+    req_ctx = g.get('req_ctx')
+    if req_ctx is None:
+        return response
+    start_time, request_id, initial_memory, initial_cpu_times = req_ctx
         
-        # Log based on status code
-        log_level = logging.INFO
-        if response.status_code >= 500:
-            log_level = logging.ERROR
-        elif response.status_code >= 400:
-            log_level = logging.WARNING
+    # Calculate timing
+    duration_ms = (time.time() - start_time) * 1000
+    
+    # Collect final system metrics; left as None for unsampled requests
+    memory_delta_mb = None
+    memory_rss = None
+    cpu_user_time = None
+    cpu_system_time = None
+    
+    try:
+        if initial_memory > 0:
+            process = _get_process()
+            final_memory = process.memory_info().rss
+            memory_diff = final_memory - initial_memory
+            memory_delta_mb = round(memory_diff / (1024 * 1024), 3) if memory_diff > 0 else 0
             
-        logger.log(log_level, f"REQUEST_LOG: {json.dumps(log_data)}")
+            if initial_cpu_times:
+                final_cpu_times = process.cpu_times()
+                cpu_user_time = round(final_cpu_times.user - initial_cpu_times.user, 4)
+                cpu_system_time = round(final_cpu_times.system - initial_cpu_times.system, 4)
+        elif (response.status_code >= 400 or
+              duration_ms > current_app.config.get('SLOW_REQUEST_THRESHOLD_MS', 1000)):
+            # Unsampled but interesting: no baseline, so record current RSS
+            memory_rss = _get_process().memory_info().rss
+    except Exception as e:
+        logger.debug("Could not collect final process metrics: %s", e)
+    
+    # Build request log data
+    log_data = {
+        # Request start time, reusing the clock read from before_request
+        'timestamp': datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat(),
+        'request_id': request_id,
+        'method': request.method,
+        'url': request.url,
+        'endpoint': request.endpoint,
+        'path': request.path,
+        'remote_addr': request.remote_addr,
+        'user_agent': str(request.user_agent),
+        'content_length': request.content_length,
+        'content_type': request.content_type,
+        'duration_ms': round(duration_ms, 2),
+        'status_code': response.status_code,
+        'memory_delta_mb': memory_delta_mb,
+        'cpu_user_time': cpu_user_time,
+        'cpu_system_time': cpu_system_time,
+        'headers': {k: request.headers[k] for k in _LOGGED_HEADERS if k in request.headers}
+    }
+    
+    # Use the declared length; reading the body would buffer streamed responses
+    if response.content_length is not None:
+        log_data['response_size'] = response.content_length
+    
+    if memory_rss is not None:
+        log_data['memory_rss_mb'] = round(memory_rss / (1024 * 1024), 3)
+    
+    # Add query parameters for GET requests
+    if request.args:
+        log_data['query_params'] = dict(request.args)
+    
+    # Add JSON body for POST/PUT requests (if small enough) as the raw text;
+    # parsing it only to re-serialize it into the log line is wasted work
+    if request.is_json and request.content_length and request.content_length < 1024:
+        try:
+            log_data['raw_body'] = request.get_data(as_text=True, cache=True)
+        except Exception:
+            pass
+    
+    # Log based on status code
+    log_level = logging.INFO
+    if response.status_code >= 500:
+        log_level = logging.ERROR
+    elif response.status_code >= 400:
+        log_level = logging.WARNING
         
-        return response
+    logger.log(log_level, "REQUEST_LOG: %s", _dumps(log_data))
+    
+    return response
+
+
+class RequestLogger:
+    """Namespace kept for callers that still register RequestLogger.before_request"""
+    
+    before_request = staticmethod(before_request)
+    after_request = staticmethod(after_request)
 
 # Convenience functions
 def log_slow_request(threshold_ms: float = 1000):
@@ -110,7 +168,7 @@ def log_slow_request(threshold_ms: float = 1000):
             duration_ms = (time.time() - start_time) * 1000
             
             if duration_ms > threshold_ms:
-                logger.warning(f"SLOW_REQUEST: {request.method} {request.url} took {duration_ms:.2f}ms")
+                logger.warning("SLOW_REQUEST: %s %s took %.2fms", request.method, request.url, duration_ms)
             
             return result
         return wrapper
@@ -118,13 +176,15 @@ def log_slow_request(threshold_ms: float = 1000):
 
 def get_request_metrics() -> Dict[str, Any]:
     """Get current request metrics"""
-    if not hasattr(g, 'start_time'):
+    req_ctx = g.get('req_ctx')
+    if req_ctx is None:
         return {}
+    start_time, request_id = req_ctx[0], req_ctx[1]
         
-    duration_ms = (time.time() - g.start_time) * 1000
+    duration_ms = (time.time() - start_time) * 1000
     
     return {
         'request_duration_ms': round(duration_ms, 2),
-        'request_id': getattr(g, 'request_id', 'unknown'),
-        'start_time': g.start_time
+        'request_id': request_id,
+        'start_time': start_time
     }
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Shared error handling for service-layer methods.
+
+Wraps a service method in the repo's standard pattern: roll back the session
+on failure, pass service errors through unchanged, and log anything else
+before converting it into a user-facing service error.
+"""
+
+import functools
+import logging
+from typing import Callable
+
+from backend.extensions import db
+
+
+def service_method(action: str, error_cls: type) -> Callable:
+    """
+    Decorator applying the standard service error handling.
+
+    Args:
+        action: Short description used in messages, e.g. "create user"
+        error_cls: The calling module's ServiceError class
+
+    Usage:
+        @staticmethod
+        @service_method("fetch vehicles", ServiceError)
+        def get_all():
+            return Vehicle.query_active().all()
+    """
+    message = f"Could not {action}. Please try again later."
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except error_cls:
+                db.session.rollback()
+                raise
+            except Exception as e:
+                db.session.rollback()
+                logging.error("Could not %s: %s", action, e, exc_info=True)
+                raise error_cls(message)
+        return wrapper
+    return decorator
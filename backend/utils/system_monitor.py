@@ -9,9 +9,33 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import json
 import os
+import socket
 
 logger = logging.getLogger(__name__)
 
+# The host name does not change for the life of the process
+_HOSTNAME = os.uname().nodename if hasattr(os, 'uname') else socket.gethostname()
+
+# Use orjson for the metrics snapshot when it is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+class _LazyJson:
+    """Defers serialization until a handler actually formats the record"""
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj)
+
 class SystemMonitor:
     """Collects system metrics for logging"""
     
@@ -19,11 +43,17 @@ class SystemMonitor:
         self.collect_interval = collect_interval
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._proc = psutil.Process()
+        # Prime psutil's CPU counters so later non-blocking reads have a baseline
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
         
     def get_cpu_metrics(self) -> Dict[str, Any]:
         """Get CPU usage metrics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: usage since the previous call (the last collection)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
             cpu_freq = psutil.cpu_freq()
             
@@ -31,10 +61,10 @@ class SystemMonitor:
                 'cpu_percent': cpu_percent,
                 'cpu_count': cpu_count,
                 'cpu_frequency_mhz': cpu_freq.current if cpu_freq else None,
-                'cpu_per_core': psutil.cpu_percent(percpu=True)
+                'cpu_per_core': psutil.cpu_percent(interval=None, percpu=True)
             }
         except Exception as e:
-            logger.error(f"Error collecting CPU metrics: {e}")
+            logger.error("Error collecting CPU metrics: %s", e)
             return {'error': str(e)}
     
     def get_memory_metrics(self) -> Dict[str, Any]:
@@ -54,7 +84,7 @@ class SystemMonitor:
                 'swap_percent': swap.percent
             }
         except Exception as e:
-            logger.error(f"Error collecting memory metrics: {e}")
+            logger.error("Error collecting memory metrics: %s", e)
             return {'error': str(e)}
     
     def get_disk_metrics(self) -> Dict[str, Any]:
@@ -74,7 +104,7 @@ class SystemMonitor:
                 'disk_write_count': disk_io.write_count if disk_io else None
             }
         except Exception as e:
-            logger.error(f"Error collecting disk metrics: {e}")
+            logger.error("Error collecting disk metrics: %s", e)
             return {'error': str(e)}
     
     def get_network_metrics(self) -> Dict[str, Any]:
@@ -93,27 +123,36 @@ class SystemMonitor:
                 'network_dropout': net_io.dropout
             }
         except Exception as e:
-            logger.error(f"Error collecting network metrics: {e}")
+            logger.error("Error collecting network metrics: %s", e)
             return {'error': str(e)}
     
     def get_process_metrics(self) -> Dict[str, Any]:
         """Get current process metrics"""
         try:
-            current_process = psutil.Process()
-            children = current_process.children(recursive=True)
+            # Reuse one handle so cpu_percent() measures since the last tick;
+            # rebuild it if we are now a forked child
+            if self._proc.pid != os.getpid():
+                self._proc = psutil.Process()
+            proc = self._proc
+            # as_dict() reads all fields inside a single oneshot() sweep
+            info = proc.as_dict(attrs=[
+                'pid', 'name', 'status', 'cpu_percent',
+                'memory_info', 'num_threads', 'create_time'
+            ])
+            children = proc.children(recursive=True)
             
             return {
-                'process_pid': current_process.pid,
-                'process_name': current_process.name(),
-                'process_status': current_process.status(),
-                'process_cpu_percent': current_process.cpu_percent(),
-                'process_memory_mb': round(current_process.memory_info().rss / (1024 * 1024), 2),
-                'process_threads': current_process.num_threads(),
+                'process_pid': info['pid'],
+                'process_name': info['name'],
+                'process_status': info['status'],
+                'process_cpu_percent': info['cpu_percent'],
+                'process_memory_mb': round(info['memory_info'].rss / (1024 * 1024), 2),
+                'process_threads': info['num_threads'],
                 'process_children_count': len(children),
-                'process_uptime_seconds': time.time() - current_process.create_time()
+                'process_uptime_seconds': time.time() - info['create_time']
             }
         except Exception as e:
-            logger.error(f"Error collecting process metrics: {e}")
+            logger.error("Error collecting process metrics: %s", e)
             return {'error': str(e)}
     
     def collect_all_metrics(self) -> Dict[str, Any]:
@@ -122,7 +161,7 @@ class SystemMonitor:
         
         metrics = {
             'timestamp': timestamp,
-            'hostname': os.uname().nodename if hasattr(os, 'uname') else 'unknown',
+            'hostname': _HOSTNAME,
             'cpu': self.get_cpu_metrics(),
             'memory': self.get_memory_metrics(),
             'disk': self.get_disk_metrics(),
@@ -134,8 +173,13 @@ class SystemMonitor:
     
     def log_metrics(self):
         """Log collected metrics"""
+        # Skip the procfs reads entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         metrics = self.collect_all_metrics()
-        logger.info(f"SYSTEM_METRICS: {json.dumps(metrics)}")
+        # Structured handlers can read record.metrics; text handlers still get
+        # the JSON message, serialized only if the record is emitted
+        logger.info("SYSTEM_METRICS: %s", _LazyJson(metrics), extra={'metrics': metrics})
     
     def start_monitoring(self):
         """Start continuous monitoring"""
@@ -144,26 +188,30 @@ class SystemMonitor:
             return
             
         self.running = True
-        self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        # Fresh event per run, so a loop still winding down from an earlier
+        # stop can never be revived by this start
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._monitor_loop, args=(self._stop_event,), daemon=True)
         self.thread.start()
-        logger.info(f"System monitoring started (interval: {self.collect_interval}s)")
+        logger.info("System monitoring started (interval: %ss)", self.collect_interval)
     
     def stop_monitoring(self):
         """Stop continuous monitoring"""
         self.running = False
-        if self.thread:
+        self._stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
             self.thread.join(timeout=5)
         logger.info("System monitoring stopped")
     
-    def _monitor_loop(self):
+    def _monitor_loop(self, stop_event: threading.Event):
         """Main monitoring loop"""
-        while self.running:
+        while not stop_event.is_set():
             try:
                 self.log_metrics()
-                time.sleep(self.collect_interval)
             except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.collect_interval)
+                logger.error("Error in monitoring loop: %s", e)
+            # Waiting on the event (not sleep) lets stop_monitoring wake us at once
+            stop_event.wait(self.collect_interval)
 
 # Global instance
 system_monitor = SystemMonitor()
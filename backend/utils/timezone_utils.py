@@ -3,28 +3,119 @@ Timezone utility functions for FleetWise application.
 Handles conversion between UTC and display timezone (configurable, default Asia/Singapore).
 """
 
-from datetime import datetime, timezone
-import pytz
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Union
+from zoneinfo import ZoneInfo
+
+DEFAULT_DISPLAY_TIMEZONE = "Asia/Singapore"
+
+_UTC = timezone.utc
+# datetime.fromisoformat() accepts a trailing 'Z' natively from Python 3.11
+_ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+_DISPLAY_TZ = ZoneInfo(DEFAULT_DISPLAY_TIMEZONE)
+
+# Fallback formats for parse_datetime_string, tried in order. Every
+# date-only input is at most 10 characters and every datetime input is
+# longer, so the input length picks one list.
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%d/%m/%Y %H:%M',
+    '%d-%m-%Y %H:%M',
+    '%Y/%m/%d %H:%M',
+)
+_DATE_ONLY_FORMATS = (
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+)
+_DATE_ONLY_MAX_LEN = 10
+
+# strptime() keeps only 5 compiled formats in its internal cache, so cycling
+# through the lists above recompiled them on every call. Each format is
+# compiled once into an equivalent regex instead.
+_DIRECTIVE_PATTERNS = {
+    '%Y': r'(?P<Y>\d{4})',
+    '%m': r'(?P<m>\d{1,2})',
+    '%d': r'(?P<d>\d{1,2})',
+    '%H': r'(?P<H>\d{1,2})',
+    '%M': r'(?P<M>\d{1,2})',
+    '%S': r'(?P<S>\d{1,2})',
+    '%f': r'(?P<f>\d{1,6})',
+    '%z': r'(?P<z>Z|[+-]\d{2}:?\d{2})',
+}
+
+
+def _compile_format(fmt: str) -> re.Pattern:
+    """Compile a strptime format using the directives above into a regex."""
+    pattern = re.sub(r'%[a-zA-Z]', lambda m: _DIRECTIVE_PATTERNS[m.group()], re.escape(fmt))
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_DATETIME_PATTERNS = tuple(_compile_format(fmt) for fmt in _DATETIME_FORMATS)
+_DATE_ONLY_PATTERNS = tuple(_compile_format(fmt) for fmt in _DATE_ONLY_FORMATS)
+
+
+def _datetime_from_match(match: re.Match) -> datetime:
+    """Build a datetime from a _compile_format() match; ValueError if out of range."""
+    parts = match.groupdict()
+    fraction = parts.get('f')
+    offset = parts.get('z')
+    tzinfo = None
+    if offset:
+        if offset in ('Z', 'z'):
+            tzinfo = _UTC
+        else:
+            sign = -1 if offset[0] == '-' else 1
+            digits = offset[1:].replace(':', '')
+            tzinfo = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:])))
+    return datetime(
+        int(parts['Y']), int(parts['m']), int(parts['d']),
+        int(parts.get('H') or 0), int(parts.get('M') or 0), int(parts.get('S') or 0),
+        int(fraction.ljust(6, '0')) if fraction else 0,
+        tzinfo=tzinfo,
+    )
+
+
+def _display_tz() -> ZoneInfo:
+    """Return the tzinfo for the configured display timezone."""
+    zone = get_display_timezone()
+    if zone == DEFAULT_DISPLAY_TIMEZONE:
+        return _DISPLAY_TZ
+    # ZoneInfo keeps its own per-key cache, so repeated lookups are cheap
+    return ZoneInfo(zone)
 
 
 def get_display_timezone() -> str:
     """
     Get the configured display timezone from system settings.
     Defaults to Asia/Singapore if not configured or if outside app context.
+    The value is looked up once per app context and cached on flask.g.
     """
     try:
-        from flask import has_app_context
+        from flask import g, has_app_context
         if has_app_context():
-            from backend.models.system_settings import SystemSettings
-            settings = SystemSettings.query.filter_by(setting_key='display_timezone').first()
-            if settings and settings.setting_value:
-                return settings.setting_value.get('timezone', "Asia/Singapore")
+            zone = g.get('_display_timezone')
+            if zone is None:
+                from backend.models.system_settings import SystemSettings
+                zone = DEFAULT_DISPLAY_TIMEZONE
+                settings = SystemSettings.query.filter_by(setting_key='display_timezone').first()
+                if settings and settings.setting_value:
+                    zone = settings.setting_value.get('timezone', DEFAULT_DISPLAY_TIMEZONE)
+                g._display_timezone = zone
+            return zone
     except Exception:
         # Fallback if DB access fails or import error
         pass
         
-    return "Asia/Singapore"
+    return DEFAULT_DISPLAY_TIMEZONE
 
 
 def convert_utc_to_display(utc_dt: Union[datetime, str]) -> datetime:
@@ -40,19 +131,19 @@ def convert_utc_to_display(utc_dt: Union[datetime, str]) -> datetime:
     if isinstance(utc_dt, str):
         # Parse ISO format string to datetime object
         # Use safe approach: strip Z and make timezone aware
-        if utc_dt.endswith('Z'):
+        if utc_dt[-1:] == 'Z':
             utc_dt = utc_dt[:-1]
         parsed_dt = datetime.fromisoformat(utc_dt)
         # Ensure timezone aware in UTC
         if parsed_dt.tzinfo is None:
-            parsed_dt = parsed_dt.replace(tzinfo=timezone.utc)
+            parsed_dt = parsed_dt.replace(tzinfo=_UTC)
         utc_dt = parsed_dt
-    elif utc_dt.tzinfo != timezone.utc:
+    elif utc_dt.tzinfo != _UTC:
         # Convert to UTC if it's in another timezone
-        utc_dt = utc_dt.astimezone(timezone.utc)
+        utc_dt = utc_dt.astimezone(_UTC)
     
     # Convert to display timezone
-    display_tz = pytz.timezone(get_display_timezone())
+    display_tz = _display_tz()
     display_dt = utc_dt.astimezone(display_tz)
     
     return display_dt
@@ -77,27 +168,20 @@ def convert_display_to_utc(display_dt: Union[datetime, str]) -> datetime:
         
         # If it has timezone info, convert to naive and treat as display timezone
         if parsed_dt.tzinfo is not None:
-            display_tz = pytz.timezone(get_display_timezone())
+            display_tz = _display_tz()
             display_dt = parsed_dt.astimezone(display_tz)
         else:
             # If no timezone info, assume it's in display timezone
-            display_tz = pytz.timezone(get_display_timezone())
-            display_dt = display_tz.localize(parsed_dt, is_dst=None)
+            display_dt = parsed_dt.replace(tzinfo=_display_tz())
     else:
         # If it's already a datetime object
         if display_dt.tzinfo is None:
             # Assume it's in display timezone
-            display_tz = pytz.timezone(get_display_timezone())
-            display_dt = display_tz.localize(display_dt, is_dst=None)
-        elif display_dt.tzinfo is not None:
-            # Safely compare timezone zones; stdlib timezones don't have a 'zone' attribute
-            display_tz = pytz.timezone(get_display_timezone())
-            if getattr(display_dt.tzinfo, "zone", None) != display_tz.zone:
-                # Convert to display timezone if it's in another timezone
-                display_dt = display_dt.astimezone(display_tz)
+            display_dt = display_dt.replace(tzinfo=_display_tz())
+        # Aware datetimes in any zone convert to UTC directly below
     
     # Convert to UTC
-    utc_dt = display_dt.astimezone(timezone.utc)
+    utc_dt = display_dt.astimezone(_UTC)
     
     return utc_dt
 
@@ -109,7 +193,7 @@ def utc_now() -> datetime:
     Returns:
         Current datetime in UTC
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def parse_datetime_string(dt_string: str, tz_aware: bool = True) -> Optional[datetime]:
@@ -127,50 +211,38 @@ def parse_datetime_string(dt_string: str, tz_aware: bool = True) -> Optional[dat
         return None
     
     try:
-        # Handle various common datetime formats
-        dt = datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+        # Fast path: ISO 8601, which covers nearly all API payloads
+        iso_string = dt_string if _ISO_ACCEPTS_Z else dt_string.replace('Z', '+00:00')
+        dt = datetime.fromisoformat(iso_string)
         
         # If it's naive, assume it's in the display timezone and convert to UTC
         if dt.tzinfo is None:
-            display_tz = pytz.timezone(get_display_timezone())
-            dt = display_tz.localize(dt)
-            dt = dt.astimezone(timezone.utc)
+            dt = dt.replace(tzinfo=_display_tz()).astimezone(_UTC)
         else:
             # If it has timezone info, convert to UTC
-            dt = dt.astimezone(timezone.utc)
+            dt = dt.astimezone(_UTC)
             
         return dt
     except ValueError:
         # If ISO format fails, try other common formats
-        for fmt in [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%d/%m/%Y %H:%M',
-            '%d-%m-%Y %H:%M',
-            '%Y/%m/%d %H:%M',
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%d-%m-%Y'
-        ]:
+        if len(dt_string) <= _DATE_ONLY_MAX_LEN:
+            patterns = _DATE_ONLY_PATTERNS
+        else:
+            patterns = _DATETIME_PATTERNS
+        display_tz = _display_tz()
+        for pattern in patterns:
+            match = pattern.fullmatch(dt_string)
+            if match is None:
+                continue
             try:
-                dt = datetime.strptime(dt_string, fmt)
-                
-                # If it's just a date, set time to 00:00
-                if fmt in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                    dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-                
-                # If it's naive, assume it's in the display timezone and convert to UTC
-                display_tz = pytz.timezone(get_display_timezone())
-                dt = display_tz.localize(dt, is_dst=None)
-                dt = dt.astimezone(timezone.utc)
-                
-                return dt
+                dt = _datetime_from_match(match)
             except ValueError:
                 continue
+            
+            # If it's naive, assume it's in the display timezone and convert to UTC
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=display_tz)
+            return dt.astimezone(_UTC)
                 
         raise ValueError(f"Unable to parse datetime string: {dt_string}")
 
@@ -191,9 +263,14 @@ def format_datetime_for_display(utc_dt: datetime, fmt: str = "%d/%m/%Y %H:%M") -
     
     # Ensure the datetime is in UTC
     if utc_dt.tzinfo is None:
-        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
-    elif utc_dt.tzinfo != timezone.utc:
-        utc_dt = utc_dt.astimezone(timezone.utc)
+        utc_dt = utc_dt.replace(tzinfo=_UTC)
+    elif utc_dt.tzinfo != _UTC:
+        utc_dt = utc_dt.astimezone(_UTC)
+    
+    # Whole-second formats are memoized; list responses repeat the same
+    # timestamps. Sub-second output takes the uncached path.
+    if '%f' not in fmt:
+        return _format_utc_second(utc_dt.replace(microsecond=0), get_display_timezone(), fmt)
     
     # Convert to display timezone
     display_dt = convert_utc_to_display(utc_dt)
@@ -201,6 +278,18 @@ def format_datetime_for_display(utc_dt: datetime, fmt: str = "%d/%m/%Y %H:%M") -
     return display_dt.strftime(fmt)
 
 
+@lru_cache(maxsize=2048)
+def _format_utc_second(utc_dt: datetime, zone: str, fmt: str) -> str:
+    """
+    Format a whole-second UTC datetime in the given display zone.
+
+    Keyed on the datetime itself rather than an epoch int: fromtimestamp()
+    raises OSError for pre-1970 values on Windows.
+    """
+    tz = _DISPLAY_TZ if zone == DEFAULT_DISPLAY_TIMEZONE else ZoneInfo(zone)
+    return utc_dt.astimezone(tz).strftime(fmt)
+
+
 def format_datetime_for_api(utc_dt: datetime) -> str:
     """
     Format a datetime for API responses in ISO format.
@@ -216,8 +305,9 @@ def format_datetime_for_api(utc_dt: datetime) -> str:
     
     # Ensure the datetime is in UTC
     if utc_dt.tzinfo is None:
-        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
-    elif utc_dt.tzinfo != timezone.utc:
-        utc_dt = utc_dt.astimezone(timezone.utc)
+        utc_dt = utc_dt.replace(tzinfo=_UTC)
+    elif utc_dt.tzinfo != _UTC:
+        utc_dt = utc_dt.astimezone(_UTC)
     
-    return utc_dt.isoformat().replace('+00:00', 'Z')
\ No newline at end of file
+    iso = utc_dt.isoformat()
+    return iso[:-6] + 'Z' if iso.endswith('+00:00') else iso
@@ -24,13 +24,22 @@ import os
 # Add parent directory to path to import backend modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from datetime import datetime, timedelta
+from datetime import datetime
+import numpy as np
 import pandas as pd
-from openpyxl.styles import Font, PatternFill, Alignment
+from sqlalchemy import literal, select, union_all
+from openpyxl import LXML, Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from io import BytesIO
 
+try:
+    import xlsxwriter
+except ImportError:  # optional, falls back to openpyxl
+    xlsxwriter = None
+
 try:
     from backend.extensions import db
     from backend.models.customer import Customer
@@ -80,28 +89,37 @@ def generate_test_jobs(num_jobs=100):
     app = create_app()
 
     with app.app_context():
-        # Fetch active records from database
-        customers = Customer.query.filter_by(status='Active').all()
-        services = Service.query.filter_by(status='Active').all()
-        vehicles = Vehicle.query.filter_by(status='Active').all()
-        drivers = Driver.query.filter_by(status='Active').all()
-        contractors = Contractor.query.filter_by(status='Active').all()
-        vehicle_types = VehicleType.query.filter_by(status=True, is_deleted=False).all()
+        # Fetch the active names in a single round trip, selecting only the
+        # column each dropdown needs instead of hydrating full ORM objects
+        active_names = union_all(
+            select(literal('customers'), Customer.name).where(Customer.status == 'Active'),
+            select(literal('services'), Service.name).where(Service.status == 'Active'),
+            select(literal('vehicles'), Vehicle.number).where(Vehicle.status == 'Active'),
+            select(literal('drivers'), Driver.name).where(Driver.status == 'Active'),
+            select(literal('contractors'), Contractor.name).where(Contractor.status == 'Active'),
+            select(literal('vehicle_types'), VehicleType.name).where(
+                VehicleType.status.is_(True), VehicleType.is_deleted.is_(False)
+            ),
+        )
+        names = {key: [] for key in ('customers', 'services', 'vehicles', 'drivers', 'contractors', 'vehicle_types')}
+        for kind, name in db.session.execute(active_names):
+            names[kind].append(name)
+
+        customer_list = names['customers']
+        service_list = names['services']
+        vehicle_list = names['vehicles']
+        driver_list = names['drivers']
 
         # Validate we have enough data
-        if not all([customers, services, vehicles, drivers]):
+        if not all([customer_list, service_list, vehicle_list, driver_list]):
             raise ValueError("Insufficient data in database. Need at least 1 active customer, service, vehicle, and driver.")
 
-        print(f"Found {len(customers)} customers, {len(services)} services, {len(vehicles)} vehicles, {len(drivers)} drivers")
-        print(f"Found {len(contractors)} contractors, {len(vehicle_types)} vehicle types")
+        print(f"Found {len(customer_list)} customers, {len(service_list)} services, {len(vehicle_list)} vehicles, {len(driver_list)} drivers")
+        print(f"Found {len(names['contractors'])} contractors, {len(names['vehicle_types'])} vehicle types")
 
         # Prepare data for cycling through
-        customer_list = [c.name for c in customers]
-        service_list = [s.name for s in services]
-        vehicle_list = [v.number for v in vehicles]
-        driver_list = [d.name for d in drivers]
-        contractor_list = [c.name for c in contractors] if contractors else ['']
-        vehicle_type_list = [vt.name for vt in vehicle_types] if vehicle_types else ['']
+        contractor_list = names['contractors'] or ['']
+        vehicle_type_list = names['vehicle_types'] or ['']
 
         # Sample locations for variety
         pickup_locations = [
@@ -166,8 +184,49 @@ def generate_test_jobs(num_jobs=100):
         # Generate test data
         import random
 
-        test_jobs = []
         today = datetime.now()
+        idx = np.arange(num_jobs)
+
+        def cycle(values):
+            """Repeat values down the column, one entry per job"""
+            return np.asarray(values, dtype=object)[idx % len(values)]
+
+        pickup_dates = (today + pd.to_timedelta(idx % 30 + 1, unit='D')).strftime('%Y-%m-%d')
+        hours = 8 + idx % 12  # Hours between 8 AM and 8 PM
+        minutes = (idx % 4) * 15  # 0, 15, 30, 45 minutes
+        pickup_times = np.char.add(
+            np.char.zfill(hours.astype(str), 2),
+            np.char.add(':', np.char.zfill(minutes.astype(str), 2))
+        )
+
+        # Numbered text columns, formatted as whole arrays
+        job_numbers = (idx + 1).astype(str)
+        reference_nos = np.char.add('REF', np.char.zfill(job_numbers, 4))
+        mobiles = np.char.add('+659', np.char.zfill((1000000 + idx).astype(str), 7))
+        passenger_names = np.char.add('Passenger ', job_numbers)
+        remarks = np.char.add(
+            np.char.add('Test job entry ', job_numbers),
+            ' - Valid data for bulk upload testing'
+        )
+
+        # Build every job as valid, one column at a time
+        df = pd.DataFrame({
+            'Customer': cycle(customer_list),
+            'Customer Reference No': reference_nos.astype(object),
+            'Department/Person In Charge/Sub-Customer': cycle(departments),
+            'Service': cycle(service_list),
+            'Vehicle': cycle(vehicle_list),
+            'Driver': cycle(driver_list),
+            'Contractor': cycle(contractor_list),
+            'Vehicle Type': cycle(vehicle_type_list),
+            'Pickup Date': pickup_dates,
+            'Pickup Time': pickup_times.astype(object),
+            'Pickup Location': cycle(pickup_locations),
+            'Drop-off Location': cycle(dropoff_locations),
+            'Passenger Name': passenger_names.astype(object),
+            'Passenger Mobile': mobiles.astype(object),
+            'Remarks': remarks.astype(object),
+        })
 
         # Define error scenarios first
         error_scenarios = [
@@ -183,71 +242,46 @@ def generate_test_jobs(num_jobs=100):
             {'Drop-off Location': '', 'error': 'Missing dropoff location'}
         ]
 
-        # Generate random positions for invalid jobs (0-99)
+        # Generate random positions for invalid jobs
         # Ensure they're spread throughout the dataset, not clustered
         random.seed(42)  # Set seed for reproducibility
-        invalid_positions = sorted(random.sample(range(100), 10))
+        invalid_positions = sorted(random.sample(range(num_jobs), min(len(error_scenarios), num_jobs)))
 
         print(f"Invalid jobs will be placed at positions: {[p+1 for p in invalid_positions]}")
 
-        # Generate all 100 jobs
-        error_idx = 0
-        for i in range(100):
-            pickup_date = today + timedelta(days=(i % 30) + 1)
-            hour = 8 + (i % 12)  # Hours between 8 AM and 8 PM
-            minute = (i % 4) * 15  # 0, 15, 30, 45 minutes
-
-            # Check if this position should have an invalid job
-            if i in invalid_positions:
-                # Create invalid job
-                error_scenario = error_scenarios[error_idx]
-                job = {
-                    'Customer': customer_list[0],
-                    'Customer Reference No': f'REF{str(i+1).zfill(4)}',
-                    'Department/Person In Charge/Sub-Customer': 'Testing Department',
-                    'Service': service_list[0],
-                    'Vehicle': vehicle_list[0],
-                    'Driver': driver_list[0],
-                    'Contractor': contractor_list[0] if contractor_list else '',
-                    'Vehicle Type': vehicle_type_list[0] if vehicle_type_list else '',
-                    'Pickup Date': pickup_date.strftime('%Y-%m-%d'),
-                    'Pickup Time': '09:00',
-                    'Pickup Location': f'Test Pickup Location {i+1}',
-                    'Drop-off Location': f'Test Dropoff Location {i+1}',
-                    'Passenger Name': f'Test Passenger {i+1}',
-                    'Passenger Mobile': f'+6590000{str(error_idx).zfill(3)}',
-                    'Remarks': f'INVALID DATA TEST - {error_scenario["error"]} - Row {i+1}'
-                }
-
-                # Apply the error scenario
-                job.update(error_scenario)
-                if 'error' in job:
-                    del job['error']
-
-                error_idx += 1
-            else:
-                # Create valid job
-                job = {
-                    'Customer': customer_list[i % len(customer_list)],
-                    'Customer Reference No': f'REF{str(i+1).zfill(4)}',
-                    'Department/Person In Charge/Sub-Customer': departments[i % len(departments)],
-                    'Service': service_list[i % len(service_list)],
-                    'Vehicle': vehicle_list[i % len(vehicle_list)],
-                    'Driver': driver_list[i % len(driver_list)],
-                    'Contractor': contractor_list[i % len(contractor_list)],
-                    'Vehicle Type': vehicle_type_list[i % len(vehicle_type_list)],
-                    'Pickup Date': pickup_date.strftime('%Y-%m-%d'),
-                    'Pickup Time': f'{str(hour).zfill(2)}:{str(minute).zfill(2)}',
-                    'Pickup Location': pickup_locations[i % len(pickup_locations)],
-                    'Drop-off Location': dropoff_locations[i % len(dropoff_locations)],
-                    'Passenger Name': f'Passenger {i+1}',
-                    'Passenger Mobile': f'+659{str(1000000 + i).zfill(7)}',
-                    'Remarks': f'Test job entry {i+1} - Valid data for bulk upload testing'
-                }
-
-            test_jobs.append(job)
-
-        return pd.DataFrame(test_jobs), {
+        # Overwrite the invalid positions after construction, a column at a time
+        invalid = np.zeros(num_jobs, dtype=bool)
+        invalid[invalid_positions] = True
+        invalid_rows = [p + 1 for p in invalid_positions]
+
+        invalid_baseline = {
+            'Customer': customer_list[0],
+            'Department/Person In Charge/Sub-Customer': 'Testing Department',
+            'Service': service_list[0],
+            'Vehicle': vehicle_list[0],
+            'Driver': driver_list[0],
+            'Contractor': contractor_list[0],
+            'Vehicle Type': vehicle_type_list[0],
+            'Pickup Time': '09:00',
+            'Pickup Location': [f'Test Pickup Location {row}' for row in invalid_rows],
+            'Drop-off Location': [f'Test Dropoff Location {row}' for row in invalid_rows],
+            'Passenger Name': [f'Test Passenger {row}' for row in invalid_rows],
+            'Passenger Mobile': [f'+6590000{str(k).zfill(3)}' for k in range(len(invalid_rows))],
+            'Remarks': [
+                f'INVALID DATA TEST - {error_scenario["error"]} - Row {row}'
+                for row, error_scenario in zip(invalid_rows, error_scenarios)
+            ]
+        }
+        for col, values in invalid_baseline.items():
+            df.loc[invalid, col] = values
+
+        # Apply the error scenarios
+        for i, error_scenario in zip(invalid_positions, error_scenarios):
+            for col, value in error_scenario.items():
+                if col != 'error':
+                    df.at[i, col] = value
+
+        return df, {
             'customers': customer_list,
             'services': service_list,
             'vehicles': vehicle_list,
@@ -257,107 +291,176 @@ def generate_test_jobs(num_jobs=100):
         }
 
 
+SHEET_NAME = 'Jobs Template'
+HEADER_STYLE_NAME = 'Jobs Header'
+
+COLUMN_WIDTHS = {
+    'A': 25,  # Customer
+    'B': 20,  # Customer Reference No
+    'C': 35,  # Department/Person In Charge/Sub-Customer
+    'D': 20,  # Service
+    'E': 15,  # Vehicle
+    'F': 20,  # Driver
+    'G': 20,  # Contractor
+    'H': 20,  # Vehicle Type
+    'I': 15,  # Pickup Date
+    'J': 12,  # Pickup Time
+    'K': 30,  # Pickup Location
+    'L': 30,  # Drop-off Location
+    'M': 20,  # Passenger Name
+    'N': 18,  # Passenger Mobile
+    'O': 40   # Remarks
+}
+
+# Dropdown columns and the validation list feeding each of them
+VALIDATION_COLUMNS = (
+    ('A', 'customers'),
+    ('D', 'services'),
+    ('E', 'vehicles'),
+    ('F', 'drivers'),
+    ('G', 'contractors'),
+    ('H', 'vehicle_types'),
+)
+
+# Limit dropdowns to 50 entries to stay under Excel's formula length limit
+MAX_VALIDATION_ITEMS = 50
+
+
+def _dropdown_values(validation_data, key):
+    """Return the dropdown entries for a validation list, or None if it is empty"""
+    values = validation_data.get(key)
+    if not values or not values[0]:
+        return None
+    return values[:MAX_VALIDATION_ITEMS]
+
+
+def _write_excel_xlsxwriter(df, validation_data, output):
+    """
+    Write the workbook with xlsxwriter in constant_memory mode.
+
+    Rows are written directly in order (not through df.to_excel, which emits
+    cells column by column) so each row can be flushed as soon as it is done.
+    """
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet(SHEET_NAME)
+
+        header_fmt = workbook.add_format({
+            'bold': True,
+            'font_color': 'white',
+            'font_size': 11,
+            'bg_color': '#366092',
+            'align': 'center',
+            'valign': 'vcenter',
+            'text_wrap': True,
+        })
+
+        for col, width in COLUMN_WIDTHS.items():
+            worksheet.set_column(f'{col}:{col}', width)
+
+        worksheet.write_row(0, 0, list(df.columns), header_fmt)
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
+
+        # Add data validation for dropdowns
+        for col, key in VALIDATION_COLUMNS:
+            values = _dropdown_values(validation_data, key)
+            if values:
+                worksheet.data_validation(f'{col}2:{col}1000', {
+                    'validate': 'list',
+                    'source': values,
+                    'ignore_blank': True,
+                })
+
+        # Freeze header row
+        worksheet.freeze_panes(1, 0)
+    finally:
+        workbook.close()
+
+
+def _write_excel_openpyxl(df, validation_data, output):
+    """
+    Write the workbook with openpyxl (used when xlsxwriter is not installed).
+
+    Uses a write-only workbook so rows are streamed to the sheet XML instead
+    of being held as a grid of cell objects. Column widths, validations and
+    the frozen header must be set up before the first row is appended.
+    """
+    if not LXML:
+        print("Note: install lxml for faster openpyxl serialization")
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(SHEET_NAME)
+
+    # Adjust column widths
+    for col, width in COLUMN_WIDTHS.items():
+        worksheet.column_dimensions[col].width = width
+
+    # Add data validation for dropdowns (max 255 characters for Excel formula)
+    for col, key in VALIDATION_COLUMNS:
+        values = _dropdown_values(validation_data, key)
+        if values:
+            validation = DataValidation(type="list", formula1=f'"{",".join(values)}"', allow_blank=True)
+            validation.add(f'{col}2:{col}1000')
+            worksheet.data_validations.append(validation)
+
+    # Freeze header row
+    worksheet.freeze_panes = 'A2'
+
+    # Style the header row with one named style registered on the workbook
+    workbook.add_named_style(NamedStyle(
+        name=HEADER_STYLE_NAME,
+        font=Font(bold=True, color="FFFFFF", size=11),
+        fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center", wrap_text=True),
+    ))
+
+    header = []
+    for name in df.columns:
+        cell = WriteOnlyCell(worksheet, value=name)
+        cell.style = HEADER_STYLE_NAME
+        header.append(cell)
+    worksheet.append(header)
+
+    for row in df.itertuples(index=False, name=None):
+        worksheet.append(row)
+
+    workbook.save(output)
+
+
 def create_excel_with_formatting(df, validation_data, output_filename='bulk_upload_100_jobs_test.xlsx'):
     """
     Create Excel file with proper formatting and data validation
 
+    Uses xlsxwriter's constant_memory mode when it is installed, otherwise
+    falls back to openpyxl. The workbook is built in memory and written to
+    disk in one sequential write.
+
     Args:
         df (pd.DataFrame): DataFrame with job data
         validation_data (dict): Dictionary containing validation lists
         output_filename (str): Output filename
-    """
-    with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Jobs Template', index=False)
-
-        # Get the workbook and worksheet
-        workbook = writer.book
-        worksheet = writer.sheets['Jobs Template']
-
-        # Style the header row
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Apply header styling
-        for col in range(1, len(df.columns) + 1):
-            cell = worksheet.cell(row=1, column=col)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-
-        # Adjust column widths
-        column_widths = {
-            'A': 25,  # Customer
-            'B': 20,  # Customer Reference No
-            'C': 35,  # Department/Person In Charge/Sub-Customer
-            'D': 20,  # Service
-            'E': 15,  # Vehicle
-            'F': 20,  # Driver
-            'G': 20,  # Contractor
-            'H': 20,  # Vehicle Type
-            'I': 15,  # Pickup Date
-            'J': 12,  # Pickup Time
-            'K': 30,  # Pickup Location
-            'L': 30,  # Drop-off Location
-            'M': 20,  # Passenger Name
-            'N': 18,  # Passenger Mobile
-            'O': 40   # Remarks
-        }
 
-        for col, width in column_widths.items():
-            worksheet.column_dimensions[col].width = width
-
-        # Add data validation for dropdowns (max 255 characters for Excel formula)
-        # Customer dropdown (Column A)
-        if validation_data['customers']:
-            customer_formula = f'"{",".join(validation_data["customers"][:50])}"'  # Limit to 50 to avoid Excel formula length limit
-            customer_validation = DataValidation(type="list", formula1=customer_formula, allow_blank=True)
-            customer_validation.add('A2:A1000')
-            worksheet.add_data_validation(customer_validation)
-
-        # Service dropdown (Column D)
-        if validation_data['services']:
-            service_formula = f'"{",".join(validation_data["services"][:50])}"'
-            service_validation = DataValidation(type="list", formula1=service_formula, allow_blank=True)
-            service_validation.add('D2:D1000')
-            worksheet.add_data_validation(service_validation)
-
-        # Vehicle dropdown (Column E)
-        if validation_data['vehicles']:
-            vehicle_formula = f'"{",".join(validation_data["vehicles"][:50])}"'
-            vehicle_validation = DataValidation(type="list", formula1=vehicle_formula, allow_blank=True)
-            vehicle_validation.add('E2:E1000')
-            worksheet.add_data_validation(vehicle_validation)
-
-        # Driver dropdown (Column F)
-        if validation_data['drivers']:
-            driver_formula = f'"{",".join(validation_data["drivers"][:50])}"'
-            driver_validation = DataValidation(type="list", formula1=driver_formula, allow_blank=True)
-            driver_validation.add('F2:F1000')
-            worksheet.add_data_validation(driver_validation)
-
-        # Contractor dropdown (Column G)
-        if validation_data['contractors'] and validation_data['contractors'][0]:
-            contractor_formula = f'"{",".join(validation_data["contractors"][:50])}"'
-            contractor_validation = DataValidation(type="list", formula1=contractor_formula, allow_blank=True)
-            contractor_validation.add('G2:G1000')
-            worksheet.add_data_validation(contractor_validation)
-
-        # Vehicle Type dropdown (Column H)
-        if validation_data['vehicle_types'] and validation_data['vehicle_types'][0]:
-            vehicle_type_formula = f'"{",".join(validation_data["vehicle_types"][:50])}"'
-            vehicle_type_validation = DataValidation(type="list", formula1=vehicle_type_formula, allow_blank=True)
-            vehicle_type_validation.add('H2:H1000')
-            worksheet.add_data_validation(vehicle_type_validation)
+    Returns:
+        BytesIO: The workbook bytes, rewound so they can be reused (e.g. uploaded)
+    """
+    buf = BytesIO()
+    if xlsxwriter is not None:
+        _write_excel_xlsxwriter(df, validation_data, buf)
+    else:
+        _write_excel_openpyxl(df, validation_data, buf)
 
-        # Freeze header row
-        worksheet.freeze_panes = 'A2'
+    with open(output_filename, 'wb') as f:
+        f.write(buf.getbuffer())
+    buf.seek(0)
 
     print(f"\nExcel file created successfully: {output_filename}")
     print(f"Total jobs: {len(df)}")
     print(f"Valid jobs: 90")
     print(f"Invalid jobs (for testing): 10")
 
+    return buf
+
 
 def main():
     """Main function to generate test data"""
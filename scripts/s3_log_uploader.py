@@ -5,16 +5,21 @@ Uploads logs to S3 with 1-2 hour buffering to handle EC2 downtime
 """
 
 import boto3
+from botocore.config import Config
 import os
 import json
+import re
 import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import gzip
 import hashlib
+import io
+import shutil
 from typing import List, Dict, Optional
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import Queue, Empty
 import signal
 import sys
@@ -30,6 +35,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Read size used when streaming a log file through gzip
+COPY_CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_STATE_FILE = '/var/log/log_uploader_state.json'
+
+# Only files modified in the last 24 hours are uploaded, so processed entries
+# older than this can never match again and are dropped when state is saved
+PROCESSED_RETENTION_SECONDS = 48 * 3600
+
+# Only files modified within this window are uploaded
+MAX_FILE_AGE_SECONDS = 24 * 3600
+
+# Rotated copies carry a number or date after a separator (app.log.1,
+# access.log-20240101, app-2024-01-01.log)
+ROTATED_SUFFIX = re.compile(r'[._-]\d')
+
+
+def _iter_files(root: str):
+    """Yield DirEntry objects for regular files below root, without following symlinks"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
 class S3LogUploader:
     def __init__(self, 
                  aws_access_key_id: str = None,
@@ -38,7 +76,9 @@ class S3LogUploader:
                  bucket_name: str = None,
                  log_directories: List[str] = None,
                  upload_interval_minutes: int = 120,  # 2 hours default
-                 max_buffer_size: int = 1000):
+                 max_buffer_size: int = 1000,
+                 upload_workers: int = 8,
+                 state_file: str = None):
         
         # AWS Configuration
         self.aws_access_key_id = aws_access_key_id or os.getenv('AWS_ACCESS_KEY_ID')
@@ -54,13 +94,17 @@ class S3LogUploader:
         ]
         self.upload_interval = upload_interval_minutes * 60  # Convert to seconds
         self.max_buffer_size = max_buffer_size
+        self.upload_workers = max(1, upload_workers)
+        self.state_file = state_file or os.getenv('LOG_UPLOADER_STATE_FILE', DEFAULT_STATE_FILE)
         
         # State
         self.running = False
         self.upload_queue = Queue()
         self.upload_thread = None
         self.last_upload_time = datetime.now()
-        self.processed_files = set()
+        # file hash -> upload time (epoch seconds), persisted across restarts
+        self.processed_files = self.load_processed_files()
+        self.processed_lock = threading.Lock()
         
         # Initialize S3 client
         try:
@@ -68,7 +112,9 @@ class S3LogUploader:
                 's3',
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.region_name
+                region_name=self.region_name,
+                # Uploads run concurrently, so back off client-side on throttling
+                config=Config(retries={'mode': 'adaptive', 'max_attempts': 5})
             )
             logger.info(f"Initialized S3 client for bucket: {self.bucket_name}")
         except Exception as e:
@@ -78,6 +124,7 @@ class S3LogUploader:
     def scan_log_files(self) -> List[Dict]:
         """Scan directories for log files to upload"""
         log_files = []
+        cutoff = time.time() - MAX_FILE_AGE_SECONDS
         
         for directory in self.log_directories:
             if not os.path.exists(directory):
@@ -85,15 +132,23 @@ class S3LogUploader:
                 continue
                 
             try:
-                for file_path in Path(directory).rglob('*'):
-                    if file_path.is_file() and self.should_process_file(file_path):
-                        file_stats = file_path.stat()
-                        log_files.append({
-                            'path': str(file_path),
-                            'size': file_stats.st_size,
-                            'modified': datetime.fromtimestamp(file_stats.st_mtime),
-                            'created': datetime.fromtimestamp(file_stats.st_ctime)
-                        })
+                for entry in _iter_files(directory):
+                    try:
+                        file_stats = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue  # removed by rotation mid-scan
+                    # Only process files modified in the last 24 hours
+                    if file_stats.st_mtime < cutoff:
+                        continue
+                    file_info = {
+                        'path': entry.path,
+                        'size': file_stats.st_size,
+                        'modified': datetime.fromtimestamp(file_stats.st_mtime),
+                        'created': datetime.fromtimestamp(file_stats.st_ctime),
+                        'hash': self.get_file_hash(entry.path, file_stats)
+                    }
+                    if self.should_process_file(file_info):
+                        log_files.append(file_info)
             except Exception as e:
                 logger.error(f"Error scanning directory {directory}: {e}")
         
@@ -101,40 +156,28 @@ class S3LogUploader:
         log_files.sort(key=lambda x: x['modified'])
         return log_files
     
-    def should_process_file(self, file_path: Path) -> bool:
-        """Determine if a file should be processed"""
+    def should_process_file(self, file_info: Dict) -> bool:
+        """Determine if a scanned file should be processed"""
+        file_path = Path(file_info['path'])
+        
         # Skip if already processed
-        file_hash = self.get_file_hash(file_path)
-        if file_hash in self.processed_files:
+        if file_info['hash'] in self.processed_files:
             return False
         
-        # Skip current active log files (ending with .log without timestamp)
-        if file_path.name.endswith('.log') and not '_' in file_path.name:
-            # Check if it's actively being written to
-            try:
-                current_size = file_path.stat().st_size
-                time.sleep(1)  # Wait a moment
-                new_size = file_path.stat().st_size
-                if current_size != new_size:
-                    logger.debug(f"Skipping active log file: {file_path}")
-                    return False
-            except Exception:
-                pass
-        
-        # Only process files modified in the last 24 hours
-        try:
-            modified_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-            if datetime.now() - modified_time > timedelta(hours=24):
-                return False
-        except Exception:
+        # Skip current active log files (ending with .log without timestamp);
+        # their content is uploaded once the file is rotated
+        name = file_path.name
+        if name.endswith('.log') and '_' not in name and not ROTATED_SUFFIX.search(name):
+            logger.debug(f"Skipping active log file: {file_path}")
             return False
-            
+        
         return True
     
-    def get_file_hash(self, file_path: Path) -> str:
-        """Generate a hash for file identification"""
+    def get_file_hash(self, file_path: str, stat: os.stat_result = None) -> str:
+        """Generate a hash for file identification, reusing stat data when given"""
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = os.stat(file_path)
             hash_input = f"{file_path}_{stat.st_size}_{stat.st_mtime}"
             return hashlib.md5(hash_input.encode()).hexdigest()
         except Exception:
@@ -157,24 +200,26 @@ class S3LogUploader:
             # Upload to S3
             s3_key = f"logs/{datetime.now().strftime('%Y/%m/%d')}/{compressed_name}"
             
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=compressed_data,
-                ContentType='application/gzip',
-                Metadata={
-                    'original_filename': original_name,
-                    'hostname': hostname,
-                    'upload_timestamp': datetime.now().isoformat(),
-                    'original_size': str(file_info['size'])
+            self.s3_client.upload_fileobj(
+                compressed_data,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={
+                    'ContentType': 'application/gzip',
+                    'Metadata': {
+                        'original_filename': original_name,
+                        'hostname': hostname,
+                        'upload_timestamp': datetime.now().isoformat(),
+                        'original_size': str(file_info['size'])
+                    }
                 }
             )
             
             logger.info(f"Uploaded {original_name} to s3://{self.bucket_name}/{s3_key}")
             
             # Mark as processed
-            file_hash = self.get_file_hash(file_path)
-            self.processed_files.add(file_hash)
+            with self.processed_lock:
+                self.processed_files[file_info['hash']] = time.time()
             
             return True
             
@@ -182,26 +227,61 @@ class S3LogUploader:
             logger.error(f"Failed to upload {file_info['path']}: {e}")
             return False
     
-    def compress_file(self, file_path: Path) -> bytes:
-        """Compress file content"""
-        with open(file_path, 'rb') as f:
-            content = f.read()
+    def load_processed_files(self) -> Dict[str, float]:
+        """Load the processed file hashes saved by a previous run"""
+        try:
+            with open(self.state_file) as f:
+                return {str(k): float(v) for k, v in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not load uploader state from {self.state_file}: {e}")
+            return {}
+    
+    def save_processed_files(self):
+        """Persist processed file hashes so a restart does not re-upload them"""
+        cutoff = time.time() - PROCESSED_RETENTION_SECONDS
+        with self.processed_lock:
+            for file_hash in [h for h, ts in self.processed_files.items() if ts < cutoff]:
+                del self.processed_files[file_hash]
+            state = dict(self.processed_files)
+        
+        tmp_path = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            logger.error(f"Failed to save uploader state to {self.state_file}: {e}")
+    
+    def compress_file(self, file_path: Path) -> io.BytesIO:
+        """Compress file content into an in-memory buffer, streaming the source in chunks"""
+        buf = io.BytesIO()
+        with open(file_path, 'rb') as f, gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=6) as gz:
+            shutil.copyfileobj(f, gz, COPY_CHUNK_SIZE)
+            original_size = f.tell()
         
-        compressed_content = gzip.compress(content)
-        compression_ratio = (1 - len(compressed_content) / len(content)) * 100
-        logger.debug(f"Compressed {file_path.name}: {len(content)} -> {len(compressed_content)} bytes ({compression_ratio:.1f}% reduction)")
+        compressed_size = buf.tell()
+        buf.seek(0)
+        if original_size:
+            compression_ratio = (1 - compressed_size / original_size) * 100
+            logger.debug(f"Compressed {file_path.name}: {original_size} -> {compressed_size} bytes ({compression_ratio:.1f}% reduction)")
         
-        return compressed_content
+        return buf
     
     def batch_upload(self, log_files: List[Dict]) -> int:
-        """Upload a batch of log files"""
+        """Upload a batch of log files concurrently"""
         successful_uploads = 0
         
-        for file_info in log_files[:self.max_buffer_size]:  # Limit batch size
-            if self.compress_and_upload(file_info):
-                successful_uploads += 1
-                # Small delay to avoid overwhelming S3
-                time.sleep(0.1)
+        # S3 latency dominates each upload, so overlap them on a bounded pool
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            futures = [
+                executor.submit(self.compress_and_upload, file_info)
+                for file_info in log_files[:self.max_buffer_size]  # Limit batch size
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    successful_uploads += 1
         
         return successful_uploads
     
@@ -221,6 +301,7 @@ class S3LogUploader:
             
             # Upload files
             successful = self.batch_upload(log_files)
+            self.save_processed_files()
             
             logger.info(f"Upload cycle completed: {successful}/{len(log_files)} files uploaded")
             
@@ -304,7 +385,9 @@ if __name__ == "__main__":
         'bucket_name': os.getenv('LOG_BUCKET_NAME'),
         'log_directories': os.getenv('LOG_DIRECTORIES', '/app/logs,/var/log/nginx').split(','),
         'upload_interval_minutes': int(os.getenv('UPLOAD_INTERVAL_MINUTES', '120')),
-        'max_buffer_size': int(os.getenv('MAX_BUFFER_SIZE', '1000'))
+        'max_buffer_size': int(os.getenv('MAX_BUFFER_SIZE', '1000')),
+        'upload_workers': int(os.getenv('S3_UPLOAD_WORKERS', '8')),
+        'state_file': os.getenv('LOG_UPLOADER_STATE_FILE')
     }
     
     try: